@@ -30,6 +30,8 @@ if __name__ == '__main__':
     from waitress import serve
     from core.ui_components import create_app
     from loaders.s3_loader import S3Loader
+    from loaders.frame_cache import FrameCacheLoader
+    from loaders.single_flight import SingleFlightLoader
 
     PORT = 8052  # 포트를 8052로 변경
 
@@ -40,7 +42,8 @@ if __name__ == '__main__':
     time.sleep(3)  # 충분한 대기 시간 확보
 
     print(f"[초기화] S3 로더 생성...")
-    loader = S3Loader()
+    # 같은 데이터를 동시에 요청하면 로드를 한 번만 실행, 정규화 결과는 디스크 캐시에서 메모리 맵으로 재사용
+    loader = SingleFlightLoader(FrameCacheLoader(S3Loader()))
 
     print(f"[초기화] 앱 생성...")
     app = create_app(loader, app_name="S3 Sensor Dashboard", port=PORT)
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks package - 성능 측정 스크립트 모음 (python -m benchmarks.<모듈명>)"""
@@ -0,0 +1,101 @@
+"""
+BSON 디코딩 벤치마크
+
+DocumentDB 원본 조회 결과를 `pd.DataFrame(list(cursor))`로 만드는 경로와
+`find_raw_batches` 배치를 컬럼 버퍼로 디코딩하는 `ColumnBuffers` 경로의 실행 시간과 최대 메모리를 비교합니다.
+서버 없이 BSON 배치를 미리 만들어 두고 디코딩만 측정합니다.
+
+실행:
+    python -m benchmarks.bench_bson_decode --docs 1000000
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from bson import decode_all, encode
+
+from core.data_processor import BLE_RAW_COLUMNS
+from loaders.bson_columns import ColumnBuffers
+
+
+FIELDS = {column: {"time": "int64", "sensor_id": "string"}.get(column, "float64") for column in BLE_RAW_COLUMNS}
+
+
+def make_batches(docs: int, batch_size: int = 10000, seed: int = 0) -> list:
+    """
+    BLE 문서 형태의 BSON 배치 목록을 생성합니다.
+
+    Args:
+        docs (int): 문서 수
+        batch_size (int): 배치당 문서 수
+        seed (int): 난수 시드
+
+    Returns:
+        list: find_raw_batches와 같은 형태의 bytes 목록
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(docs, len(FIELDS) - 2))
+    batches = []
+    for start in range(0, docs, batch_size):
+        chunk = []
+        for i in range(start, min(start + batch_size, docs)):
+            doc = {"time": 1_700_000_000_000 + i * 20, "sensor_id": "S0001"}
+            doc.update(zip(list(FIELDS)[2:], values[i].tolist()))
+            chunk.append(encode(doc))
+        batches.append(b"".join(chunk))
+    return batches
+
+
+def legacy_decode(batches: list) -> pd.DataFrame:
+    """기존 경로: 모든 문서를 dict로 모은 뒤 DataFrame 생성"""
+    docs = []
+    for batch in batches:
+        docs.extend(decode_all(batch))
+    return pd.DataFrame(docs)
+
+
+def columnar_decode(batches: list) -> pd.DataFrame:
+    """컬럼 버퍼 경로: 배치마다 디코딩해 타입이 정해진 배열에 채움"""
+    buffers = ColumnBuffers(FIELDS)
+    for batch in batches:
+        buffers.append_batch(batch)
+    return buffers.to_frame()
+
+
+def measure(func, *args) -> tuple:
+    """실행 시간(초)과 tracemalloc 기준 최대 할당 바이트를 반환합니다."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BSON 디코딩 벤치마크")
+    parser.add_argument("--docs", type=int, default=1_000_000, help="문서 수 (기본값: 1,000,000)")
+    args = parser.parse_args()
+
+    batches = make_batches(args.docs)
+
+    # 결과 검증: 두 경로의 값이 같아야 한다
+    check = batches[:3]
+    expected = legacy_decode(check)[list(FIELDS)]
+    actual = columnar_decode(check)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    legacy_sec, legacy_peak = measure(legacy_decode, batches)
+    columnar_sec, columnar_peak = measure(columnar_decode, batches)
+
+    print(f"docs            : {args.docs:,}")
+    print(f"dict 리스트 경로   : {legacy_sec:.3f} s, 최대 {legacy_peak / 1024 ** 2:.1f} MB")
+    print(f"컬럼 버퍼 경로     : {columnar_sec:.3f} s, 최대 {columnar_peak / 1024 ** 2:.1f} MB")
+    print(f"최대 메모리 감소   : {legacy_peak / columnar_peak:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+cleaning_data 벤치마크
+
+기존 반복 drop/재계산 구현(`legacy_cleaning_data`)과 단일 패스 구현(`cleaning_data`)의 실행 시간을 비교합니다.
+두 구현이 같은 결과를 내는지는 tests/test_cleaning.py의 속성 테스트가 확인합니다.
+
+실행:
+    python -m benchmarks.bench_cleaning --rows 2000000 --glitches 5000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.data_processor import cleaning_data
+
+NINE_HOURS_NS = 32400000000000
+STEPS_NS = np.array([0, 1_000_000_000, 2_000_000_000, NINE_HOURS_NS, NINE_HOURS_NS + 1_000_000_000], dtype=np.int64)
+
+
+def legacy_cleaning_data(data: pd.DataFrame) -> pd.DataFrame:
+    """단일 패스로 바꾸기 전의 cleaning_data 구현 (비교 기준)"""
+    def jump_positions(frame):
+        diff = np.diff(frame["DATE"].values.astype("datetime64[ns]")).astype(np.int64)
+        return list(np.where((diff == 32400000000000) | (diff == 32401000000000))[0])
+
+    over_9_idx_list = jump_positions(data)
+    while len(over_9_idx_list) != 0:
+        data = data.drop(over_9_idx_list)
+        data.reset_index(inplace=True, drop=True)
+        over_9_idx_list = jump_positions(data)
+
+    data.reset_index(inplace=True, drop=True)
+    return data
+
+
+def make_frame(rows: int, glitches: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    1초 간격 데이터에 9시간 점프를 무작위로 섞은 DataFrame을 만듭니다.
+
+    Args:
+        rows (int): 행 수
+        glitches (int): 9시간 근처 점프 수
+        rng (np.random.Generator): 난수 생성기
+
+    Returns:
+        pd.DataFrame: DATE, VALUE 컬럼
+    """
+    steps = np.full(rows, 1_000_000_000, dtype=np.int64)
+    positions = rng.integers(0, rows, size=glitches)
+    steps[positions] = rng.choice(STEPS_NS, size=glitches)
+    # 앞으로/뒤로 점프가 섞이도록 일부는 음수
+    steps[positions[rng.random(glitches) < 0.5]] *= -1
+    dates = pd.to_datetime(1_700_000_000_000_000_000 + np.cumsum(steps)).tz_localize("UTC").tz_convert("Asia/Seoul")
+    return pd.DataFrame({"DATE": dates, "VALUE": np.arange(rows)})
+
+
+def measure(func, frame: pd.DataFrame) -> tuple:
+    """실행 시간(초)과 결과를 반환합니다."""
+    start = time.perf_counter()
+    result = func(frame.copy())
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cleaning_data 벤치마크")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="행 수 (기본값: 2,000,000)")
+    parser.add_argument("--glitches", type=int, default=5_000, help="9시간 점프 수 (기본값: 5,000)")
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows, args.glitches, np.random.default_rng(1))
+    legacy_sec, expected = measure(legacy_cleaning_data, frame)
+    single_sec, result = measure(cleaning_data, frame)
+
+    # 결과 검증: 두 구현의 출력이 같아야 한다
+    pd.testing.assert_frame_equal(result, expected)
+
+    print(f"rows          : {args.rows:,} (점프 {args.glitches:,}개)")
+    print(f"반복 drop 경로  : {legacy_sec:.3f} s")
+    print(f"단일 패스 경로  : {single_sec:.3f} s")
+    print(f"속도 향상       : {legacy_sec / single_sec:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+DocumentDB 병렬 조회 벤치마크
+
+로컬 mongod(또는 DocumentDB 호환 서버)에 하루치 BLE 문서를 채우고,
+커서 하나로 읽는 경로와 time 구간별 커서를 동시에 읽는 `find_time_sliced` 경로의 실행 시간을 비교합니다.
+
+실행:
+    docker run -d -p 27017:27017 mongo:5
+    python -m benchmarks.bench_docdb_parallel --docs 1000000 --parallelism 1 2 4 8
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from pymongo import MongoClient
+
+from core.data_processor import BLE_RAW_COLUMNS
+from loaders.docdb_indexes import ensure_index
+from loaders.docdb_parallel import find_time_sliced
+
+
+FIELDS = {column: {"time": "int64", "sensor_id": "string"}.get(column, "float64") for column in BLE_RAW_COLUMNS}
+PHONE = "01000000000"
+SENSOR = "S0001"
+
+
+def seed_collection(collection, docs: int, hz: int = 50, seed: int = 0):
+    """
+    하루치 BLE 문서를 collection에 채웁니다 (이미 같은 수만큼 있으면 건너뜀).
+
+    Args:
+        collection: pymongo Collection
+        docs (int): 문서 수
+        hz (int): 샘플링 주파수
+        seed (int): 난수 시드
+    """
+    query = {"phone_num": PHONE, "sensor_id": SENSOR}
+    if collection.count_documents(query) == docs:
+        return
+    collection.delete_many({})
+
+    rng = np.random.default_rng(seed)
+    names = list(FIELDS)[2:]
+    start = 1_700_000_000_000
+    for offset in range(0, docs, 50_000):
+        n = min(50_000, docs - offset)
+        values = rng.normal(size=(n, len(names)))
+        collection.insert_many([
+            {"time": start + (offset + i) * (1000 // hz), "phone_num": PHONE, "sensor_id": SENSOR,
+             **dict(zip(names, values[i].tolist()))}
+            for i in range(n)
+        ], ordered=False)
+    ensure_index(collection)
+
+
+def measure(collection, parallelism: int, repeat: int) -> tuple:
+    """가장 빠른 실행 시간(초)과 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = find_time_sliced(collection, {"phone_num": PHONE, "sensor_id": SENSOR}, FIELDS,
+                                  parallelism=parallelism)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DocumentDB 병렬 조회 벤치마크")
+    parser.add_argument("--uri", default="mongodb://localhost:27017", help="MongoDB 연결 문자열")
+    parser.add_argument("--docs", type=int, default=1_000_000, help="문서 수 (기본값: 1,000,000)")
+    parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 2, 4, 8], help="비교할 구간 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri, maxPoolSize=max(args.parallelism) + 2)
+    collection = client["sensor_dash_bench"]["20231115"]
+    seed_collection(collection, args.docs)
+
+    print(f"docs            : {args.docs:,}")
+    baseline_sec, baseline = None, None
+    for parallelism in args.parallelism:
+        elapsed, result = measure(collection, parallelism, args.repeat)
+        if baseline is None:
+            baseline_sec, baseline = elapsed, result
+        else:
+            # 결과 검증: 구간을 나눠 읽어도 같은 행이 같은 순서로 나와야 한다
+            pd.testing.assert_frame_equal(result, baseline)
+        print(f"구간 {parallelism:>2}개        : {elapsed:.3f} s ({baseline_sec / elapsed:.2f}x)")
+
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
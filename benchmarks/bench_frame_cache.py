@@ -0,0 +1,86 @@
+"""
+정규화 데이터 캐시 벤치마크
+
+로컬 Parquet 파일을 읽어 정규화(process_raw_data)하는 경로와, 정규화 결과를 `FrameCache`에
+Arrow IPC 파일로 저장해 둔 뒤 메모리 맵으로 다시 여는 경로의 실행 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_frame_cache --rows 4320000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.data_processor import BLE_RAW_COLUMNS, process_raw_data
+from loaders.frame_cache import FrameCache
+from loaders.s3_parquet import read_parquet_projected
+
+
+def make_raw_table(rows: int, hz: int = 50, seed: int = 0) -> pa.Table:
+    """
+    하루치 BLE 원본 테이블을 생성합니다.
+
+    Args:
+        rows (int): 행 수
+        hz (int): 샘플링 주파수
+        seed (int): 난수 시드
+
+    Returns:
+        pa.Table: BLE_RAW_COLUMNS 스키마의 테이블
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        "time": 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * (1000 // hz),
+        "sensor_id": np.full(rows, "S0001"),
+    }
+    for column in BLE_RAW_COLUMNS[2:]:
+        data[column] = rng.normal(size=rows)
+    return pa.table({column: data[column] for column in BLE_RAW_COLUMNS})
+
+
+def best_of(func, repeat: int) -> tuple:
+    """가장 빠른 실행 시간(초)과 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정규화 데이터 캐시 벤치마크")
+    parser.add_argument("--rows", type=int, default=4_320_000, help="행 수 (기본값: 50Hz 하루치)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "raw.parquet")
+        pq.write_table(make_raw_table(args.rows), path)
+        cache = FrameCache(os.path.join(tmp, "frames"))
+        key = ("ble", "20231115", "01000000000", "S0001")
+
+        def load_raw():
+            return process_raw_data(read_parquet_projected(path, BLE_RAW_COLUMNS))
+
+        raw_sec, expected = best_of(load_raw, args.repeat)
+        cache.put(key, expected)
+        cached_sec, result = best_of(lambda: cache.get(key), args.repeat)
+
+        # 결과 검증: 캐시에서 다시 연 데이터가 정규화 결과와 같아야 한다
+        pd.testing.assert_frame_equal(result, expected)
+
+        print(f"rows            : {args.rows:,}")
+        print(f"Parquet+정규화  : {raw_sec:.3f} s")
+        print(f"메모리 맵 캐시  : {cached_sec:.4f} s ({raw_sec / cached_sec:.0f}x), "
+              f"파일 {cache.total_bytes() / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Parquet 저장 구조 벤치마크
+
+time 순서가 섞인 채 기본 설정으로 쓴 하루치 BLE 파일과, 같은 데이터를 `tools.parquet_layout` 구조로 다시 쓴 파일의
+파일 크기, 읽는 row group 수, 로드 시간(read_parquet_projected + process_raw_data)을 전체/1시간 구간 조회로 비교합니다.
+
+실행:
+    python -m benchmarks.bench_parquet_layout --rows 4320000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from core.data_processor import BLE_RAW_COLUMNS, process_raw_data
+from loaders.s3_parquet import read_parquet_projected, select_row_groups
+from tools.parquet_layout import write_compacted
+
+
+def make_raw_table(rows: int, hz: int = 50, seed: int = 0) -> pa.Table:
+    """
+    업로드 순서대로 구간이 섞인 하루치 BLE 원본 테이블을 생성합니다.
+
+    Args:
+        rows (int): 행 수
+        hz (int): 샘플링 주파수
+        seed (int): 난수 시드
+
+    Returns:
+        pa.Table: BLE_RAW_COLUMNS 스키마의 테이블
+    """
+    rng = np.random.default_rng(seed)
+    start = 1_700_000_000_000
+    times = start + np.arange(rows, dtype=np.int64) * (1000 // hz)
+    # 단말이 몰아서 올린 묶음 단위로 순서가 섞인다
+    chunks = np.array_split(np.arange(rows), max(rows // 3000, 1))
+    order = np.concatenate([chunks[i] for i in rng.permutation(len(chunks))])
+
+    data = {"time": times[order], "sensor_id": np.full(rows, "S0001")}
+    for column in BLE_RAW_COLUMNS[2:]:
+        data[column] = rng.normal(size=rows)
+    return pa.table({column: data[column] for column in BLE_RAW_COLUMNS})
+
+
+def measure(path: str, time_range, repeat: int) -> tuple:
+    """가장 빠른 로드 시간(초)과 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = process_raw_data(read_parquet_projected(path, BLE_RAW_COLUMNS, time_range))
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parquet 저장 구조 벤치마크")
+    parser.add_argument("--rows", type=int, default=4_320_000, help="행 수 (기본값: 50Hz 하루치)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    table = make_raw_table(args.rows)
+    # 데이터 한가운데 1시간 구간
+    middle_ms = (pc.min(table["time"]).as_py() + pc.max(table["time"]).as_py()) // 2
+    window = (middle_ms - 1_800_000, middle_ms + 1_800_000 - 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        default_path = os.path.join(tmp, "default.parquet")
+        compact_path = os.path.join(tmp, "compact.parquet")
+        pq.write_table(table, default_path)
+        write_compacted(table, compact_path)
+
+        print(f"rows            : {args.rows:,}")
+        for label, path in (("기본 설정", default_path), ("압축 정리", compact_path)):
+            metadata = pq.ParquetFile(path).metadata
+            print(f"{label}       : {os.path.getsize(path) / 1e6:.1f} MB, row group {metadata.num_row_groups}개 "
+                  f"(1시간 구간에서 {len(select_row_groups(metadata, 'time', window))}개 읽음)")
+
+        for name, time_range in (("전체", None), ("1시간", window)):
+            default_sec, expected = measure(default_path, time_range, args.repeat)
+            compact_sec, result = measure(compact_path, time_range, args.repeat)
+
+            # 결과 검증: 저장 구조만 바뀌고 처리 결과는 같아야 한다
+            pd.testing.assert_frame_equal(result, expected)
+            print(f"{name:<6} 기본 설정 : {default_sec:.3f} s")
+            print(f"{name:<6} 압축 정리 : {compact_sec:.3f} s ({default_sec / compact_sec:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
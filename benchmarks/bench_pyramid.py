@@ -0,0 +1,91 @@
+"""
+시계열 피라미드 벤치마크
+
+보이는 구간(1시간 ~ 7일)이 길어질 때, 초당 평균 전체를 min/max 다운샘플링하는 기존 경로와
+픽셀 폭을 채우는 가장 거친 피라미드 레벨만 꺼내 다운샘플링하는 `StatsPyramid` 경로의 trace 생성 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_pyramid --days 7
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from core.aggregation import PerSecondStats
+from core.downsample import downsample
+from core.pyramid import StatsPyramid
+
+
+def make_stats(seconds: int, seed: int = 0) -> PerSecondStats:
+    """
+    `seconds`초 길이의 초당 집계 결과를 생성합니다.
+
+    Args:
+        seconds (int): 초 수
+        seed (int): 난수 시드
+
+    Returns:
+        PerSecondStats: ACCEL_X 채널 하나를 가진 초당 집계 결과
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.to_datetime(1_700_000_000 + np.arange(seconds), unit="s").as_unit("ns")
+    dates = dates.tz_localize("UTC").tz_convert("Asia/Seoul")
+    mean = np.cumsum(rng.normal(size=seconds))
+    return PerSecondStats(
+        dates=dates,
+        count=np.full(seconds, 50),
+        mean={"ACCEL_X": mean},
+        min={"ACCEL_X": mean - 1},
+        max={"ACCEL_X": mean + 1},
+        hist_values=np.array([50]),
+        hist_counts=np.array([seconds]),
+    )
+
+
+def best_of(func, repeat: int) -> tuple:
+    """가장 빠른 실행 시간(초)과 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시계열 피라미드 벤치마크")
+    parser.add_argument("--days", type=int, default=7, help="데이터 길이 (일, 기본값: 7)")
+    parser.add_argument("--points", type=int, default=2000, help="그래프 최대 점 수 (기본값: 2000)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    args = parser.parse_args()
+
+    stats = make_stats(args.days * 86400)
+    build_sec, pyramid = best_of(lambda: StatsPyramid(stats), 1)
+    print(f"초당 행 수      : {len(stats.dates):,} (피라미드 생성 {build_sec:.3f} s)")
+
+    start = stats.dates[0]
+    for span in ("1h", "6h", "1D", f"{args.days}D"):
+        end = start + pd.Timedelta(span) - pd.Timedelta("1s")
+
+        def legacy():
+            i0, i1 = stats.dates.searchsorted(start), stats.dates.searchsorted(end, side="right")
+            return downsample(stats.dates[i0:i1], stats.mean["ACCEL_X"][i0:i1], args.points)
+
+        def from_pyramid():
+            seconds = pyramid.select_level(start, end, args.points // 2)
+            return seconds, downsample(*pyramid.series("ACCEL_X", seconds, start, end), args.points)
+
+        legacy_sec, (_, legacy_y) = best_of(legacy, args.repeat)
+        pyramid_sec, (seconds, (x, y)) = best_of(from_pyramid, args.repeat)
+
+        # 결과 검증: 점 수가 예산 안이고, 거친 레벨에서도 구간의 최대/최소 피크가 남아 있어야 한다
+        assert len(y) <= args.points
+        assert np.isclose(np.max(y), np.max(legacy_y)) and np.isclose(np.min(y), np.min(legacy_y))
+        print(f"{span:>4} 구간 기존   : {legacy_sec * 1000:.2f} ms")
+        print(f"{span:>4} 구간 피라미드: {pyramid_sec * 1000:.2f} ms (레벨 {seconds}s, {len(y)}점)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+초당 집계 파일 벤치마크
+
+그래프 개요를 원본 Parquet에서 그리는 경로(read_parquet_projected + process_raw_data(deduplicate=False) +
+raw_summary + summary_stats)와, `tools.build_summaries`가 만든 초당 집계 파일에서 그리는 경로
+(집계 파일 읽기 + summary_stats)의 실행 시간과 읽는 행 수를 비교합니다. 두 경로의 결과는 같아야 합니다.
+
+실행:
+    python -m benchmarks.bench_summary_sidecar --rows 4320000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core.callbacks import raw_summary, summary_stats
+from core.data_processor import BLE_RAW_COLUMNS, process_raw_data, normalize_timestamp, local_tz
+from loaders.s3_parquet import read_parquet_projected
+from tools.build_summaries import build_summary
+
+
+def make_raw_table(rows: int, hz: int = 50, seed: int = 0) -> pa.Table:
+    """
+    하루치 BLE 원본 테이블을 생성합니다.
+
+    Args:
+        rows (int): 행 수
+        hz (int): 샘플링 주파수
+        seed (int): 난수 시드
+
+    Returns:
+        pa.Table: BLE_RAW_COLUMNS 스키마의 테이블
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        "time": 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * (1000 // hz),
+        "sensor_id": np.full(rows, "S0001"),
+    }
+    for column in BLE_RAW_COLUMNS[2:]:
+        data[column] = rng.normal(size=rows)
+    return pa.table({column: data[column] for column in BLE_RAW_COLUMNS})
+
+
+def best_of(func, repeat: int) -> tuple:
+    """가장 빠른 실행 시간(초)과 결과를 반환합니다."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="초당 집계 파일 벤치마크")
+    parser.add_argument("--rows", type=int, default=4_320_000, help="행 수 (기본값: 50Hz 하루치)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    table = make_raw_table(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, "raw.parquet")
+        summary_path = os.path.join(tmp, "raw.summary.parquet")
+        pq.write_table(table, raw_path)
+        pq.write_table(build_summary(table, is_lte=False), summary_path)
+
+        def from_raw():
+            raw = process_raw_data(read_parquet_projected(raw_path, BLE_RAW_COLUMNS), deduplicate=False)
+            return summary_stats(raw_summary(raw, is_lte=False))
+
+        def from_summary():
+            summary = pq.read_table(summary_path).to_pandas()
+            summary.insert(0, "DATE", normalize_timestamp(summary.pop("time"), local_tz))
+            return summary_stats(summary)
+
+        raw_sec, raw_stats = best_of(from_raw, args.repeat)
+        summary_sec, sidecar_stats = best_of(from_summary, args.repeat)
+
+        # 결과 검증: 두 경로가 같은 초당 집계 결과를 내야 한다
+        assert raw_stats.dates.equals(sidecar_stats.dates)
+        np.testing.assert_array_equal(raw_stats.count, sidecar_stats.count)
+        for name in ("mean", "min", "max"):
+            for channel, values in getattr(raw_stats, name).items():
+                np.testing.assert_allclose(values, getattr(sidecar_stats, name)[channel], equal_nan=True)
+
+        print(f"rows            : {args.rows:,} -> 집계 {len(sidecar_stats.dates):,}행 "
+              f"({os.path.getsize(summary_path) / 1e6:.1f} MB)")
+        print(f"원본 경로       : {raw_sec:.3f} s")
+        print(f"집계 파일 경로  : {summary_sec:.3f} s ({raw_sec / summary_sec:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+타임스탬프 정규화 벤치마크
+
+행 단위 `.apply(datetime.fromtimestamp(...).strftime(...))` + `pd.to_datetime` 경로와
+벡터화된 `normalize_timestamp` 경로의 실행 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.bench_timestamp --rows 1000000
+"""
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from core.data_processor import normalize_timestamp, local_tz
+
+
+def make_timestamps(rows: int, hz: int = 50, seed: int = 0) -> pd.Series:
+    """
+    `hz` 주기로 샘플링된 밀리초 타임스탬프 컬럼을 생성합니다.
+
+    Args:
+        rows (int): 행 수
+        hz (int): 샘플링 주파수
+        seed (int): 난수 시드
+
+    Returns:
+        pd.Series: int64 밀리초 타임스탬프
+    """
+    rng = np.random.default_rng(seed)
+    start = 1_700_000_000_000
+    jitter = rng.integers(0, 5, size=rows)
+    return pd.Series(start + np.arange(rows, dtype=np.int64) * (1000 // hz) + jitter, name="time")
+
+
+def legacy_normalize(time_col: pd.Series) -> pd.Series:
+    """기존 로더들이 사용하던 행 단위 변환 경로"""
+    strings = time_col.apply(
+        lambda x: datetime.fromtimestamp(x / 1000, tz=local_tz).strftime('%Y-%m-%d %H:%M:%S')
+    )
+    return pd.to_datetime(strings)
+
+
+def measure(func, *args, repeat: int = 3) -> float:
+    """`repeat` 회 실행 중 가장 빠른 시간을 초 단위로 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타임스탬프 정규화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="행 수 (기본값: 1,000,000)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    time_col = make_timestamps(args.rows)
+
+    # 결과 검증: 벽시계 시각이 기존 경로와 같아야 한다
+    expected = legacy_normalize(time_col)
+    actual = normalize_timestamp(time_col).dt.tz_localize(None)
+    assert (expected.to_numpy(dtype="datetime64[ns]") == actual.to_numpy(dtype="datetime64[ns]")).all()
+
+    legacy_sec = measure(legacy_normalize, time_col, repeat=args.repeat)
+    vector_sec = measure(normalize_timestamp, time_col, repeat=args.repeat)
+
+    print(f"rows          : {args.rows:,}")
+    print(f".apply 경로    : {legacy_sec:.3f} s")
+    print(f"벡터화 경로     : {vector_sec:.3f} s")
+    print(f"속도 향상       : {legacy_sec / vector_sec:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
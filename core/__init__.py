@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 """Core package - Export core functionality modules"""
-from core.data_processor import cleaning_data, process_raw_data, local_tz
+from core.data_processor import cleaning_data, process_raw_data, normalize_timestamp, local_tz
+from core.aggregation import aggregate_per_second, PerSecondStats
+from core.dataset_cache import DatasetCache
+from core.gps_quality import classify_fixes, quality_summary
+from core.memory import MemoryGovernor
 from core.ui_components import create_app, create_layout
 from core.callbacks import register_callbacks
 from core.utils import local_tz as tz
@@ -8,7 +12,14 @@ from core.utils import local_tz as tz
 __all__ = [
     'cleaning_data',
     'process_raw_data',
+    'normalize_timestamp',
     'local_tz',
+    'aggregate_per_second',
+    'PerSecondStats',
+    'DatasetCache',
+    'classify_fixes',
+    'quality_summary',
+    'MemoryGovernor',
     'create_app',
     'create_layout',
     'register_callbacks'
@@ -0,0 +1,191 @@
+"""
+초 단위 집계 모듈
+int64 epoch 초를 키로 NumPy reduceat을 사용해 초당 개수/평균/최소/최대를 한 번에 계산합니다.
+"""
+from typing import Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# 그래프에 그리는 채널
+PLOT_CHANNELS = [
+    "ACCEL_X", "ACCEL_Y", "ACCEL_Z",
+    "GYRO_X", "GYRO_Y", "GYRO_Z",
+    "ROLL", "PITCH", "VEL",
+]
+
+# LTE 초당 집계 데이터에 추가로 기록하는 누적 채널 (이동 시간/거리 카드)
+LTE_SUMMARY_CHANNELS = PLOT_CHANNELS + ["TIME", "DISTANCE"]
+
+# 초당 집계 데이터(summary)의 통계 컬럼 접미사: <채널>_mean, <채널>_min, <채널>_max
+SUMMARY_STATS = ("mean", "min", "max")
+
+# 초당 집계 데이터에 각 초의 첫 값을 함께 기록하는 컬럼: <컬럼>_first (GPS 위치)
+SUMMARY_FIRST_COLUMNS = ("LAT", "LON")
+
+
+class PerSecondStats(NamedTuple):
+    """초당 집계 결과"""
+    dates: pd.DatetimeIndex          # 각 초의 시각 (tz-aware)
+    count: np.ndarray                # 초당 샘플 수
+    mean: Dict[str, np.ndarray]      # 채널별 초당 평균
+    min: Dict[str, np.ndarray]       # 채널별 초당 최소
+    max: Dict[str, np.ndarray]       # 채널별 초당 최대
+    hist_values: np.ndarray          # 초당 샘플 수 값 (오름차순)
+    hist_counts: np.ndarray          # 해당 샘플 수를 가진 초의 개수
+
+
+def epoch_seconds(dates: pd.Series) -> np.ndarray:
+    """
+    datetime 컬럼(tz-aware 포함)을 int64 epoch 초 배열로 변환합니다.
+
+    Args:
+        dates (pd.Series): datetime 컬럼
+
+    Returns:
+        np.ndarray: int64 epoch 초 (내림)
+    """
+    ns = dates.values.astype("datetime64[ns]").astype(np.int64)
+    return np.floor_divide(ns, 1_000_000_000)
+
+
+def aggregate_per_second(data: pd.DataFrame, channels: Sequence[str] = PLOT_CHANNELS,
+                         date_column: str = "DATE") -> PerSecondStats:
+    """
+    데이터를 초 단위로 한 번에 집계합니다.
+
+    `value_counts` 두 번과 `groupby('DATE').mean()`을 대신합니다. 시각이 정렬되어 있으면
+    정렬 없이 구간 경계만 찾아 np.add/fmin/fmax.reduceat으로 계산하고, NaN은 pandas처럼
+    평균/최소/최대에서 제외합니다.
+
+    Args:
+        data (pd.DataFrame): DATE 컬럼과 채널 컬럼을 가진 데이터
+        channels (Sequence[str]): 집계할 채널 (없는 컬럼은 건너뜀)
+        date_column (str): 시각 컬럼 이름
+
+    Returns:
+        PerSecondStats: 초당 집계 결과
+    """
+    channels = [c for c in channels if c in data.columns]
+    seconds = epoch_seconds(data[date_column])
+    tz = data[date_column].dt.tz
+
+    order = None
+    if seconds.size and np.any(seconds[1:] < seconds[:-1]):
+        order = np.argsort(seconds, kind="stable")
+        seconds = seconds[order]
+
+    if seconds.size == 0:
+        empty_f = np.array([], dtype=np.float64)
+        empty_i = np.array([], dtype=np.int64)
+        return PerSecondStats(
+            dates=pd.DatetimeIndex([], tz=tz),
+            count=empty_i,
+            mean={c: empty_f for c in channels},
+            min={c: empty_f for c in channels},
+            max={c: empty_f for c in channels},
+            hist_values=empty_i,
+            hist_counts=empty_i,
+        )
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(seconds)) + 1))
+    count = np.diff(np.append(starts, seconds.size))
+
+    means, mins, maxs = {}, {}, {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for channel in channels:
+            values = data[channel].to_numpy(dtype=np.float64, na_value=np.nan)
+            if order is not None:
+                values = values[order]
+            valid = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+            n_valid = np.add.reduceat(valid.astype(np.int64), starts)
+            means[channel] = np.where(n_valid > 0, sums / n_valid, np.nan)
+            mins[channel] = np.fmin.reduceat(values, starts)
+            maxs[channel] = np.fmax.reduceat(values, starts)
+
+    histogram = np.bincount(count)
+    hist_values = np.flatnonzero(histogram)
+
+    dates = pd.to_datetime(seconds[starts], unit="s").as_unit("ns")
+    if tz is not None:
+        dates = dates.tz_localize("UTC").tz_convert(tz)
+
+    return PerSecondStats(
+        dates=dates,
+        count=count,
+        mean=means,
+        min=mins,
+        max=maxs,
+        hist_values=hist_values,
+        hist_counts=histogram[hist_values],
+    )
+
+
+def stats_from_summary(summary: pd.DataFrame, channels: Optional[Sequence[str]] = None,
+                       date_column: str = "DATE") -> PerSecondStats:
+    """
+    데이터 소스가 미리 집계한 초당 데이터를 PerSecondStats로 변환합니다.
+
+    Args:
+        summary (pd.DataFrame): DATE, count, <채널>_mean/_min/_max 컬럼을 가진 초당 한 행 데이터
+        channels (Sequence[str], optional): 변환할 채널 (기본값: <채널>_mean 컬럼이 있는 모든 채널)
+        date_column (str): 시각 컬럼 이름
+
+    Returns:
+        PerSecondStats: 초당 집계 결과
+    """
+    if channels is None:
+        channels = [c[:-len("_mean")] for c in summary.columns if c.endswith("_mean")]
+    channels = [c for c in channels if f"{c}_mean" in summary.columns]
+
+    def column(name):
+        return summary[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    count = summary["count"].to_numpy(dtype=np.int64)
+    histogram = np.bincount(count) if count.size else np.array([], dtype=np.int64)
+    hist_values = np.flatnonzero(histogram)
+
+    return PerSecondStats(
+        dates=pd.DatetimeIndex(summary[date_column]),
+        count=count,
+        mean={c: column(f"{c}_mean") for c in channels},
+        min={c: column(f"{c}_min") for c in channels},
+        max={c: column(f"{c}_max") for c in channels},
+        hist_values=hist_values,
+        hist_counts=histogram[hist_values],
+    )
+
+
+def second_summary(data: pd.DataFrame, channels: Sequence[str] = PLOT_CHANNELS,
+                   first_columns: Sequence[str] = SUMMARY_FIRST_COLUMNS, date_column: str = "DATE") -> pd.DataFrame:
+    """
+    데이터를 초당 한 행의 집계 데이터(summary)로 만듭니다. stats_from_summary가 읽는 형식입니다.
+
+    Args:
+        data (pd.DataFrame): DATE 컬럼과 채널 컬럼을 가진 데이터 (초 단위 중복 제거 전 원본)
+        channels (Sequence[str]): 집계할 채널 (없는 컬럼은 건너뜀)
+        first_columns (Sequence[str]): 각 초의 첫 값을 기록할 컬럼 (없는 컬럼은 건너뜀)
+        date_column (str): 시각 컬럼 이름
+
+    Returns:
+        pd.DataFrame: 컬럼 DATE, count, <채널>_mean/_min/_max, <컬럼>_first
+    """
+    stats = aggregate_per_second(data, channels, date_column)
+
+    summary = {date_column: stats.dates, "count": stats.count}
+    for channel in stats.mean:
+        summary[f"{channel}_mean"] = stats.mean[channel]
+        summary[f"{channel}_min"] = stats.min[channel]
+        summary[f"{channel}_max"] = stats.max[channel]
+
+    # 각 초의 첫 행 위치 (aggregate_per_second와 같은 안정 정렬 기준)
+    seconds = epoch_seconds(data[date_column])
+    order = np.argsort(seconds, kind="stable")
+    _, first = np.unique(seconds[order], return_index=True)
+    for column in first_columns:
+        if column in data.columns:
+            summary[f"{column}_first"] = data[column].to_numpy(dtype=np.float64, na_value=np.nan)[order[first]]
+
+    return pd.DataFrame(summary)
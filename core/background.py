@@ -0,0 +1,99 @@
+"""
+백그라운드 작업 매니저 모듈
+Dash 백그라운드 콜백(조회, 지도 출력)을 웹 서버 프로세스 안의 작업 스레드에서 실행합니다.
+
+`dash.DiskcacheManager`는 작업마다 프로세스를 fork합니다. 그러면 작업 안에서 채운 DatasetCache,
+SingleFlightLoader의 진행 중 로드, MemoryGovernor가 작업이 끝날 때 함께 사라지고, 부모 프로세스가 만든
+스레드 풀과 MongoClient를 물려받은 자식 프로세스는 멈출 수 있습니다.
+ThreadJobManager는 진행 상태와 결과 전달(diskcache)은 DiskcacheManager와 같이 하고 작업만 스레드로 실행하므로,
+모든 콜백이 같은 프로세스의 캐시와 로더를 공유합니다.
+
+스레드는 강제로 멈출 수 없으므로 취소는 협조적입니다. 새 조회나 센서 스위치 변경으로 이전 작업이 취소되면
+작업 스레드는 다음 report_progress(다운로드, 변환, 집계, 그리기 단계 경계)에서 JobCancelled로 멈추고,
+그 결과는 버려집니다.
+"""
+import itertools
+import threading
+from typing import Dict, Tuple
+
+import dash
+
+from core.progress import cancel_scope
+
+
+class ThreadJobManager(dash.DiskcacheManager):
+    """
+    작업을 스레드로 실행하는 Dash 백그라운드 콜백 매니저 클래스
+
+    작업 ID는 문자열 일련번호이고, 작업 결과는 작업별 키에 먼저 쓴 뒤 취소되지 않은 경우에만
+    Dash가 읽는 캐시 키로 옮깁니다. 같은 입력으로 다시 시작한 작업의 결과를 취소된 작업이 덮어쓰지 않습니다.
+    """
+
+    # 작업이 웹 서버 프로세스 안에서 실행됨 (콜백들이 메모리 캐시를 공유할 수 있음)
+    in_process = True
+
+    def __init__(self, cache=None, expire=None):
+        """
+        ThreadJobManager를 초기화합니다.
+
+        Args:
+            cache (diskcache.Cache, optional): 진행 상태와 결과를 저장할 캐시 (기본값: 임시 폴더의 새 캐시)
+            expire (float, optional): 결과 캐시 만료 시간 (초)
+        """
+        super().__init__(cache, expire=expire)
+        self._jobs: Dict[str, Tuple[threading.Thread, threading.Event, str]] = {}
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def call_job_fn(self, key, job_fn, args, context):
+        """작업 스레드를 시작하고 작업 ID를 반환합니다."""
+        job = str(next(self._job_ids))
+        cancelled = threading.Event()
+        job_key = f"{key}-job{job}"
+
+        def run():
+            try:
+                with cancel_scope(cancelled):
+                    job_fn(job_key, self._make_progress_key(key), args, context)
+                result = self.handle.pop(job_key, None)
+                if result is not None and not cancelled.is_set():
+                    self.handle.set(key, result)
+            finally:
+                with self._lock:
+                    self._jobs.pop(job, None)
+                    # 취소된 작업의 진행 상태는 같은 키로 다시 시작한 작업이 없을 때만 지운다
+                    restarted = any(entry[2] == key for entry in self._jobs.values())
+                if cancelled.is_set() and not restarted:
+                    self.clear_cache_entry(self._make_progress_key(key))
+
+        thread = threading.Thread(target=run, name=f"dash-job-{job}", daemon=True)
+        with self._lock:
+            self._jobs[job] = (thread, cancelled, key)
+        thread.start()
+        return job
+
+    def terminate_job(self, job):
+        """작업에 취소를 알립니다 (작업 스레드는 다음 단계 경계에서 멈춤)."""
+        if job is None:
+            return
+        with self._lock:
+            entry = self._jobs.get(str(job))
+        if entry is not None:
+            entry[1].set()
+
+    def terminate_unhealthy_job(self, job):
+        # 스레드 작업은 끝나면 목록에서 빠지므로 결과 없이 남는 작업이 없다
+        return False
+
+    def job_running(self, job):
+        """작업 스레드가 아직 실행 중인지 반환합니다."""
+        if job is None:
+            return False
+        with self._lock:
+            entry = self._jobs.get(str(job))
+        return entry is not None and entry[0].is_alive()
+
+    def running_jobs(self) -> int:
+        """실행 중인 작업 수"""
+        with self._lock:
+            return len(self._jobs)
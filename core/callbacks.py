@@ -6,39 +6,434 @@ import os
 import numpy as np
 import pandas as pd
 import dash_bootstrap_components as dbc
-import dash_leaflet as dl
 import plotly.graph_objects as go
-from dash import Input, Output, State
+from dash import Input, Output, State, Patch
 from dash.exceptions import PreventUpdate
 from dash import html
 
-from core.data_processor import cleaning_data
+from core.aggregation import (
+    LTE_SUMMARY_CHANNELS, PLOT_CHANNELS, PerSecondStats, epoch_seconds, second_summary, stats_from_summary
+)
+from core.data_processor import cleaning_data, drop_second_duplicates
+from core.dataset_cache import DatasetCache
+from core.downsample import downsample
+from core.gps_quality import classify_fixes
+from core.geo_simplify import TrajectoryPyramid
+from core.map_layers import MAP_LINE_IDS
+from core.memory import MemoryGovernor
+from core.progress import JobCancelled, report_progress, with_progress
+from core.pyramid import StatsPyramid
+
+
+# 그래프 ID -> 그리는 채널
+GRAPH_CHANNELS = {
+    'second_graph': ["ACCEL_X", "ACCEL_Y", "ACCEL_Z"],
+    'third_graph': ["GYRO_X", "GYRO_Y", "GYRO_Z"],
+    'fourth_graph': ["ROLL", "PITCH"],
+    'fifth_graph': ["VEL"],
+}
+
+
+# 그래프별 최대 점 수 (브라우저로 보내는 점을 이 수준으로 다운샘플링)
+GRAPH_POINT_BUDGET = {
+    graph_id: int(os.getenv("GRAPH_POINT_BUDGET", 2000)) for graph_id in GRAPH_CHANNELS
+}
+
+def graph_pixels(n_out: int) -> float:
+    """
+    그래프 최대 점 수에 해당하는 픽셀 폭을 반환합니다 (min/max 다운샘플링처럼 픽셀당 두 점).
+
+    Args:
+        n_out (int): 그래프 최대 점 수 (0 이하이면 줄이지 않음)
+
+    Returns:
+        float: 픽셀 폭 (줄이지 않으면 inf, 항상 가장 세밀한 레벨을 고르게 됨)
+    """
+    return max(n_out // 2, 1) if n_out > 0 else np.inf
+
+
+# GPS jump 판정 거리 (m), 지정하지 않으면 기존 0.003도 기준
+GPS_JUMP_METRES = float(os.environ["GPS_JUMP_METRES"]) if os.getenv("GPS_JUMP_METRES") else None
+
+
+def line_trace(x, y, name: str, n_out: int, method: str = "minmax") -> go.Scatter:
+    """
+    다운샘플링한 선 그래프 trace를 생성합니다.
+
+    Args:
+        x: x 값
+        y: y 값
+        name (str): trace 이름
+        n_out (int): 최대 점 수 (0 이하이면 줄이지 않음)
+        method (str): 다운샘플링 방식 ('minmax' 또는 'lttb')
+
+    Returns:
+        go.Scatter: 선 그래프 trace
+    """
+    x, y = downsample(x, y, n_out, method)
+    return go.Scatter(x=x, y=y, mode='lines', name=name)
+
+
+def build_figures(pyramid: StatsPyramid, start_t, end_t, point_budget: dict = None,
+                  method: str = "minmax") -> tuple:
+    """
+    초당 집계 피라미드로 5개의 그래프를 생성합니다.
+
+    그래프마다 전체 구간을 픽셀 폭만큼 채우는 가장 거친 레벨(1초/10초/1분/10분)을 골라 그립니다.
+
+    Args:
+        pyramid (StatsPyramid): 초당 집계 피라미드
+        start_t: x축 시작 시각
+        end_t: x축 끝 시각
+        point_budget (dict, optional): 그래프 ID -> 최대 점 수 (기본값: GRAPH_POINT_BUDGET)
+        method (str): 다운샘플링 방식 ('minmax' 또는 'lttb')
+
+    Returns:
+        tuple: (fig1, fig2, fig3, fig4, fig5)
+    """
+    point_budget = point_budget or GRAPH_POINT_BUDGET
+    stats = pyramid.stats
 
+    # 초당 데이터 개수 분포
+    fig1 = go.Figure()
+    fig1.add_trace(go.Bar(x=stats.hist_values, y=stats.hist_counts, name="data/second"))
+    fig1.update_xaxes(range=[10, 50])
 
-def register_callbacks(app, loader):
+    figures = [fig1]
+    for graph_id, channels in GRAPH_CHANNELS.items():
+        n_out = point_budget.get(graph_id, 0)
+        seconds = pyramid.select_level(pixels=graph_pixels(n_out))
+        fig = go.Figure()
+        for channel in channels:
+            x, y = pyramid.series(channel, seconds)
+            fig.add_trace(line_trace(x, y, channel, n_out, method))
+        fig.update_xaxes(range=[start_t, end_t])
+        figures.append(fig)
+
+    return tuple(figures)
+
+
+def raw_summary(raw: pd.DataFrame, is_lte: bool) -> pd.DataFrame:
+    """
+    초 단위 중복 제거 전 원본 샘플로 초당 집계 파일(tools.build_summaries)과 같은 형식의 초당 집계 데이터를 만듭니다.
+
+    Args:
+        raw (pd.DataFrame): process_raw_data(deduplicate=False)를 거친 원본 샘플
+        is_lte (bool): True면 LTE (TIME, DISTANCE 포함), False면 BLE
+
+    Returns:
+        pd.DataFrame: 초당 집계 데이터 (컬럼: DATE, count, <채널>_mean/_min/_max, LAT_first, LON_first)
+    """
+    return second_summary(raw, LTE_SUMMARY_CHANNELS if is_lte else PLOT_CHANNELS)
+
+
+def summary_stats(summary: pd.DataFrame) -> PerSecondStats:
+    """
+    초당 집계 데이터를 정제(cleaning_data)해 그래프용 초당 집계 결과로 변환합니다.
+    집계 파일/집계 파이프라인 경로와 원본 경로가 모두 이 함수를 거칩니다.
+
+    Args:
+        summary (pd.DataFrame): 초당 집계 데이터
+
+    Returns:
+        PerSecondStats: 초당 집계 결과
+    """
+    return stats_from_summary(cleaning_data(summary))
+
+
+def parse_relayout_window(relayout_data: dict):
+    """
+    그래프 relayoutData에서 x축 변경 내용을 꺼냅니다.
+
+    Args:
+        relayout_data (dict): dcc.Graph의 relayoutData
+
+    Returns:
+        'reset'(자동 범위로 복귀), (시작, 끝) 문자열 튜플(확대), 또는 x축 변경이 없으면 None
+    """
+    if not relayout_data:
+        return None
+    if relayout_data.get('xaxis.autorange'):
+        return 'reset'
+    if 'xaxis.range[0]' in relayout_data and 'xaxis.range[1]' in relayout_data:
+        return relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']
+    if 'xaxis.range' in relayout_data:
+        return tuple(relayout_data['xaxis.range'][:2])
+    return None
+
+
+def window_bounds(start, end, tz) -> tuple:
+    """
+    relayoutData의 구간 문자열을 Timestamp로 변환합니다.
+
+    Args:
+        start: 구간 시작 (문자열/Timestamp, 시간대가 없으면 tz 시간대의 벽시계 시각)
+        end: 구간 끝
+        tz: 데이터 시간대 (None이면 시간대 없는 Timestamp로 변환)
+
+    Returns:
+        tuple: (시작, 끝) pd.Timestamp
+    """
+    bounds = []
+    for value in (start, end):
+        ts = pd.Timestamp(value)
+        if tz is not None:
+            ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+        elif ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        bounds.append(ts)
+    return tuple(bounds)
+
+
+def date_range_bounds(date_options: list) -> tuple:
+    """
+    날짜 옵션 목록으로 DatePickerRange의 선택 가능 범위를 구합니다.
+
+    Args:
+        date_options (list): 날짜 드롭다운 옵션 ({"label": 'YYYY-MM-DD', "value": 'YYYYMMDD'})
+
+    Returns:
+        tuple: (최소 날짜, 최대 날짜) 'YYYY-MM-DD' 문자열 (날짜가 없으면 (None, None))
+    """
+    labels = sorted(
+        option["label"] for option in date_options if len(option["value"]) == 8 and option["value"].isdigit()
+    )
+    if not labels:
+        return None, None
+    return labels[0], labels[-1]
+
+
+def date_key(date):
+    """
+    날짜 선택값(날짜 하나 또는 날짜 리스트)을 캐시 키로 쓸 수 있게 변환합니다.
+
+    Args:
+        date: 날짜 문자열 또는 날짜 리스트 (graph_selection에 JSON으로 저장된 값)
+
+    Returns:
+        날짜 문자열 또는 날짜 튜플
+    """
+    return tuple(date) if isinstance(date, (list, tuple)) else date
+
+
+def range_dates(start_date: str, end_date: str, available) -> list:
+    """
+    DatePickerRange 기간에 속하는 날짜 목록을 반환합니다.
+
+    Args:
+        start_date (str): 시작 날짜 ('YYYY-MM-DD' 또는 ISO 시각)
+        end_date (str): 끝 날짜
+        available: 데이터가 있는 날짜 ('YYYYMMDD') 목록
+
+    Returns:
+        list: 기간 안의 날짜 ('YYYYMMDD', 오름차순)
+    """
+    start, end = (value[:10].replace("-", "") for value in (start_date, end_date))
+    return sorted(date for date in available if start <= date <= end)
+
+
+def slice_window(data: pd.DataFrame, start, end, date_column: str = "DATE") -> pd.DataFrame:
+    """
+    시간순으로 정렬된 데이터에서 [start, end] 구간을 searchsorted로 잘라냅니다.
+
+    Args:
+        data (pd.DataFrame): DATE 기준 오름차순 정렬된 데이터
+        start: 구간 시작 (문자열/Timestamp, 시간대가 없으면 DATE와 같은 시간대의 벽시계 시각)
+        end: 구간 끝
+        date_column (str): 시각 컬럼 이름
+
+    Returns:
+        pd.DataFrame: 구간에 속한 행 (복사 없는 슬라이스)
+    """
+    tz = data[date_column].dt.tz
+    bounds = []
+    for ts in window_bounds(start, end, tz):
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert(None)
+        bounds.append(ts.to_datetime64().astype("datetime64[ns]"))
+
+    dates = data[date_column].values.astype("datetime64[ns]")
+    i0 = np.searchsorted(dates, bounds[0], side='left')
+    i1 = np.searchsorted(dates, bounds[1], side='right')
+    return data.iloc[i0:i1]
+
+
+def register_callbacks(app, loader, dataset_cache: DatasetCache = None, governor: MemoryGovernor = None,
+                       point_budget: dict = None, background_manager=None):
     """
     모든 콜백 함수를 앱에 등록합니다.
 
     Args:
         app (dash.Dash): Dash 애플리케이션 인스턴스
         loader (BaseLoader): 데이터 로더 인스턴스
+        dataset_cache (DatasetCache, optional): 콜백들이 공유할 데이터셋 캐시 (프로세스 메모리에 있으므로
+            모든 콜백이 같은 프로세스에서 실행되어야 함, 기본값: 환경 변수 DATASET_CACHE_MAX_BYTES 또는 1GB 용량의 새 캐시)
+        governor (MemoryGovernor, optional): 프로세스 메모리 예산 관리자. 조회/지도 출력은 요청별 메모리를 기록하고,
+            확대/지도 이동 콜백도 끝날 때 예산을 지킵니다 (모두 웹 서버 프로세스 안에서 실행)
+            (기본값: 환경 변수 DASH_MEMORY_BUDGET_BYTES 또는 2GB 예산의 새 관리자,
+            DASH_MEMORY_VERBOSE=1이면 요청마다 메모리 사용량 출력)
+        point_budget (dict, optional): 그래프 ID -> 최대 점 수 (기본값: GRAPH_POINT_BUDGET)
+        background_manager (optional): Dash 백그라운드 콜백 매니저 (ThreadJobManager).
+            지정하면 조회/지도 출력을 웹 서버 스레드 밖의 작업 스레드에서 실행하고 진행 상태를 announce에 표시합니다.
+            작업을 다른 프로세스에서 실행하는 매니저(DiskcacheManager, CeleryManager)는 ValueError.
     """
+    if background_manager is not None and not getattr(background_manager, "in_process", False):
+        # 작업을 다른 프로세스에서 실행하는 매니저는 작업 안에서 채운 캐시가 작업과 함께 사라진다
+        raise ValueError("background_manager는 웹 서버 프로세스 안에서 작업을 실행해야 합니다 (ThreadJobManager)")
+    if dataset_cache is None:
+        dataset_cache = DatasetCache(max_bytes=int(os.getenv("DATASET_CACHE_MAX_BYTES", 1024 ** 3)))
+    if governor is None:
+        governor = MemoryGovernor(budget_bytes=int(os.getenv("DASH_MEMORY_BUDGET_BYTES", 2 * 1024 ** 3)),
+                                  verbose=os.getenv("DASH_MEMORY_VERBOSE", "0") == "1")
+    governor.register(dataset_cache)
+    point_budget = point_budget or GRAPH_POINT_BUDGET
+
+    def background_callback(*args, running=None, **kwargs):
+        """
+        오래 걸리는 콜백을 등록하는 데코레이터
+
+        백그라운드 매니저가 있으면 별도 작업으로 실행하며 진행 단계를 announce에 표시하고,
+        같은 콜백이 다시 호출되거나 센서 스위치가 바뀌면 이전 작업을 취소합니다 (다음 진행 단계에서 멈춤).
+        매니저가 없으면 일반 콜백으로 등록합니다.
+
+        Args:
+            running (list, optional): 실행 중에 바꿀 (Output, 실행 중 값, 완료 후 값) 목록
+        """
+        def decorator(func):
+            if background_manager is None:
+                return app.callback(*args, **kwargs)(func)
+            return app.callback(
+                *args,
+                background=True,
+                manager=background_manager,
+                progress=Output('announce', 'children'),
+                running=running,
+                cancel=[Input('my-boolean-switch', 'on')],
+                **kwargs
+            )(with_progress(func))
+        return decorator
+
+    def selected_dates(date, start_date, end_date, on):
+        """
+        날짜 목록 선택값과 기간 선택값으로 조회할 날짜를 정합니다.
+
+        Returns:
+            기간을 지정하지 않았으면 날짜 목록 선택값, 기간 안의 날짜가 하나면 그 날짜,
+            여러 개면 날짜 리스트, 기간 안에 데이터가 없으면 None
+        """
+        if not (start_date and end_date):
+            return date
+        dates = range_dates(start_date, end_date, loader.show_date(is_lte=bool(on)))
+        if len(dates) == 1:
+            return dates[0]
+        return dates or None
+
+    def load_raw(date, phone, sensor, on):
+        """
+        선택한 조건의 초 단위 중복 제거 전 원본 샘플을 로드합니다 (DatasetCache에는 보관하지 않음).
+        날짜 리스트면 load_range로 여러 날짜를 동시에 로드해 시간순으로 이어 붙입니다.
+        """
+        if isinstance(date, (list, tuple)):
+            return loader.load_range(list(date), phone, [sensor], is_lte=bool(on), deduplicate=False)
+        load = loader.load_lte_data if on else loader.load_ble_data
+        return load(date, phone, sensor, deduplicate=False)
+
+    def load_dataset(date, phone, sensor, on):
+        """
+        선택한 조건의 정규화된(초 단위 중복 제거) 데이터를 캐시를 거쳐 로드합니다.
+        조회의 원본 집계와 같은 중복 제거 전 원본(load_raw)을 로드해 여기서 중복을 제거하므로,
+        조회와 지도 출력이 동시에 실행되면 SingleFlightLoader가 두 로드를 하나로 합칩니다.
+        반환된 DataFrame은 다른 콜백과 공유되므로 제자리 수정하지 않습니다.
+        """
+        return dataset_cache.get_or_load((date_key(date), phone, sensor, bool(on)),
+                                         lambda: drop_second_duplicates(load_raw(date, phone, sensor, on)))
+
+    def load_graph_view(date, phone, sensor, on):
+        """
+        그래프 확대 구간용 원본 샘플(초 단위 중복 제거 전, DATE 밀리초 단위)을 캐시를 거쳐 로드합니다.
+
+        그래프 개요와 같은 시각만 그리도록, 초당 집계를 정제(cleaning_data)할 때 남은 초의 샘플만 남깁니다.
+
+        Returns:
+            pd.DataFrame: DATE 기준 시간순 원본 샘플
+        """
+        def build():
+            stats = load_graph_stats(date, phone, sensor, on)
+            raw = load_raw(date, phone, sensor, on)
+            report_progress("aggregate")
+            data = raw[np.isin(epoch_seconds(raw["DATE"]), epoch_seconds(stats.dates))]
+            if not data["DATE"].is_monotonic_increasing:
+                data = data.sort_values("DATE", kind="stable")
+            return data.reset_index(drop=True)
+
+        return dataset_cache.get_or_load((date_key(date), phone, sensor, bool(on), 'graph'), build)
+
+    def load_graph_stats(date, phone, sensor, on):
+        """
+        그래프 개요에 쓸 초당 집계 결과를 캐시를 거쳐 로드합니다.
+
+        로더가 초당 집계 데이터(load_second_summary)를 제공하면 원본을 내려받지 않고 그것을 쓰고,
+        아니면 초 단위 중복 제거 전 원본 샘플로 같은 형식의 초당 집계 데이터(second_summary)를 만듭니다.
+        두 경우 모두 초당 집계 데이터를 정제하므로 같은 데이터는 어느 경로로 읽어도 같은 그래프가 됩니다.
+
+        Returns:
+            PerSecondStats: 초당 집계 결과
+        """
+        def load_summary():
+            if not isinstance(date, (list, tuple)):
+                return loader.load_second_summary(date, phone, sensor, is_lte=bool(on))
+            # 여러 날짜는 모든 날짜에 집계 데이터가 있을 때만 이어 붙여 쓴다
+            partitions = loader.range_partitions(list(date), phone, [sensor], is_lte=bool(on))
+            summaries = [loader.load_second_summary(d, phone, sensor, is_lte=bool(on)) for d, _ in partitions]
+            if not summaries or any(summary is None for summary in summaries):
+                return None
+            return pd.concat(summaries, ignore_index=True)
+
+        def summarize_raw():
+            raw = load_raw(date, phone, sensor, on)
+            # 같은 원본에서 초 단위 중복을 제거한 데이터도 캐시해 지도/확대 구간이 다시 로드하지 않게 한다
+            dataset_cache.put((date_key(date), phone, sensor, bool(on)), drop_second_duplicates(raw))
+            report_progress("aggregate")
+            return raw_summary(raw, bool(on))
+
+        def build():
+            summary = load_summary()
+            if summary is None:
+                summary = summarize_raw()
+            report_progress("aggregate")
+            return summary_stats(summary)
+
+        return dataset_cache.get_or_load((date_key(date), phone, sensor, bool(on), 'summary'), build)
+
+    def load_graph_pyramid(date, phone, sensor, on):
+        """
+        초당 집계 결과로 만든 10초/1분/10분 피라미드를 캐시를 거쳐 로드합니다.
+        조회 결과와 확대(zoom) 콜백이 같은 피라미드를 공유합니다.
+
+        Returns:
+            StatsPyramid: 초당 집계 피라미드
+        """
+        stats = load_graph_stats(date, phone, sensor, on)
+        return dataset_cache.get_or_load((date_key(date), phone, sensor, bool(on), 'pyramid'),
+                                         lambda: StatsPyramid(stats))
 
     # 현재 센서 버전 상태를 가져오는 함수
     @app.callback(
         Output('boolean-switch-output-1', 'children'),
         Output('date_dropdown', 'options'),
+        Output('date_range', 'min_date_allowed'),
+        Output('date_range', 'max_date_allowed'),
         Input('my-boolean-switch', 'on')
     )
     def update_date(on):
         """
-        센서 스위치 상태에 따라 날짜 목록을 업데이트합니다.
+        센서 스위치 상태에 따라 날짜 목록과 기간 선택 범위를 업데이트합니다.
 
         Args:
             on (bool): 스위치 상태 (False: BLE, True: LTE)
 
         Returns:
-            tuple: (상태 텍스트, 날짜 옵션 리스트)
+            tuple: (상태 텍스트, 날짜 옵션 리스트, 기간 선택 최소 날짜, 최대 날짜)
         """
         if on == False:
             status = "BLE 버전"
@@ -49,7 +444,8 @@ def register_callbacks(app, loader):
                     "label": factor[:4] + "-" + factor[4:6] + "-" + factor[6:],
                     "value": factor
                 })
-            return '현재 {} 입니다.'.format(status), return_date_list
+            return ('현재 {} 입니다.'.format(status), return_date_list,
+                    *date_range_bounds(return_date_list))
 
         else:
             status = "LTE 버전"
@@ -60,32 +456,41 @@ def register_callbacks(app, loader):
                     "label": factor[:4] + "-" + factor[4:6] + "-" + factor[6:],
                     "value": factor
                 })
-            return '현재 {} 입니다.'.format(status), return_date_list
+            return ('현재 {} 입니다.'.format(status), return_date_list,
+                    *date_range_bounds(return_date_list))
 
     # phonelist call
     @app.callback(
         Output("phone_dropdown", "options"),
         Input("date_dropdown", "value"),
+        Input("date_range", "start_date"),
+        Input("date_range", "end_date"),
         State("my-boolean-switch", "on")
     )
-    def update_phone(value, on):
+    def update_phone(value, start_date, end_date, on):
         """
-        선택한 날짜에 따라 전화번호 목록을 업데이트합니다.
+        선택한 날짜(또는 기간)에 따라 전화번호 목록을 업데이트합니다.
 
         Args:
             value (str): 선택한 날짜
+            start_date (str): 기간 시작 날짜
+            end_date (str): 기간 끝 날짜
             on (bool): 센서 스위치 상태
 
         Returns:
-            list: 전화번호 옵션 리스트
+            list: 전화번호 옵션 리스트 (기간이면 기간 안의 모든 날짜의 전화번호)
         """
+        value = selected_dates(value, start_date, end_date, on)
         # dropdown에서 value값이 없다면
         if not value:
             # 아무 일도 일어나지 않도록 설정
             raise PreventUpdate
         # value값이 있다면
         else:
-            phone_list = loader.show_phonenum(value, is_lte=on)
+            if isinstance(value, list):
+                phone_list = sorted({phone for date in value for phone in loader.show_phonenum(date, is_lte=on)})
+            else:
+                phone_list = loader.show_phonenum(value, is_lte=on)
             return_phone_list = []
             for factor in phone_list:
                 if len(factor) == 11:
@@ -106,26 +511,34 @@ def register_callbacks(app, loader):
         Output("sensor_dropdown", "options"),
         Input("phone_dropdown", "value"),  # 폰
         State('date_dropdown', 'value'),  # 날짜
+        State('date_range', 'start_date'),  # 기간
+        State('date_range', 'end_date'),
         State("my-boolean-switch", "on")  # 센서
     )
-    def update_sensor(value1, value2, on):
+    def update_sensor(value1, value2, start_date, end_date, on):
         """
-        선택한 날짜와 전화번호에 따라 센서 목록을 업데이트합니다.
+        선택한 날짜(또는 기간)와 전화번호에 따라 센서 목록을 업데이트합니다.
 
         Args:
             value1 (str): 선택한 전화번호
             value2 (str): 선택한 날짜
+            start_date (str): 기간 시작 날짜
+            end_date (str): 기간 끝 날짜
             on (bool): 센서 스위치 상태
 
         Returns:
-            list: 센서 옵션 리스트
+            list: 센서 옵션 리스트 (기간이면 기간 안의 모든 날짜의 센서)
         """
+        value2 = selected_dates(value2, start_date, end_date, on)
         # dropdown에서 value값이 없다면
-        if not value1:
+        if not value1 or not value2:
             # 아무 일도 일어나지 않도록 설정
             raise PreventUpdate
         else:
-            sensor_list = loader.show_sensor(value2, value1, is_lte=on)
+            if isinstance(value2, list):
+                sensor_list = sorted({sensor for _, sensor in loader.range_partitions(value2, value1, is_lte=on)})
+            else:
+                sensor_list = loader.show_sensor(value2, value1, is_lte=on)
             return_list = []
             for factor in sensor_list:
                 return_list.append({
@@ -137,7 +550,7 @@ def register_callbacks(app, loader):
 
     # 그래프 출력
     # 조회 버튼을 누르면 그래프를 출력하는 함수
-    @app.callback(
+    @background_callback(
         Output('first_graph', 'figure'),
         Output('second_graph', 'figure'),
         Output('third_graph', 'figure'),
@@ -145,14 +558,19 @@ def register_callbacks(app, loader):
         Output('fifth_graph', 'figure'),
         Output('output_card', 'children'),
         Output('announce', 'children'),
+        Output('graph_selection', 'data'),
         Input('search_button', 'n_clicks'),
         State('date_dropdown', 'value'),
         State('phone_dropdown', 'value'),
         State('sensor_dropdown', 'value'),
         State('my-boolean-switch', 'on'),
+        State('date_range', 'start_date'),
+        State('date_range', 'end_date'),
+        running=[(Output('search_button', 'disabled'), True, False)],
         prevent_initial_call=True
     )
-    def update_graph(n_clicks, value1, value2, value3, on):
+    @governor.track('update_graph')
+    def update_graph(n_clicks, value1, value2, value3, on, start_date=None, end_date=None):
         """
         선택한 조건에 따라 그래프를 업데이트합니다.
 
@@ -162,65 +580,35 @@ def register_callbacks(app, loader):
             value2 (str): 선택한 전화번호
             value3 (str): 선택한 센서
             on (bool): 센서 스위치 상태 (False: BLE, True: LTE)
+            start_date (str): 기간 시작 날짜 (기간을 지정하면 날짜 대신 기간 안의 날짜를 모두 이어서 출력)
+            end_date (str): 기간 끝 날짜
 
         Returns:
-            tuple: (fig1, fig2, fig3, fig4, fig5, output_card, warn_a)
+            tuple: (fig1, fig2, fig3, fig4, fig5, output_card, warn_a, 그래프에 표시한 선택 조건)
         """
-        os.system("sudo sysctl -w vm.drop_caches=3")
+        value1 = selected_dates(value1, start_date, end_date, on)
+        if not value1:
+            empty = go.Figure()
+            return empty, empty, empty, empty, empty, dbc.CardBody(), "선택한 기간에 데이터가 없습니다!", None
 
         if on == False:  # 센서가 BLE 버전일 때
-            # 선택한 라이더/날짜 경로
-            data = loader.load_ble_data(value1, value2, value3)
+            # 선택한 라이더/날짜 경로의 초당 개수/평균 집계 (확대 콜백과 공유)
+            pyramid = load_graph_pyramid(value1, value2, value3, False)
+            stats = pyramid.stats
+            governor.checkpoint()
             try:
-                # data = cleaning_data(data)
-                # 초당 그래프
-                data_per_second = data['DATE'].value_counts().reset_index()
-                data_per_second.columns = ['DATE', 'CNT']  # 'count' 대신 'CNT'로 변경
-                data_per_second.sort_values("DATE", inplace=True)
-
-                new_data_per = data_per_second['CNT'].value_counts().reset_index()
-                new_data_per.columns = ['index', 'count']
-                new_data_per.sort_values("index", inplace=True)
-
-                fig1 = go.Figure()
-                fig1.add_trace(go.Bar(x=new_data_per['index'], y=new_data_per['count'], name="data/second"))
-                fig1.update_xaxes(range=[10, 50])
-
-                numeric_columns = data.select_dtypes(include=['number']).columns
-                mean_data = data.groupby('DATE', as_index=False)[numeric_columns].mean()
-
-                start_t = data["DATE"].iloc[0]
-                end_t = data["DATE"].iloc[len(data) - 1]
-
-                # ACCEL 값 그래프
-                fig2 = go.Figure()
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_X"], mode='lines', name="ACCEL_X"))
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_Y"], mode='lines', name="ACCEL_Y"))
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_Z"], mode='lines', name="ACCEL_Z"))
-                fig2.update_xaxes(range=[start_t, end_t])
+                report_progress("render")
+                fig1, fig2, fig3, fig4, fig5 = build_figures(
+                    pyramid, stats.dates[0], stats.dates[-1], point_budget=point_budget
+                )
 
-                # GYRO 값 그래프
-                fig3 = go.Figure()
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_X"], mode='lines', name="GYRO_X"))
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_Y"], mode='lines', name="GYRO_Y"))
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_Z"], mode='lines', name="GYRO_Z"))
-                fig3.update_xaxes(range=[start_t, end_t])
-
-                # ATTITUDE 값 그래프
-                fig4 = go.Figure()
-                fig4.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ROLL"], mode='lines', name="ROLL"))
-                fig4.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["PITCH"], mode='lines', name="PITCH"))
-                fig4.update_xaxes(range=[start_t, end_t])
-
-                # velocity 값 그래프
-                fig5 = go.Figure()
-                fig5.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["VEL"], mode='lines', name="VEL"))
-                fig5.update_xaxes(range=[start_t, end_t])
                 output_card = dbc.CardBody()
                 warn_a = " "
+                selection = [value1, value2, value3, False]
 
-                os.system("sudo sysctl -w vm.drop_caches=3")
-                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a
+                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a, selection
+            except JobCancelled:
+                raise
             except Exception as e:
                 print(f"BLE 데이터 로딩 실패: {type(e).__name__}: {str(e)}")
                 import traceback
@@ -232,61 +620,21 @@ def register_callbacks(app, loader):
                 fig5 = go.Figure()
                 output_card = dbc.CardBody()
                 warn_a = f"데이터가 없습니다! ({type(e).__name__})"
-                os.system("sudo sysctl -w vm.drop_caches=3")
-                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a
+                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a, None
 
         else:  # 센서가 LTE 버전일 때
-            data = loader.load_lte_data(value1, value2, value3)
-            data_mod = data.copy()
-            data_mod = data_mod[["TIME", "DISTANCE"]]
-            d_time = data_mod["TIME"].iloc[-1]
-            d_dist = data_mod["DISTANCE"].iloc[-1]
+            pyramid = load_graph_pyramid(value1, value2, value3, True)
+            stats = pyramid.stats
+            governor.checkpoint()
+            # TIME, DISTANCE는 누적 값이므로 최대값이 마지막 값
+            d_time = np.nanmax(stats.max["TIME"])
+            d_dist = np.nanmax(stats.max["DISTANCE"])
 
             try:
-                # data = cleaning_data(data)
-                # 초당 그래프
-                data_per_second = data['DATE'].value_counts().reset_index()
-                data_per_second.columns = ['DATE', 'CNT']  # 'count' 대신 'CNT'로 변경
-                data_per_second.sort_values("DATE", inplace=True)
-
-                new_data_per = data_per_second['CNT'].value_counts().reset_index()
-                new_data_per.columns = ['index', 'count']
-                new_data_per.sort_values("index", inplace=True)
-
-                fig1 = go.Figure()
-                fig1.add_trace(go.Bar(x=new_data_per['index'], y=new_data_per['count'], name="data/second"))
-                fig1.update_xaxes(range=[10, 50])
-
-                numeric_columns = data.select_dtypes(include=['number']).columns
-                mean_data = data.groupby('DATE', as_index=False)[numeric_columns].mean()
-
-                start_t = data["DATE"].iloc[0]
-                end_t = data["DATE"].iloc[len(data) - 1]
-
-                # ACCEL 값 그래프
-                fig2 = go.Figure()
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_X"], mode='lines', name="ACCEL_X"))
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_Y"], mode='lines', name="ACCEL_Y"))
-                fig2.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ACCEL_Z"], mode='lines', name="ACCEL_Z"))
-                fig2.update_xaxes(range=[start_t, end_t])
-
-                # GYRO 값 그래프
-                fig3 = go.Figure()
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_X"], mode='lines', name="GYRO_X"))
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_Y"], mode='lines', name="GYRO_Y"))
-                fig3.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["GYRO_Z"], mode='lines', name="GYRO_Z"))
-                fig3.update_xaxes(range=[start_t, end_t])
-
-                # ATTITUDE 값 그래프
-                fig4 = go.Figure()
-                fig4.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["ROLL"], mode='lines', name="ROLL"))
-                fig4.add_trace(go.Scatter(x=mean_data["DATE"], y=mean_data["PITCH"], mode='lines', name="PITCH"))
-                fig4.update_xaxes(range=[start_t, end_t])
-
-                # velocity 값 그래프
-                fig5 = go.Figure()
-                fig5.add_trace(go.Scatter(x=data["DATE"], y=data["VEL"], mode='lines', name="VEL"))
-                fig5.update_xaxes(range=[start_t, end_t])
+                report_progress("render")
+                fig1, fig2, fig3, fig4, fig5 = build_figures(
+                    pyramid, stats.dates[0], stats.dates[-1], point_budget=point_budget
+                )
 
                 time_card = dbc.Card(dbc.CardBody([
                     html.H5("TIME", className="card-title"),
@@ -303,8 +651,10 @@ def register_callbacks(app, loader):
                     dbc.Col(distance_card, width=6),
                 ])
                 warn_a = " "
-                os.system("sudo sysctl -w vm.drop_caches=3")
-                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a
+                selection = [value1, value2, value3, True]
+                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a, selection
+            except JobCancelled:
+                raise
             except Exception as e:
                 print(f"LTE 데이터 로딩 실패: {type(e).__name__}: {str(e)}")
                 import traceback
@@ -316,21 +666,112 @@ def register_callbacks(app, loader):
                 fig5 = go.Figure()
                 output_card = dbc.CardBody()
                 warn_a = f"데이터가 없습니다! ({type(e).__name__})"
-                os.system("sudo sysctl -w vm.drop_caches=3")
-                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a
+                return fig1, fig2, fig3, fig4, fig5, output_card, warn_a, None
+
+    # 그래프 확대/축소
+    # 확대한 구간이 10초 이상 레벨로 픽셀 폭을 채우면 피라미드에서, 더 짧으면 초당 평균 대신 원본 샘플로 그리고,
+    # 자동 범위로 돌아가면 전체 개요로 복귀한다
+    def register_zoom_callback(graph_id, channels):
+        @app.callback(
+            Output(graph_id, 'figure', allow_duplicate=True),
+            Input(graph_id, 'relayoutData'),
+            State('graph_selection', 'data'),
+            prevent_initial_call=True
+        )
+        def zoom_graph(relayout_data, selection):
+            """
+            확대한 시간 구간의 trace만 Patch로 교체합니다.
+
+            Args:
+                relayout_data (dict): 그래프 relayoutData
+                selection (list): 그래프에 표시 중인 [날짜, 전화번호, 센서, LTE 여부]
+
+            Returns:
+                Patch: 변경된 trace의 x, y
+            """
+            window = parse_relayout_window(relayout_data)
+            if window is None or not selection:
+                raise PreventUpdate
+
+            date, phone, sensor, on = selection
+            n_out = point_budget.get(graph_id, 0)
+
+            patched = Patch()
+            pyramid = load_graph_pyramid(date, phone, sensor, on)
+            # 확대 콜백도 캐시를 채우므로 웹 서버 프로세스의 메모리 예산을 지킨다
+            governor.enforce()
+            if window == 'reset':
+                seconds = pyramid.select_level(pixels=graph_pixels(n_out))
+                for i, channel in enumerate(channels):
+                    x, y = downsample(*pyramid.series(channel, seconds), n_out)
+                    patched['data'][i]['x'] = x
+                    patched['data'][i]['y'] = y
+                return patched
+
+            start, end = window_bounds(*window, pyramid.stats.dates.tz)
+            seconds = pyramid.select_level(start, end, graph_pixels(n_out))
+            if seconds > 1:
+                # 긴 구간은 원본을 읽지 않고 피라미드 레벨로 그린다
+                for i, channel in enumerate(channels):
+                    x, y = downsample(*pyramid.series(channel, seconds, start, end), n_out)
+                    patched['data'][i]['x'] = x
+                    patched['data'][i]['y'] = y
+            else:
+                # 짧은 확대 구간은 초 단위 중복 제거 전 원본 샘플(밀리초 단위 DATE)로 그린다
+                data = load_graph_view(date, phone, sensor, on)
+                governor.enforce()
+                window_data = slice_window(data, *window)
+                for i, channel in enumerate(channels):
+                    x, y = downsample(window_data["DATE"], window_data[channel], n_out)
+                    patched['data'][i]['x'] = x
+                    patched['data'][i]['y'] = y
+            return patched
+
+        return zoom_graph
+
+    for graph_id, channels in GRAPH_CHANNELS.items():
+        register_zoom_callback(graph_id, channels)
+
+    def load_trajectory(date, phone, sensor, on):
+        """
+        지도용 GPS 좌표를 분류하고 줌 레벨별 단순화 경로를 만들어 캐시를 거쳐 반환합니다.
+
+        Returns:
+            TrajectoryPyramid: 줌 레벨별 단순화 경로
+        """
+        def build():
+            data = load_dataset(date, phone, sensor, on)
+            report_progress("aggregate")
+            gps = data.drop_duplicates(["LAT", "LON"])
+            gps.reset_index(inplace=True, drop=True)
+            # 좌표별 상태 코드 (좌표 i -> i + 1 선분의 색)
+            status = classify_fixes(gps, jump_metres=GPS_JUMP_METRES)
+            return TrajectoryPyramid(gps["LAT"], gps["LON"], status)
+
+        return dataset_cache.get_or_load((date_key(date), phone, sensor, bool(on), 'map'), build)
+
+    def line_positions(segments):
+        """상태별 폴리라인 좌표를 MAP_LINE_IDS 순서의 출력 값으로 변환합니다."""
+        return tuple(segments[code] for code in MAP_LINE_IDS)
 
     # 지도 출력
-    @app.callback(
-        Output('map_card', 'children'),
+    @background_callback(
+        *[Output(line_id, 'positions') for line_id in MAP_LINE_IDS.values()],
         Output('map_card', 'center'),
+        Output('map_selection', 'data'),
         Input('map_button', 'n_clicks'),
         State('date_dropdown', 'value'),
         State('phone_dropdown', 'value'),
         State('sensor_dropdown', 'value'),
         State('my-boolean-switch', 'on'),
+        State('map_card', 'zoom'),
+        State('date_range', 'start_date'),
+        State('date_range', 'end_date'),
+        running=[(Output('map_button', 'disabled'), True, False)],
         prevent_initial_call=True
     )
-    def print_map(n_clicks, value1, value2, value3, on):
+    @governor.track('print_map')
+    def print_map(n_clicks, value1, value2, value3, on, zoom, start_date=None, end_date=None):
         """
         지도를 출력합니다.
 
@@ -340,60 +781,48 @@ def register_callbacks(app, loader):
             value2 (str): 선택한 전화번호
             value3 (str): 선택한 센서
             on (bool): 센서 스위치 상태
+            zoom (int): 현재 지도 줌 레벨
+            start_date (str): 기간 시작 날짜 (기간을 지정하면 날짜 대신 기간 안의 날짜를 모두 이어서 출력)
+            end_date (str): 기간 끝 날짜
 
         Returns:
-            tuple: (지도 컴포넌트 리스트, 지도 중심 좌표)
+            tuple: (상태별 폴리라인 좌표..., 지도 중심 좌표, 지도에 표시한 선택 조건)
         """
-        os.system("sudo sysctl -w vm.drop_caches=3")
+        value1 = selected_dates(value1, start_date, end_date, on)
+        if not value1:
+            raise PreventUpdate
 
-        if on == False:  # 센서가 BLE 버전일 때
-            # 선택한 라이더/날짜 경로
-            data = loader.load_ble_data(value1, value2, value3)
-        else:  # 센서가 LTE 버전일 때
-            data = loader.load_lte_data(value1, value2, value3)
+        # 상태별로 이어지는 구간을 다중 폴리라인 하나로 묶고, 줌 레벨에 맞게 단순화한다
+        trajectory = load_trajectory(value1, value2, value3, on)
+        governor.checkpoint()
 
-        gps = data.drop_duplicates(["LAT", "LON"])
-        gps.reset_index(inplace=True, drop=True)
+        center_list = [trajectory.lat[trajectory.lat.size // 2], trajectory.lon[trajectory.lon.size // 2]]
+        selection = [value1, value2, value3, bool(on)]
+        return (*line_positions(trajectory.segments(zoom)), center_list, selection)
 
-        center_list = [gps["LAT"].loc[len(gps) // 2], gps["LON"].loc[len(gps) // 2]]
+    # 지도 확대/이동
+    # 확대할수록 더 촘촘한 단순화 레벨을, 화면 근처의 구간만 보낸다
+    @app.callback(
+        *[Output(line_id, 'positions', allow_duplicate=True) for line_id in MAP_LINE_IDS.values()],
+        Input('map_card', 'zoom'),
+        Input('map_card', 'bounds'),
+        State('map_selection', 'data'),
+        prevent_initial_call=True
+    )
+    def refine_map(zoom, bounds, selection):
+        """
+        현재 줌 레벨과 화면 영역에 맞는 경로로 폴리라인을 교체합니다.
 
-        gps_error = []
-        sensor_error = []
-        sensor_good = []
+        Args:
+            zoom (int): 현재 지도 줌 레벨
+            bounds (list): 화면 영역 [[남, 서], [북, 동]]
+            selection (list): 지도에 표시 중인 [날짜, 전화번호, 센서, LTE 여부]
 
-        for i in range(len(gps) - 1):
-            # if (abs(gps["LAT"].loc[i + 1] - gps["LAT"].loc[i]) >= 0.15) & (abs(gps["LON"].loc[i + 1] - gps["LON"].loc[i]) >= 0.15):
-            if (gps["LAT"].loc[i + 1] - gps["LAT"].loc[i]) ** 2 + (gps["LON"].loc[i + 1] - gps["LON"].loc[i]) ** 2 >= (
-                    0.003) ** 2:
-                gps_error.append(
-                    dl.CircleMarker(center=[gps["LAT"].loc[i], gps["LON"].loc[i]], color='red', fillColor="red",
-                                    radius=2))
-            else:
-                try:
-                    if (gps["ACCEL_X"].loc[i] == 0) & (gps["ACCEL_Y"].loc[i] == 0) & (gps["ACCEL_Z"].loc[i] == 0):
-                        sensor_error.append(
-                            dl.CircleMarker(center=[gps["LAT"].loc[i], gps["LON"].loc[i]], color='orange',
-                                            fillColor="orange", radius=2))
-                    else:
-                        sensor_good.append(
-                            dl.CircleMarker(center=[gps["LAT"].loc[i], gps["LON"].loc[i]], color='green',
-                                            fillColor="green", radius=2))
-                except:
-                    sensor_good.append(
-                        dl.CircleMarker(center=[gps["LAT"].iloc[i], gps["LON"].loc[i]], color='green',
-                                        fillColor='green', radius=2))
-
-        component_list = [
-            dl.LayersControl([
-                dl.BaseLayer(dl.TileLayer(
-                    url="https://tiles.stadiamaps.com/tiles/outdoors/{z}/{x}/{y}{r}.png?api_key=93889be7-805e-4f44-9874-773f0117da64"),
-                    name="Outdoors",
-                    checked=True, ),
-                dl.Overlay(dl.LayerGroup(gps_error), name="GPS jump", checked=True),
-                dl.Overlay(dl.LayerGroup(sensor_error), name="센서 미연결", checked=True),
-                dl.Overlay(dl.LayerGroup(sensor_good), name="센서 연결", checked=True),
-            ]
-            )
-        ]
-        os.system("sudo sysctl -w vm.drop_caches=3")
-        return component_list, center_list
+        Returns:
+            tuple: 상태별 폴리라인 좌표
+        """
+        if not selection:
+            raise PreventUpdate
+        trajectory = load_trajectory(*selection)
+        governor.enforce()
+        return line_positions(trajectory.segments(zoom, bounds))
@@ -11,6 +11,25 @@ import pytz
 # 로컬 타임존 설정
 local_tz = pytz.timezone('Asia/Seoul')
 
+# 원본(Parquet/DocumentDB) 컬럼 목록
+BLE_RAW_COLUMNS = [
+    "time", "sensor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
+    "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VELOCITY", "ALTITUDE", "BEARING"
+]
+LTE_RAW_COLUMNS = BLE_RAW_COLUMNS + ["TIME", "DISTANCE"]
+
+# cleaning_data가 제거하는 타임존 이상 차분값 (9시간, 9시간 1초; 나노초)
+_TZ_JUMP_NS = np.array([32400000000000, 32401000000000], dtype=np.int64)
+
+# 원본 컬럼명 -> 표준 컬럼명
+COLUMN_RENAME = {
+    "time": "DATE",
+    "sensor_id": "senor_id",
+    "VELOCITY": "VEL",
+    "ALTITUDE": "ALT",
+    "BEARING": "HEAD",
+}
+
 
 def cleaning_data(data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -20,36 +39,52 @@ def cleaning_data(data: pd.DataFrame) -> pd.DataFrame:
     이는 9시간(32400초 = 9시간 * 3600초/시간 * 1000밀리초/초 * 1000000나노초/밀리초)의
     시간차이를 나타내며, 타임존 관련 이상값을 제거하기 위함입니다.
 
+    행을 지우면 새로 이웃하게 된 두 행의 차분이 다시 9시간이 될 수 있으므로, 더 이상 지울 행이
+    없을 때까지 반복합니다. 매 반복마다 전체 프레임을 복사하고 차분을 다시 계산하는 대신,
+    행 위치의 연결 리스트(prev/next 배열)에서 이번에 지운 구간의 양옆 쌍만 다시 검사하고
+    마지막에 한 번만 행을 골라냅니다. 각 반복에서 지우는 행은 기존 구현과 같습니다
+    (행 위치 기준, 한 반복에서 조건을 만족하는 쌍의 앞 행을 모두 지움).
+
     Args:
         data (pd.DataFrame): 정제할 데이터프레임 (DATE 컬럼 필수)
 
     Returns:
-        pd.DataFrame: 정제된 데이터프레임
+        pd.DataFrame: 정제된 데이터프레임 (인덱스 0부터 재설정)
     """
-    # np.where 함수를 이용해 DATE 컬럼을 차분해서 값이 32400000000000인 인덱스만 리스트 형태로 리턴받는다.
-    over_9_idx_list = list(
-        np.where(
-            (np.diff(data["DATE"]).astype(np.int64) == 32400000000000) |
-            (np.diff(data["DATE"]).astype(np.int64) == 32401000000000)
-        )[0]
-    )
-
-    while True:
-        if len(over_9_idx_list) != 0:
-            data = data.drop(over_9_idx_list)
-            data.reset_index(inplace=True, drop=True)
-            over_9_idx_list = list(
-                np.where(
-                    (np.diff(data["DATE"]).astype(np.int64) == 32400000000000) |
-                    (np.diff(data["DATE"]).astype(np.int64) == 32401000000000)
-                )[0]
-            )
-        elif len(over_9_idx_list) == 0:
-            break
-
-    data.reset_index(inplace=True, drop=True)
-
-    return data
+    dates = data["DATE"].values.astype("datetime64[ns]").astype(np.int64)
+    n = len(dates)
+    keep = np.ones(n, dtype=bool)
+
+    if n > 1:
+        prev = np.arange(-1, n - 1)
+        nxt = np.arange(1, n + 1)
+
+        # np.diff로 DATE 차분이 9시간(또는 9시간 1초)인 쌍의 앞 행 위치를 찾는다
+        removed = np.flatnonzero(np.isin(np.diff(dates), _TZ_JUMP_NS))
+
+        while removed.size:
+            keep[removed] = False
+
+            # 이번에 지운 행들이 이루는 연속 구간의 시작/끝
+            before = prev[removed]
+            after = nxt[removed]
+            run_start = removed[(before < 0) | keep[np.maximum(before, 0)]]
+            run_end = removed[(after >= n) | keep[np.minimum(after, n - 1)]]
+
+            # 구간 양옆의 남은 행끼리 연결
+            left = prev[run_start]
+            right = nxt[run_end]
+            has_left = left >= 0
+            has_right = right < n
+            nxt[left[has_left]] = right[has_left]
+            prev[right[has_right]] = left[has_right]
+
+            # 새로 이웃하게 된 쌍만 다시 검사
+            both = has_left & has_right
+            left, right = left[both], right[both]
+            removed = left[np.isin(dates[right] - dates[left], _TZ_JUMP_NS)]
+
+    return data.iloc[np.flatnonzero(keep)].reset_index(drop=True)
 
 
 def convert_timestamp_to_datetime(timestamp: int, timezone: pytz.timezone = local_tz) -> str:
@@ -66,44 +101,90 @@ def convert_timestamp_to_datetime(timestamp: int, timezone: pytz.timezone = loca
     return datetime.fromtimestamp(timestamp / 1000, tz=timezone).strftime('%Y-%m-%d %H:%M:%S')
 
 
-def process_raw_data(df: pd.DataFrame, timezone: pytz.timezone = local_tz) -> pd.DataFrame:
+def normalize_timestamp(time: pd.Series, timezone: pytz.timezone = local_tz, floor_seconds: bool = True) -> pd.Series:
+    """
+    밀리초 단위 epoch 타임스탬프 컬럼을 초 단위로 절삭된 tz-aware datetime64 컬럼으로 변환합니다.
+
+    `convert_timestamp_to_datetime` 을 행마다 호출한 뒤 `pd.to_datetime` 으로 다시 파싱하던
+    기존 경로와 같은 벽시계 시각을 돌려주지만, 문자열을 거치지 않고 NumPy 정수 연산으로 처리합니다.
+
+    Args:
+        time (pd.Series): 밀리초 단위 타임스탬프 컬럼
+        timezone (pytz.timezone): 변환할 시간대 (기본값: Asia/Seoul)
+        floor_seconds (bool): False면 초 단위로 절삭하지 않고 밀리초까지 유지 (기본값: True)
+
+    Returns:
+        pd.Series: datetime64[ns, timezone] 컬럼 (인덱스 유지)
+    """
+    millis = time.to_numpy(dtype=np.int64)
+    if floor_seconds:
+        # strftime('%S')가 소수점 이하를 버리던 동작과 같도록 초 단위로 내림
+        millis = np.floor_divide(millis, 1000) * 1000
+    dates = pd.to_datetime(millis, unit='ms', utc=True).tz_convert(timezone).as_unit('ns')
+    return pd.Series(dates, index=time.index, name=time.name)
+
+
+def process_raw_data(df: pd.DataFrame, timezone: pytz.timezone = local_tz, deduplicate: bool = True) -> pd.DataFrame:
     """
     원시 센서 데이터를 처리합니다.
 
-    - 시간 컬럼을 밀리초 타임스탬프에서 datetime 문자열로 변환
+    - 시간 컬럼을 밀리초 타임스탬프에서 tz-aware datetime으로 변환 (초 단위로 절삭)
     - 컬럼명을 표준 형식으로 변경
     - 인덱스 리셋
-    - datetime 타입으로 변환
-    - 중복 제거
+    - 중복 제거 (초 단위로 절삭한 DATE마다 첫 샘플만 남김)
+
+    deduplicate=False면 DATE를 절삭하지 않고 밀리초까지 유지한 모든 샘플을 반환합니다.
+    초당 집계(second_summary)와 그래프 확대 구간의 원본 샘플에 쓰며, drop_second_duplicates를 거치면
+    deduplicate=True와 같은 데이터가 됩니다.
+
+    BLE(15개 컬럼)와 LTE(TIME, DISTANCE 포함 17개 컬럼) 데이터 모두 처리합니다.
 
     Args:
         df (pd.DataFrame): 처리할 원시 데이터프레임
         timezone (pytz.timezone): 시간대 (기본값: Asia/Seoul)
+        deduplicate (bool): False면 중복 제거 전 모든 샘플을 밀리초 단위 DATE로 반환 (기본값: True)
 
     Returns:
         pd.DataFrame: 처리된 데이터프레임
     """
-    # 시간 정렬
-    df.sort_values(by=['time'], ascending=True, inplace=True)
+    # 시간 정렬 (이미 time 순으로 저장된 파일은 정렬을 건너뛴다, 같은 time은 원래 순서 유지)
+    if df['time'].is_monotonic_increasing:
+        df = df.copy(deep=False)
+    else:
+        df = df.sort_values(by=['time'], ascending=True, kind='stable')
 
-    # 타임스탬프를 datetime 문자열로 변환
-    df['time'] = df['time'].apply(
-        lambda x: datetime.fromtimestamp(x / 1000, tz=timezone).strftime('%Y-%m-%d %H:%M:%S')
-    )
+    # 타임스탬프를 datetime으로 변환
+    df['time'] = normalize_timestamp(df['time'], timezone, floor_seconds=deduplicate)
 
     # 컬럼명 표준화
-    df.columns = [
-        "DATE", "senor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-        "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VEL", "ALT", "HEAD"
-    ]
+    df = df.rename(columns=COLUMN_RENAME)
 
     # 인덱스 리셋
     df = df.reset_index(drop=True)
 
-    # DATE를 datetime 타입으로 변환
-    df["DATE"] = pd.to_datetime(df["DATE"])
-
     # 중복 제거
-    df.drop_duplicates(subset='DATE', inplace=True)
+    if deduplicate:
+        df.drop_duplicates(subset='DATE', inplace=True)
 
     return df
+
+
+def drop_second_duplicates(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    초 단위 중복 제거 전 원본 샘플에서 초마다 첫 샘플만 남기고 DATE를 초 단위로 절삭합니다.
+
+    process_raw_data(deduplicate=False)로 한 번 로드한 원본에서 process_raw_data(deduplicate=True)와
+    같은 데이터를 만들 때 사용합니다.
+
+    Args:
+        data (pd.DataFrame): process_raw_data(deduplicate=False)를 거친 원본 샘플 (DATE 밀리초 단위, 시간순)
+
+    Returns:
+        pd.DataFrame: 초마다 첫 샘플만 남긴 데이터프레임 (인덱스 유지)
+    """
+    if data.empty:
+        return data
+    millis = np.floor_divide(data["DATE"].values.astype("datetime64[ns]").astype(np.int64), 1_000_000)
+    keep = ~pd.Series(np.floor_divide(millis, 1000)).duplicated().to_numpy()
+    dates = normalize_timestamp(pd.Series(millis[keep], index=data.index[keep]), data["DATE"].dt.tz)
+    return data[keep].assign(DATE=dates)
@@ -0,0 +1,166 @@
+"""
+데이터셋 캐시 모듈
+정규화된 DataFrame을 (날짜, 전화번호, 센서, LTE 여부) 단위로 메모리에 보관해 콜백들이 공유합니다.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    캐시 값이 차지하는 메모리를 추정합니다.
+
+    Args:
+        value: DataFrame, Series, ndarray, nbytes 속성을 가진 객체 또는 이들을 담은 dict/list/tuple
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class DatasetCache:
+    """
+    스레드 안전한 메모리 용량 제한 LRU 캐시 클래스
+
+    update_graph와 print_map이 같은 (date, phone, sensor, is_lte) 데이터를 두 번 내려받지 않도록
+    로드 결과를 공유합니다. 캐시된 DataFrame은 여러 콜백이 함께 쓰므로 제자리 수정하면 안 됩니다.
+    프로세스 메모리에 있으므로 웹 서버 스레드와 백그라운드 작업 스레드가 공유하지만, 다른 프로세스와는 공유하지 않습니다.
+    """
+
+    def __init__(self, max_bytes: int = 1024 ** 3, name: str = "dataset"):
+        """
+        DatasetCache를 초기화합니다.
+
+        Args:
+            max_bytes (int): 캐시가 보관할 최대 바이트 수
+            name (str): 통계 출력용 이름
+        """
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes_held = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """키에 해당하는 값을 반환합니다. 없으면 default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries[key] = (entry[0], entry[1], time.monotonic())
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        """값을 저장하고, 용량을 넘으면 가장 오래 사용하지 않은 항목부터 버립니다."""
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes_held -= old[1]
+            # 캐시보다 큰 값은 보관하지 않는다
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes, time.monotonic())
+            self._bytes_held += nbytes
+            while self._bytes_held > self.max_bytes and self._entries:
+                self._pop_oldest()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        캐시에 있으면 그대로, 없으면 `load()`를 호출해 저장한 뒤 반환합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            load (Callable): 캐시 미스 때 호출할 로드 함수
+
+        Returns:
+            Any: 캐시 값
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+        value = load()
+        self.put(key, value)
+        return value
+
+    def oldest_access(self):
+        """가장 오래 사용하지 않은 항목의 마지막 사용 시각 (time.monotonic 기준, 비어 있으면 None)"""
+        with self._lock:
+            if not self._entries:
+                return None
+            return next(iter(self._entries.values()))[2]
+
+    def evict_oldest(self) -> int:
+        """
+        가장 오래 사용하지 않은 항목 하나를 버립니다.
+
+        Returns:
+            int: 해제된 바이트 수 (비어 있으면 0)
+        """
+        with self._lock:
+            if not self._entries:
+                return 0
+            return self._pop_oldest()
+
+    def _pop_oldest(self) -> int:
+        _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+        self._bytes_held -= evicted_bytes
+        self.evictions += 1
+        return evicted_bytes
+
+    def clear(self):
+        """모든 항목을 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes_held = 0
+
+    @property
+    def bytes_held(self) -> int:
+        """현재 보관 중인 바이트 수"""
+        return self._bytes_held
+
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: hits, misses, evictions, entries, bytes_held, max_bytes
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes_held": self._bytes_held,
+                "max_bytes": self.max_bytes,
+            }
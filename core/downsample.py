@@ -0,0 +1,126 @@
+"""
+시계열 다운샘플링 모듈
+그래프로 보내는 점의 수를 화면 픽셀 수준으로 줄이면서 최대/최소 같은 피크는 유지합니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _as_float_x(x) -> np.ndarray:
+    """datetime/숫자 x 값을 float 배열로 변환합니다."""
+    # tz-aware Series/DatetimeIndex도 .values는 UTC 기준 datetime64 배열이다
+    values = x.values if isinstance(x, (pd.Series, pd.Index)) else np.asarray(x)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return values.astype(np.float64)
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """
+    min/max 버킷 방식으로 남길 점의 인덱스를 반환합니다.
+
+    데이터를 n_out / 2개의 같은 크기 버킷으로 나누고, 버킷마다 최소값과 최대값 위치를 남깁니다.
+    처음과 마지막 점은 항상 포함합니다.
+
+    Args:
+        y: y 값 배열
+        n_out (int): 남길 최대 점 수
+
+    Returns:
+        np.ndarray: 오름차순 인덱스 배열
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = y.size
+    if n <= n_out or n_out < 4:
+        return np.arange(n)
+
+    n_buckets = max((n_out - 2) // 2, 1)
+    bucket = int(np.ceil(n / n_buckets))
+    padded = np.full(n_buckets * bucket, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(n_buckets, bucket)
+
+    # NaN은 최소/최대 후보에서 제외
+    nan_mask = np.isnan(rows)
+    arg_min = np.where(nan_mask, np.inf, rows).argmin(axis=1)
+    arg_max = np.where(nan_mask, -np.inf, rows).argmax(axis=1)
+    offsets = np.arange(n_buckets) * bucket
+
+    indices = np.concatenate(([0, n - 1], offsets + arg_min, offsets + arg_max))
+    return np.unique(indices[indices < n])
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 방식으로 남길 점의 인덱스를 반환합니다.
+
+    Args:
+        x: x 값 배열 (숫자 또는 datetime)
+        y: y 값 배열
+        n_out (int): 남길 점 수
+
+    Returns:
+        np.ndarray: 오름차순 인덱스 배열
+    """
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    n = y.size
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = _as_float_x(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점
+        next_start, next_end = edges[i + 1], (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[next_start:next_end].mean() if next_end > next_start else x[-1]
+        avg_y = y[next_start:next_end].mean() if next_end > next_start else y[-1]
+
+        # 이전 선택점, 평균점과 만드는 삼각형 넓이가 가장 큰 점
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax()) if area.size else start
+        indices[i + 1] = a
+
+    return np.unique(indices)
+
+
+def downsample(x, y, n_out: int, method: str = "minmax"):
+    """
+    (x, y) 시계열을 최대 n_out개 점으로 줄입니다.
+
+    Args:
+        x: x 값 (배열, Series, DatetimeIndex)
+        y: y 값
+        n_out (int): 남길 최대 점 수 (0 이하이면 줄이지 않음)
+        method (str): 'minmax' 또는 'lttb'
+
+    Returns:
+        tuple: (x, y) 줄어든 값
+    """
+    n = len(y)
+    if n_out <= 0 or n <= n_out:
+        return x, y
+
+    if method == "lttb":
+        indices = lttb_indices(x, y, n_out)
+    elif method == "minmax":
+        indices = minmax_indices(y, n_out)
+    else:
+        raise ValueError(f"지원하지 않는 다운샘플링 방식: {method}")
+
+    return _take(x, indices), _take(y, indices)
+
+
+def _take(values, indices):
+    if hasattr(values, "iloc"):
+        return values.iloc[indices]
+    if hasattr(values, "take"):
+        return values.take(indices)
+    return np.asarray(values)[indices]
@@ -0,0 +1,167 @@
+"""
+경로 단순화 모듈
+Douglas-Peucker 중요도를 한 번 계산해 두고, 지도 줌 레벨별로 필요한 꼭짓점만 골라 보냅니다.
+"""
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from core.gps_quality import STATUS_NONE
+from core.map_layers import status_segments
+
+
+# 미리 계산하는 줌 레벨 (이보다 더 확대하면 원본 좌표를 그대로 사용)
+LEVEL_ZOOMS = (8, 10, 12, 14, 16)
+
+# 허용 오차 (화면 픽셀)
+PIXEL_TOLERANCE = 0.5
+
+
+def zoom_tolerance(zoom: float, pixels: float = PIXEL_TOLERANCE) -> float:
+    """
+    줌 레벨에서 화면 픽셀 수에 해당하는 거리를 도(degree) 단위로 반환합니다.
+
+    Args:
+        zoom (float): Leaflet 줌 레벨
+        pixels (float): 허용 오차 (픽셀)
+
+    Returns:
+        float: 허용 오차 (도)
+    """
+    return 360.0 / (256 * 2 ** zoom) * pixels
+
+
+def douglas_peucker_importance(x, y, pinned=None) -> np.ndarray:
+    """
+    Douglas-Peucker 방식으로 꼭짓점마다 중요도를 계산합니다.
+
+    중요도가 tolerance 이상인 꼭짓점만 남기면 그 tolerance로 Douglas-Peucker를 실행한
+    결과와 같습니다. 자식 구간의 중요도는 부모보다 크지 않도록 잘라 레벨 간 포함 관계를 유지합니다.
+
+    Args:
+        x: x 좌표 배열
+        y: y 좌표 배열
+        pinned: 항상 남길 꼭짓점 인덱스 (해당 위치에서 구간을 나눠 따로 단순화)
+
+    Returns:
+        np.ndarray: 꼭짓점별 중요도 (고정 꼭짓점은 inf)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    importance = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return importance
+
+    anchors = np.unique(np.concatenate(([0, n - 1], np.asarray(pinned if pinned is not None else [], dtype=np.int64))))
+    importance[anchors] = np.inf
+
+    # (시작, 끝, 부모 중요도) 구간 스택
+    stack = [(int(a), int(b), np.inf) for a, b in zip(anchors[:-1], anchors[1:]) if b - a > 1]
+    while stack:
+        start, end, parent = stack.pop()
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        if length > 0:
+            dist = np.abs(dx * py - dy * px) / length
+        else:
+            dist = np.hypot(px, py)
+        k = int(dist.argmax())
+        split = start + 1 + k
+        value = min(float(dist[k]), parent)
+        importance[split] = value
+        if split - start > 1:
+            stack.append((start, split, value))
+        if end - split > 1:
+            stack.append((split, end, value))
+    return importance
+
+
+class TrajectoryPyramid:
+    """
+    줌 레벨별 단순화 경로 클래스
+
+    상태(GPS jump, 센서 미연결, 정상)가 바뀌는 꼭짓점은 모든 레벨에 남기므로
+    단순화해도 구간 색상은 원본과 같습니다.
+    """
+
+    def __init__(self, lat, lon, status, level_zooms: Sequence[int] = LEVEL_ZOOMS):
+        """
+        TrajectoryPyramid를 생성합니다.
+
+        Args:
+            lat: 위도 배열
+            lon: 경도 배열
+            status: 좌표별 상태 코드 (classify_fixes 결과)
+            level_zooms (Sequence[int]): 미리 계산할 줌 레벨
+        """
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.status = np.asarray(status)
+
+        # 상태가 바뀌는 위치는 항상 남긴다
+        change = np.flatnonzero(np.diff(self.status)) + 1
+        # 위경도 평면 왜곡을 줄이기 위해 경도에 cos(위도)를 곱해 거리를 계산
+        scale = np.cos(np.radians(np.nanmean(self.lat))) if self.lat.size else 1.0
+        self.importance = douglas_peucker_importance(self.lon * scale, self.lat, pinned=change)
+
+        self.level_zooms = tuple(sorted(level_zooms))
+        self.levels: Dict[int, np.ndarray] = {
+            zoom: np.flatnonzero(self.importance >= zoom_tolerance(zoom)) for zoom in self.level_zooms
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 배열의 바이트 수 (캐시 용량 계산용)"""
+        arrays = [self.lat, self.lon, self.status, self.importance, *self.levels.values()]
+        return sum(a.nbytes for a in arrays)
+
+    def level_indices(self, zoom: Optional[float]) -> np.ndarray:
+        """
+        줌 레벨에 맞는 꼭짓점 인덱스를 반환합니다.
+
+        Args:
+            zoom (float, optional): 현재 줌 레벨 (None이면 가장 거친 레벨)
+
+        Returns:
+            np.ndarray: 오름차순 꼭짓점 인덱스
+        """
+        if zoom is None:
+            return self.levels[self.level_zooms[0]]
+        for level in self.level_zooms:
+            if level >= zoom:
+                return self.levels[level]
+        return np.arange(self.lat.size)
+
+    def segments(self, zoom: Optional[float] = None, bounds=None, padding: float = 0.1) -> dict:
+        """
+        줌 레벨과 화면 영역에 맞춰 단순화한 상태별 폴리라인을 반환합니다.
+
+        Args:
+            zoom (float, optional): 현재 줌 레벨
+            bounds: 화면 영역 [[남, 서], [북, 동]] (None이면 전체)
+            padding (float): 화면 영역을 각 방향으로 넓힐 비율
+
+        Returns:
+            dict: 상태 코드 -> 폴리라인 좌표 리스트
+        """
+        idx = self.level_indices(zoom)
+        lat, lon = self.lat[idx], self.lon[idx]
+        # 꼭짓점 k의 상태가 k -> k + 1 선분의 색 (사이의 원본 선분은 모두 같은 상태)
+        status = self.status[idx].astype(np.int64)
+
+        if bounds is not None and idx.size > 1:
+            (south, west), (north, east) = bounds
+            pad_lat, pad_lon = (north - south) * padding, (east - west) * padding
+            inside = ((lat >= south - pad_lat) & (lat <= north + pad_lat)
+                      & (lon >= west - pad_lon) & (lon <= east + pad_lon))
+            # 화면 밖으로 나가는 선분도 이어서 그리도록 양쪽 이웃까지 포함
+            near = inside.copy()
+            near[1:] |= inside[:-1]
+            near[:-1] |= inside[1:]
+            # 두 끝점이 모두 화면 근처인 선분만 그린다
+            drawn = near[:-1] & near[1:]
+            status[:-1] = np.where(drawn, status[:-1], STATUS_NONE)
+
+        return status_segments(lat, lon, status)
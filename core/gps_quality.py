@@ -0,0 +1,101 @@
+"""
+GPS 품질 분류 모듈
+연속한 GPS 좌표 변화량과 ACCEL 값으로 좌표마다 GPS jump / 센서 미연결 / 정상 상태를 한 번에 계산합니다.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# 좌표 상태 코드
+STATUS_NONE = -1         # 다음 좌표가 없어 판정하지 않음 (마지막 좌표)
+STATUS_GOOD = 0          # 센서 연결
+STATUS_SENSOR_ERROR = 1  # 센서 미연결 (ACCEL 값이 모두 0)
+STATUS_GPS_JUMP = 2      # 다음 좌표까지 GPS가 튐
+
+# 기존 판정 기준: 위경도 차이의 유클리드 거리 0.003도
+JUMP_DEGREES = 0.003
+
+EARTH_RADIUS_M = 6371008.8
+
+ACCEL_COLUMNS = ["ACCEL_X", "ACCEL_Y", "ACCEL_Z"]
+
+
+def haversine_metres(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    두 좌표 배열 사이의 대원 거리를 미터 단위로 계산합니다.
+
+    Args:
+        lat1, lon1: 시작 좌표 (도)
+        lat2, lon2: 끝 좌표 (도)
+
+    Returns:
+        np.ndarray: 거리 (m)
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def classify_fixes(gps: pd.DataFrame, jump_degrees: float = JUMP_DEGREES,
+                   jump_metres: Optional[float] = None) -> np.ndarray:
+    """
+    GPS 좌표마다 상태 코드를 계산합니다.
+
+    좌표 i는 다음 좌표 i + 1까지의 이동이 기준 이상이면 GPS jump, 아니면 ACCEL_X/Y/Z가
+    모두 0일 때 센서 미연결, 그 외에는 정상입니다. ACCEL 컬럼이 없으면 정상으로 봅니다.
+    마지막 좌표는 STATUS_NONE입니다.
+
+    Args:
+        gps (pd.DataFrame): LAT, LON (선택: ACCEL_X/Y/Z) 컬럼을 가진 시간순 좌표
+        jump_degrees (float): 위경도 차이(도) 기준 (jump_metres가 없을 때 사용)
+        jump_metres (float, optional): 지정하면 haversine 거리(m) 기준으로 판정
+
+    Returns:
+        np.ndarray: 좌표별 상태 코드 (int8, 길이 len(gps))
+    """
+    lat = gps["LAT"].to_numpy(dtype=np.float64)
+    lon = gps["LON"].to_numpy(dtype=np.float64)
+    status = np.full(len(gps), STATUS_NONE, dtype=np.int8)
+    if len(gps) < 2:
+        return status
+
+    if jump_metres is not None:
+        jump = haversine_metres(lat[:-1], lon[:-1], lat[1:], lon[1:]) >= jump_metres
+    else:
+        jump = np.diff(lat) ** 2 + np.diff(lon) ** 2 >= jump_degrees ** 2
+
+    if all(c in gps.columns for c in ACCEL_COLUMNS):
+        accel = gps[ACCEL_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)[:-1]
+        sensor_error = (accel == 0).all(axis=1)
+    else:
+        sensor_error = np.zeros(len(gps) - 1, dtype=bool)
+
+    status[:-1] = np.where(jump, STATUS_GPS_JUMP,
+                           np.where(sensor_error, STATUS_SENSOR_ERROR, STATUS_GOOD))
+    return status
+
+
+def quality_summary(status) -> dict:
+    """
+    상태 코드 배열을 품질 리포트용 통계로 요약합니다.
+
+    Args:
+        status: classify_fixes 결과
+
+    Returns:
+        dict: fixes(판정한 좌표 수), good, sensor_error, gps_jump 개수와 비율
+    """
+    status = np.asarray(status)
+    judged = status[status != STATUS_NONE]
+    fixes = int(judged.size)
+    counts = {
+        "good": int(np.count_nonzero(judged == STATUS_GOOD)),
+        "sensor_error": int(np.count_nonzero(judged == STATUS_SENSOR_ERROR)),
+        "gps_jump": int(np.count_nonzero(judged == STATUS_GPS_JUMP)),
+    }
+    summary = {"fixes": fixes, **counts}
+    for name, count in counts.items():
+        summary[f"{name}_ratio"] = count / fixes if fixes else 0.0
+    return summary
@@ -0,0 +1,60 @@
+"""
+지도 레이어 모듈
+GPS 좌표를 상태(GPS jump, 센서 미연결, 센서 연결)별 다중 폴리라인으로 묶어 지도에 보내는 데이터를 줄입니다.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from core.gps_quality import STATUS_GOOD, STATUS_SENSOR_ERROR, STATUS_GPS_JUMP
+
+
+# 상태 코드 -> (오버레이 이름, 색상)
+STATUS_STYLES = {
+    STATUS_GPS_JUMP: ("GPS jump", "red"),
+    STATUS_SENSOR_ERROR: ("센서 미연결", "orange"),
+    STATUS_GOOD: ("센서 연결", "green"),
+}
+
+# 상태 코드 -> 지도 폴리라인 컴포넌트 ID
+MAP_LINE_IDS = {
+    STATUS_GPS_JUMP: "map_gps_jump",
+    STATUS_SENSOR_ERROR: "map_sensor_error",
+    STATUS_GOOD: "map_sensor_good",
+}
+
+# 좌표 소수점 자리수 (6자리 ≈ 0.1m)
+COORD_DECIMALS = 6
+
+
+def status_segments(lat, lon, status) -> Dict[int, List[list]]:
+    """
+    좌표를 같은 상태가 이어지는 구간별 폴리라인으로 묶습니다.
+
+    좌표 i의 상태는 i에서 i + 1로 가는 선분의 색이 됩니다. 같은 상태의 연속 선분은
+    하나의 폴리라인으로 합쳐지므로 점 하나마다 컴포넌트를 만들 필요가 없습니다.
+
+    Args:
+        lat: 위도 배열
+        lon: 경도 배열
+        status: 좌표별 상태 코드 배열 (classify_fixes 결과, 음수는 그리지 않음)
+
+    Returns:
+        dict: 상태 코드 -> 폴리라인 좌표 리스트 ([[[lat, lon], ...], ...])
+    """
+    coords = np.column_stack((np.asarray(lat, dtype=np.float64),
+                              np.asarray(lon, dtype=np.float64))).round(COORD_DECIMALS)
+    n_segments = len(coords) - 1
+    segments = {code: [] for code in STATUS_STYLES}
+    if n_segments < 1:
+        return segments
+
+    status = np.asarray(status)[:n_segments]
+    # 상태가 바뀌는 위치로 구간(run)을 나눈다
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(status)) + 1))
+    ends = np.append(starts[1:], n_segments)
+    for start, end, code in zip(starts, ends, status[starts]):
+        if int(code) in segments:
+            # 구간의 마지막 선분 끝점(end)까지 포함
+            segments[int(code)].append(coords[start:end + 1].tolist())
+    return segments
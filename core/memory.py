@@ -0,0 +1,203 @@
+"""
+메모리 관리 모듈
+로드된 데이터와 캐시가 차지하는 메모리를 추적하고, 프로세스 전체 메모리 예산을 지킵니다.
+"""
+import ctypes
+import ctypes.util
+import functools
+import gc
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """
+    현재 프로세스의 RSS(상주 메모리)를 바이트 단위로 반환합니다.
+    /proc를 읽을 수 없으면 지금까지의 최대 RSS를 대신 반환합니다.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    """프로세스 시작 이후 최대 RSS를 바이트 단위로 반환합니다."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _load_malloc_trim():
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        return getattr(ctypes.CDLL(libc_name), "malloc_trim", None)
+    except OSError:
+        return None
+
+
+_malloc_trim = _load_malloc_trim()
+
+
+def release_memory():
+    """
+    순환 참조를 정리하고, glibc에서는 malloc_trim으로 비어 있는 힙을 OS에 돌려줍니다.
+
+    OS 페이지 캐시(vm.drop_caches)는 건드리지 않으므로 같은 호스트의 다른 파일 캐시 성능에
+    영향을 주지 않습니다.
+    """
+    gc.collect()
+    if _malloc_trim is not None:
+        _malloc_trim(0)
+
+
+def format_bytes(nbytes: float) -> str:
+    """바이트 수를 읽기 쉬운 문자열로 변환합니다."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.1f}{unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f}TB"
+
+
+class RequestMemory:
+    """요청 하나의 메모리 사용 기록"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rss_start = current_rss()
+        self.rss_peak = self.rss_start
+        self.rss_end = self.rss_start
+        self.started_at = time.perf_counter()
+        self.elapsed = 0.0
+
+    def sample(self) -> int:
+        rss = current_rss()
+        self.rss_peak = max(self.rss_peak, rss)
+        return rss
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rss_start": self.rss_start,
+            "rss_peak": self.rss_peak,
+            "rss_end": self.rss_end,
+            "elapsed": self.elapsed,
+        }
+
+
+class MemoryGovernor:
+    """
+    프로세스 메모리 예산 관리 클래스
+
+    등록된 캐시(DatasetCache 등)의 보관 바이트를 합산하고, RSS가 예산을 넘으면
+    모든 캐시를 통틀어 가장 오래 사용하지 않은 항목부터 버립니다.
+    캐시는 `bytes_held`, `oldest_access()`, `evict_oldest()`를 제공해야 합니다.
+    RSS와 캐시는 이 객체를 만든 프로세스의 것이므로, 캐시를 채우는 콜백과 같은 프로세스에서 사용해야 합니다.
+    """
+
+    def __init__(self, budget_bytes: int = 2 * 1024 ** 3, verbose: bool = False):
+        """
+        MemoryGovernor를 초기화합니다.
+
+        Args:
+            budget_bytes (int): 프로세스 전체 메모리 예산 (바이트)
+            verbose (bool): True면 요청마다 메모리 사용량을 출력한다 (기본값: False, 기록은 last_request로 확인)
+        """
+        self.budget_bytes = budget_bytes
+        self.verbose = verbose
+        self._caches: List = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.last_request: Optional[RequestMemory] = None
+
+    def register(self, cache):
+        """예산 관리 대상 캐시를 등록합니다."""
+        with self._lock:
+            if cache not in self._caches:
+                self._caches.append(cache)
+        return cache
+
+    def bytes_held(self) -> int:
+        """등록된 캐시들이 보관 중인 총 바이트 수"""
+        return sum(cache.bytes_held for cache in self._caches)
+
+    def enforce(self) -> int:
+        """
+        RSS가 예산을 넘으면 가장 오래 사용하지 않은 캐시 항목부터 버립니다.
+        항목을 버렸거나 RSS가 예산을 넘었을 때만 release_memory()로 해제한 메모리를 OS에 돌려줍니다
+        (예산 안에서는 요청 경로에 gc.collect / malloc_trim 비용을 더하지 않음).
+
+        Returns:
+            int: 버린 항목의 총 바이트 수
+        """
+        excess = current_rss() - self.budget_bytes
+        freed = 0
+        with self._lock:
+            while freed < excess:
+                candidates = [(cache.oldest_access(), i) for i, cache in enumerate(self._caches)]
+                candidates = [(t, i) for t, i in candidates if t is not None]
+                if not candidates:
+                    break
+                _, coldest = min(candidates)
+                freed += self._caches[coldest].evict_oldest()
+        if freed or excess > 0:
+            release_memory()
+        return freed
+
+    def checkpoint(self) -> int:
+        """현재 요청의 RSS를 기록하고 반환합니다 (요청 중 최대값 추적용)."""
+        request = getattr(self._local, "request", None)
+        return request.sample() if request is not None else current_rss()
+
+    def current_request(self) -> Optional[RequestMemory]:
+        """현재 스레드에서 진행 중인 요청 기록"""
+        return getattr(self._local, "request", None)
+
+    def track(self, name: str):
+        """
+        콜백 함수의 메모리 사용량을 기록하고, 끝나면 예산을 지키는 데코레이터 (enforce)
+
+        Args:
+            name (str): 출력용 요청 이름
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                request = RequestMemory(name)
+                self._local.request = request
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    request.sample()
+                    self._local.request = None
+                    self.enforce()
+                    request.rss_end = current_rss()
+                    request.elapsed = time.perf_counter() - request.started_at
+                    self.last_request = request
+                    if self.verbose:
+                        print(
+                            f"[메모리] {name}: RSS {format_bytes(request.rss_end)} "
+                            f"(요청 중 최대 {format_bytes(request.rss_peak)}, "
+                            f"시작 대비 {format_bytes(request.rss_peak - request.rss_start)}), "
+                            f"캐시 {format_bytes(self.bytes_held())} / 예산 {format_bytes(self.budget_bytes)}, "
+                            f"{request.elapsed:.2f}s"
+                        )
+            return wrapper
+        return decorator
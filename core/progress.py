@@ -0,0 +1,118 @@
+"""
+진행 상태 보고 모듈
+로더와 콜백이 작업 단계(다운로드, 변환, 집계, 그리기)를 알리면, 현재 스레드에 등록된 보고 함수로 전달합니다.
+현재 스레드의 작업이 취소되었으면 단계를 알리는 시점에 JobCancelled를 발생시켜 작업을 멈춥니다 (협조적 취소).
+"""
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+# 작업 단계 -> 화면에 표시할 문구
+PROGRESS_MESSAGES = {
+    "download": "데이터 다운로드 중...",
+    "parse": "데이터 변환 중...",
+    "aggregate": "데이터 집계 중...",
+    "render": "그래프 생성 중...",
+}
+
+_local = threading.local()
+
+
+class JobCancelled(Exception):
+    """현재 스레드의 작업이 취소됨 (report_progress / check_cancelled에서 발생)"""
+
+
+def check_cancelled():
+    """현재 스레드의 작업이 취소되었으면 JobCancelled를 발생시킵니다."""
+    cancelled = getattr(_local, "cancelled", None)
+    if cancelled is not None and cancelled.is_set():
+        raise JobCancelled()
+
+
+def report_progress(stage: str):
+    """
+    현재 스레드의 보고 함수에 작업 단계를 알립니다. 등록된 보고 함수가 없으면 아무것도 하지 않습니다.
+    작업이 취소되었으면 알리는 대신 JobCancelled를 발생시킵니다.
+
+    Args:
+        stage (str): 작업 단계 (PROGRESS_MESSAGES의 키)
+    """
+    check_cancelled()
+    reporter = getattr(_local, "reporter", None)
+    if reporter is not None:
+        reporter(stage)
+
+
+@contextmanager
+def progress_reporter(reporter: Optional[Callable[[str], None]]):
+    """
+    with 블록 동안 현재 스레드의 보고 함수를 바꿉니다.
+
+    Args:
+        reporter (Callable, optional): 작업 단계를 받는 함수
+    """
+    previous = getattr(_local, "reporter", None)
+    _local.reporter = reporter
+    try:
+        yield
+    finally:
+        _local.reporter = previous
+
+
+@contextmanager
+def cancel_scope(cancelled: Optional[threading.Event]):
+    """
+    with 블록 동안 현재 스레드의 취소 신호를 바꿉니다.
+
+    Args:
+        cancelled (threading.Event, optional): set되면 작업을 취소하는 이벤트
+    """
+    previous = getattr(_local, "cancelled", None)
+    _local.cancelled = cancelled
+    try:
+        yield
+    finally:
+        _local.cancelled = previous
+
+
+def bind_context(func: Callable) -> Callable:
+    """
+    현재 스레드의 보고 함수와 취소 신호를 다른 스레드(스레드 풀)에서 호출할 함수에도 적용하는 래퍼를 만듭니다.
+
+    Args:
+        func (Callable): 다른 스레드에서 호출할 함수
+
+    Returns:
+        Callable: 호출한 스레드의 보고 함수와 취소 신호 아래에서 func를 실행하는 함수
+    """
+    reporter = getattr(_local, "reporter", None)
+    cancelled = getattr(_local, "cancelled", None)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with progress_reporter(reporter), cancel_scope(cancelled):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def with_progress(func, messages: Dict[str, str] = PROGRESS_MESSAGES):
+    """
+    Dash 백그라운드 콜백의 set_progress를 보고 함수로 등록하는 래퍼를 만듭니다.
+
+    래퍼는 첫 인자로 set_progress를 받고, 나머지 인자로 원래 콜백을 호출합니다.
+    콜백과 로더 안의 report_progress 호출이 단계 문구로 바뀌어 화면에 표시됩니다.
+
+    Args:
+        func (Callable): 원래 콜백 함수
+        messages (Dict[str, str]): 작업 단계 -> 표시 문구
+
+    Returns:
+        Callable: set_progress를 첫 인자로 받는 콜백 함수
+    """
+    @functools.wraps(func)
+    def wrapper(set_progress, *args, **kwargs):
+        with progress_reporter(lambda stage: set_progress(messages.get(stage, stage))):
+            return func(*args, **kwargs)
+    return wrapper
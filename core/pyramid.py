@@ -0,0 +1,168 @@
+"""
+시계열 피라미드 모듈
+초당 집계 결과를 10초 / 1분 / 10분 단위로 한 번 더 묶어 두고, 그래프의 보이는 구간과 픽셀 폭에 맞는
+가장 거친 레벨만 그려 보이는 구간이 길어져도 그리는 점의 수가 일정하게 유지되도록 합니다.
+"""
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.aggregation import PerSecondStats, epoch_seconds
+
+
+# 레벨 (초): 1초는 초당 집계 결과 그대로
+LEVEL_SECONDS = (1, 10, 60, 600)
+
+
+class PyramidLevel(NamedTuple):
+    """피라미드 레벨 하나 (구간당 한 행)"""
+    seconds: int                     # 구간 길이 (초)
+    dates: pd.DatetimeIndex          # 각 구간의 시작 시각 (tz-aware)
+    count: np.ndarray                # 구간의 샘플 수
+    mean: Dict[str, np.ndarray]      # 채널별 구간 평균 (샘플 수 가중)
+    low: Dict[str, np.ndarray]       # 채널별 구간 안 초당 평균의 최소
+    high: Dict[str, np.ndarray]      # 채널별 구간 안 초당 평균의 최대
+
+
+def select_level(span_seconds: float, pixels: int, level_seconds: Sequence[int] = LEVEL_SECONDS) -> int:
+    """
+    보이는 구간을 그릴 때 픽셀 폭을 채우는 가장 거친 레벨을 고릅니다.
+
+    Args:
+        span_seconds (float): 보이는 구간 길이 (초)
+        pixels (int): 그래프 픽셀 폭 (구간 수가 이 이상이어야 함)
+        level_seconds (Sequence[int]): 사용할 수 있는 레벨 (초)
+
+    Returns:
+        int: 레벨 (초), 어느 레벨도 채우지 못하면 가장 세밀한 레벨
+    """
+    levels = sorted(level_seconds)
+    chosen = levels[0]
+    for seconds in levels:
+        if span_seconds / seconds >= pixels:
+            chosen = seconds
+    return chosen
+
+
+def _reduce_level(seconds: int, stats: PerSecondStats, epoch: np.ndarray) -> PyramidLevel:
+    """초당 집계 결과를 `seconds` 초 구간으로 묶습니다."""
+    keys = np.floor_divide(epoch, seconds)
+    if keys.size == 0:
+        starts = np.array([], dtype=np.int64)
+    else:
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+
+    count = np.add.reduceat(stats.count, starts) if starts.size else stats.count[:0]
+    means, lows, highs = {}, {}, {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for channel, values in stats.mean.items():
+            if not starts.size:
+                means[channel] = lows[channel] = highs[channel] = values[:0]
+                continue
+            valid = ~np.isnan(values)
+            weights = np.where(valid, stats.count, 0)
+            sums = np.add.reduceat(np.where(valid, values * stats.count, 0.0), starts)
+            total = np.add.reduceat(weights, starts)
+            means[channel] = np.where(total > 0, sums / total, np.nan)
+            lows[channel] = np.fmin.reduceat(values, starts)
+            highs[channel] = np.fmax.reduceat(values, starts)
+
+    dates = pd.to_datetime(keys[starts] * seconds, unit="s").as_unit("ns")
+    if stats.dates.tz is not None:
+        dates = dates.tz_localize("UTC").tz_convert(stats.dates.tz)
+    return PyramidLevel(seconds, dates, count, means, lows, highs)
+
+
+class StatsPyramid:
+    """
+    초당 집계 결과의 다중 해상도 피라미드 클래스
+
+    1초 레벨은 초당 평균을 그대로 그리고, 더 거친 레벨은 구간마다 초당 평균의 최소/최대 두 점을 그려
+    (min/max 다운샘플링과 같은 모양) 거친 레벨에서도 피크가 사라지지 않습니다.
+    """
+
+    def __init__(self, stats: PerSecondStats, level_seconds: Sequence[int] = LEVEL_SECONDS):
+        """
+        StatsPyramid를 생성합니다.
+
+        Args:
+            stats (PerSecondStats): 초당 집계 결과 (시각 오름차순)
+            level_seconds (Sequence[int]): 만들 레벨 (초)
+        """
+        self.stats = stats
+        epoch = epoch_seconds(pd.Series(stats.dates))
+        self.levels: Dict[int, PyramidLevel] = {
+            1: PyramidLevel(1, stats.dates, stats.count, stats.mean, stats.mean, stats.mean)
+        }
+        for seconds in sorted(level_seconds):
+            if seconds > 1:
+                self.levels[seconds] = _reduce_level(seconds, stats, epoch)
+
+    @property
+    def nbytes(self) -> int:
+        """메모리 사용량 (바이트, 1초 레벨 배열 포함)"""
+        total = 0
+        for level in self.levels.values():
+            total += level.dates.nbytes + level.count.nbytes
+            if level.seconds > 1:
+                total += sum(values.nbytes for values in level.mean.values())
+                total += sum(values.nbytes for values in level.low.values())
+                total += sum(values.nbytes for values in level.high.values())
+        total += sum(values.nbytes for values in self.stats.mean.values())
+        total += sum(values.nbytes for values in self.stats.min.values())
+        total += sum(values.nbytes for values in self.stats.max.values())
+        return total
+
+    def span(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None) -> float:
+        """보이는 구간 길이 (초), 지정하지 않은 쪽은 데이터 끝"""
+        dates = self.stats.dates
+        if not len(dates):
+            return 0.0
+        start = dates[0] if start is None else start
+        end = dates[-1] if end is None else end
+        return max((end - start).total_seconds(), 0.0)
+
+    def select_level(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None,
+                     pixels: int = 1000) -> int:
+        """
+        보이는 구간과 픽셀 폭에 맞는 레벨을 고릅니다.
+
+        Args:
+            start (pd.Timestamp, optional): 구간 시작 (tz-aware, 기본값: 데이터 시작)
+            end (pd.Timestamp, optional): 구간 끝 (tz-aware, 기본값: 데이터 끝)
+            pixels (int): 그래프 픽셀 폭
+
+        Returns:
+            int: 레벨 (초)
+        """
+        return select_level(self.span(start, end), pixels, tuple(self.levels))
+
+    def series(self, channel: str, seconds: int, start: Optional[pd.Timestamp] = None,
+               end: Optional[pd.Timestamp] = None) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """
+        레벨 하나에서 채널의 (x, y)를 꺼냅니다.
+
+        Args:
+            channel (str): 채널 이름
+            seconds (int): 레벨 (초)
+            start (pd.Timestamp, optional): 구간 시작 (tz-aware)
+            end (pd.Timestamp, optional): 구간 끝 (tz-aware)
+
+        Returns:
+            tuple: (x, y) - 1초 레벨은 초당 평균, 더 거친 레벨은 구간마다 (최소, 최대) 두 점
+        """
+        level = self.levels[seconds]
+        i0, i1 = 0, len(level.dates)
+        if start is not None:
+            # 구간 시작이 걸친 첫 구간도 포함
+            i0 = max(int(level.dates.searchsorted(start, side="right")) - 1, 0)
+        if end is not None:
+            i1 = int(level.dates.searchsorted(end, side="right"))
+
+        dates = level.dates[i0:i1]
+        if seconds == 1:
+            return dates, level.mean[channel][i0:i1]
+        x = dates.repeat(2)
+        y = np.column_stack((level.low[channel][i0:i1], level.high[channel][i0:i1])).ravel()
+        return x, y
@@ -2,6 +2,9 @@
 UI 컴포넌트 및 레이아웃 모듈
 Dash 앱의 모든 UI 컴포넌트와 레이아웃을 정의합니다.
 """
+import os
+import tempfile
+
 import dash
 import dash_bootstrap_components as dbc
 import dash_auth
@@ -9,6 +12,9 @@ from dash import dcc, html
 import dash_daq as daq
 import dash_leaflet as dl
 
+from core.background import ThreadJobManager
+from core.map_layers import MAP_LINE_IDS, STATUS_STYLES
+
 
 # 색상 정보 팝오버 텍스트
 POPOVER_CHILDREN = "초록(센서 연결 O), 주황(센서 연결 X), 빨강(GPS 오류)"
@@ -26,7 +32,7 @@ def create_control_card(data_source_name: str = "Data") -> dbc.CardBody:
     """
     return dbc.CardBody([
         html.H5(f"{data_source_name} data reading", className="card-title"),
-        html.P("확인하고 싶은 날짜, 전화번호, 센서를 순차적으로 선택 후 조회 버튼 클릭하세요."),
+        html.P("확인하고 싶은 날짜(또는 기간), 전화번호, 센서를 순차적으로 선택 후 조회 버튼 클릭하세요."),
 
         # 날짜(collection) 목록
         dcc.Dropdown(
@@ -84,6 +90,20 @@ def create_control_card(data_source_name: str = "Data") -> dbc.CardBody:
                 "left": "0.2vw",
                 "top": "-7vh"
             }
+        ),
+
+        # 여러 날짜 조회 (지정하면 날짜 목록 대신 이 기간의 날짜를 모두 이어서 그래프로 출력)
+        dcc.DatePickerRange(
+            id='date_range',
+            start_date_placeholder_text="시작 날짜",
+            end_date_placeholder_text="끝 날짜",
+            display_format="YYYY-MM-DD",
+            clearable=True,
+            style={
+                "position": "relative",
+                "left": "0.2vw",
+                "top": "-7vh"
+            }
         )
     ], style={"height": "20vh"})
 
@@ -174,9 +194,18 @@ def create_map_card() -> dbc.CardBody:
             trigger="hover"
         ),
         dl.Map(
-            [dl.TileLayer(
-                url="https://tiles.stadiamaps.com/tiles/outdoors/{z}/{x}/{y}{r}.png?api_key=93889be7-805e-4f44-9874-773f0117da64"
-            )],
+            [dl.LayersControl([
+                dl.BaseLayer(dl.TileLayer(
+                    url="https://tiles.stadiamaps.com/tiles/outdoors/{z}/{x}/{y}{r}.png?api_key=93889be7-805e-4f44-9874-773f0117da64"),
+                    name="Outdoors",
+                    checked=True, ),
+                # 상태별 경로는 다중 폴리라인 하나씩 (좌표는 지도 출력/확대 콜백이 채운다)
+                *[
+                    dl.Overlay(dl.LayerGroup([dl.Polyline(id=MAP_LINE_IDS[code], positions=[], color=color, weight=3)]),
+                               name=name, checked=True)
+                    for code, (name, color) in STATUS_STYLES.items()
+                ],
+            ])],
             center=[37.523254, 126.923528],
             zoom=12,
             id="map_card",
@@ -210,6 +239,11 @@ def create_layout(data_source_name: str = "Data") -> html.Div:
 
     # 레이아웃 구성
     return html.Div(children=[
+        # 그래프에 표시 중인 선택 조건 (확대 콜백용)
+        dcc.Store(id='graph_selection'),
+        # 지도에 표시 중인 선택 조건 (지도 확대 콜백용)
+        dcc.Store(id='map_selection'),
+
         dbc.Row([
             dbc.Col(dbc.Card(control_card, color="secondary", style={"z-index": "10"}), width=4),
             dbc.Col(dbc.Card(sensor_card, color="secondary", style={"z-index": "10"}), width=2)
@@ -244,6 +278,30 @@ def create_layout(data_source_name: str = "Data") -> html.Div:
     ])
 
 
+def create_background_manager():
+    """
+    조회/지도 출력용 Dash 백그라운드 콜백 매니저를 생성합니다.
+
+    작업은 웹 서버 프로세스 안의 작업 스레드에서 실행되고(ThreadJobManager), 진행 상태와 결과는
+    로컬 디스크(diskcache)를 거쳐 전달됩니다. 모든 콜백이 같은 프로세스의 데이터셋 캐시와 로더를 공유하며,
+    취소된 작업은 다음 진행 단계에서 멈춥니다. 환경 변수 DASH_BACKGROUND_CALLBACKS=0이거나
+    diskcache가 설치되어 있지 않으면 None을 반환하고, 콜백은 웹 서버 스레드에서 그대로 실행됩니다.
+
+    Returns:
+        ThreadJobManager: 백그라운드 콜백 매니저 (사용하지 않으면 None)
+    """
+    if os.getenv("DASH_BACKGROUND_CALLBACKS", "1") == "0":
+        return None
+    try:
+        import diskcache
+    except ImportError:
+        print("[경고] diskcache가 설치되어 있지 않아 백그라운드 콜백을 사용하지 않습니다. (pip install \"dash[diskcache]\")")
+        return None
+
+    cache_dir = os.getenv("DASH_BACKGROUND_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "sensor_dash_jobs")
+    return ThreadJobManager(diskcache.Cache(cache_dir))
+
+
 def create_app(loader, app_name: str = "Sensor Dashboard", port: int = 8050):
     """
     Dash 애플리케이션을 생성하고 설정합니다.
@@ -280,6 +338,6 @@ def create_app(loader, app_name: str = "Sensor Dashboard", port: int = 8050):
     app.layout = create_layout(data_source_name)
 
     # 콜백 등록
-    register_callbacks(app, loader)
+    register_callbacks(app, loader, background_manager=create_background_manager())
 
     return app
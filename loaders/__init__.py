@@ -2,6 +2,8 @@
 """Loaders package - Export data loader modules"""
 from loaders.base import BaseLoader
 from loaders.docdb_loader import DocDBLoader
+from loaders.frame_cache import FrameCacheLoader
 from loaders.s3_loader import S3Loader
+from loaders.single_flight import SingleFlightLoader
 
-__all__ = ['BaseLoader', 'DocDBLoader', 'S3Loader']
+__all__ = ['BaseLoader', 'DocDBLoader', 'FrameCacheLoader', 'S3Loader', 'SingleFlightLoader']
@@ -3,9 +3,12 @@ Base Loader 추상 클래스
 모든 데이터 로더가 구현해야 하는 인터페이스를 정의합니다.
 """
 from abc import ABC, abstractmethod
-from typing import List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Optional, Sequence, Tuple
 import pandas as pd
 
+from core.progress import JobCancelled, bind_context
+
 
 class BaseLoader(ABC):
     """
@@ -15,8 +18,11 @@ class BaseLoader(ABC):
     필수 메서드들을 구현해야 합니다.
     """
 
+    # load_range에서 동시에 로드하는 (날짜, 센서) 조각 수
+    range_workers: int = 4
+
     @abstractmethod
-    def load_ble_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+    def load_ble_data(self, date: str, phone: str, sensor: str, deduplicate: bool = True) -> pd.DataFrame:
         """
         BLE 센서 데이터를 로드합니다.
 
@@ -24,6 +30,8 @@ class BaseLoader(ABC):
             date (str): 날짜 (예: '2023-01-01')
             phone (str): 전화번호
             sensor (str): 센서 ID
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 반환
+                (DATE는 밀리초 단위, 원본 초당 집계와 그래프 확대 구간에 사용, 기본값: True)
 
         Returns:
             pd.DataFrame: BLE 센서 데이터
@@ -33,7 +41,7 @@ class BaseLoader(ABC):
         pass
 
     @abstractmethod
-    def load_lte_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+    def load_lte_data(self, date: str, phone: str, sensor: str, deduplicate: bool = True) -> pd.DataFrame:
         """
         LTE 센서 데이터를 로드합니다.
 
@@ -41,6 +49,8 @@ class BaseLoader(ABC):
             date (str): 날짜 (예: '2023-01-01')
             phone (str): 전화번호
             sensor (str): 센서 ID
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 반환
+                (DATE는 밀리초 단위, 원본 초당 집계와 그래프 확대 구간에 사용, 기본값: True)
 
         Returns:
             pd.DataFrame: LTE 센서 데이터
@@ -91,6 +101,112 @@ class BaseLoader(ABC):
         """
         pass
 
+    def load_second_summary(self, date: str, phone: str, sensor: str,
+                            is_lte: bool = False) -> Optional[pd.DataFrame]:
+        """
+        초 단위로 미리 집계된 데이터를 로드합니다.
+
+        데이터 소스가 집계를 대신 계산해 줄 수 있으면 원본 대신 초당 한 행만 내려받아
+        그래프를 그릴 수 있습니다. 지원하지 않으면 None을 반환하고, 호출자는 원본 데이터를 집계합니다.
+
+        Args:
+            date (str): 날짜 (예: '2023-01-01')
+            phone (str): 전화번호
+            sensor (str): 센서 ID
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            Optional[pd.DataFrame]: 초당 집계 데이터 또는 None
+                컬럼: DATE, count, <채널>_mean, <채널>_min, <채널>_max
+        """
+        return None
+
+    def range_partitions(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                         is_lte: bool = False) -> List[Tuple[str, str]]:
+        """
+        여러 날짜/센서 범위에서 실제로 데이터가 있는 (날짜, 센서) 조각 목록을 반환합니다.
+
+        Args:
+            dates (Sequence[str]): 날짜 목록
+            phone (str): 전화번호
+            sensors (Sequence[str], optional): 센서 ID 목록 (기본값: 날짜별 전체 센서)
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            List[Tuple[str, str]]: (날짜, 센서) 리스트
+        """
+        partitions = []
+        for date in dates:
+            available = self.show_sensor(date, phone, is_lte)
+            chosen = available if sensors is None else [sensor for sensor in sensors if sensor in available]
+            partitions += [(date, sensor) for sensor in chosen]
+        return partitions
+
+    def load_range(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                   is_lte: bool = False, max_workers: Optional[int] = None, deduplicate: bool = True) -> pd.DataFrame:
+        """
+        여러 날짜/센서의 데이터를 동시에 로드해 시간순으로 정렬된 하나의 DataFrame으로 반환합니다.
+
+        (날짜, 센서) 조각을 최대 `max_workers`개씩 동시에 load_ble_data / load_lte_data로 로드하므로,
+        감싼 로더(SingleFlightLoader, FrameCacheLoader)에서 호출하면 조각마다 캐시와 요청 합치기가 적용됩니다.
+        로드에 실패한 조각은 경고를 출력하고 건너뜁니다.
+
+        Args:
+            dates (Sequence[str]): 날짜 목록
+            phone (str): 전화번호
+            sensors (Sequence[str], optional): 센서 ID 목록 (기본값: 날짜별 전체 센서)
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+            max_workers (int, optional): 동시에 로드할 조각 수 (기본값: range_workers)
+            deduplicate (bool): False면 조각마다 초 단위 중복 제거 전 모든 샘플을 로드 (기본값: True)
+
+        Returns:
+            pd.DataFrame: DATE 기준 오름차순 정렬된 데이터 (같은 시각은 날짜, 센서 순)
+        """
+        partitions = self.range_partitions(dates, phone, sensors, is_lte)
+        load = self.load_lte_data if is_lte else self.load_ble_data
+        # 기본 로드는 인자 없이 호출해 감싼 로더(FrameCacheLoader)가 그대로 캐시하도록 한다
+        options = {} if deduplicate else {"deduplicate": False}
+
+        # 호출한 작업의 진행 상태 보고와 취소 신호를 조각 로드 스레드에도 적용
+        @bind_context
+        def run(partition):
+            date, sensor = partition
+            try:
+                return load(date, phone, sensor, **options)
+            except JobCancelled:
+                raise
+            except Exception as e:
+                print(f"[경고] {date} {phone} {sensor} 로드 실패: {type(e).__name__}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.range_workers) as pool:
+            frames = [df for df in pool.map(run, partitions) if df is not None and len(df)]
+
+        if not frames:
+            return pd.DataFrame()
+        data = pd.concat(frames, ignore_index=True)
+        if not data["DATE"].is_monotonic_increasing:
+            data = data.sort_values("DATE", kind="stable", ignore_index=True)
+        return data
+
+    def source_version(self, date: str, phone: str, sensor: str, is_lte: bool = False) -> Optional[str]:
+        """
+        원본 데이터의 현재 버전을 반환합니다.
+
+        캐시가 저장해 둔 버전과 다르면 원본이 바뀐 것으로 보고 다시 로드합니다.
+        버전을 알 수 없는 데이터 소스는 None을 반환하고, 캐시는 저장 시각으로 판단합니다.
+
+        Args:
+            date (str): 날짜 (예: '2023-01-01')
+            phone (str): 전화번호
+            sensor (str): 센서 ID
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            Optional[str]: 버전 문자열 (예: S3 ETag) 또는 None
+        """
+        return None
+
     def get_data_source_name(self) -> str:
         """
         데이터 소스 이름을 반환합니다.
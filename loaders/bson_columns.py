@@ -0,0 +1,129 @@
+"""
+BSON 컬럼 디코딩 모듈
+DocumentDB 조회 결과를 문서(dict) 리스트를 거치지 않고 필드별 타입이 정해진 컬럼 버퍼로 바로 읽습니다.
+"""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pymongoarrow.api import Schema, find_arrow_all
+except ImportError:  # pymongoarrow가 없으면 순수 Python 경로 사용
+    find_arrow_all = None
+
+from bson import decode_all
+
+
+# 필드 타입 이름 -> NumPy dtype
+_NUMPY_TYPES = {
+    "float64": np.float64,
+    "int64": np.int64,
+    "string": object,
+}
+
+
+def _arrow_schema(fields: Dict[str, str]):
+    arrow_types = {"float64": pa.float64(), "int64": pa.int64(), "string": pa.string()}
+    return Schema({name: arrow_types[kind] for name, kind in fields.items()})
+
+
+class ColumnBuffers:
+    """
+    필드별 타입이 정해진 컬럼 버퍼 클래스
+
+    배치마다 디코딩한 값을 미리 할당한 NumPy 배열에 이어 붙이고, 부족하면 두 배로 늘립니다.
+    """
+
+    def __init__(self, fields: Dict[str, str], capacity: int = 65536):
+        """
+        ColumnBuffers를 초기화합니다.
+
+        Args:
+            fields (Dict[str, str]): 필드 이름 -> 타입 ('float64', 'int64', 'string')
+            capacity (int): 처음 할당할 행 수
+        """
+        self.fields = fields
+        self.size = 0
+        self.columns = {name: self._allocate(kind, capacity) for name, kind in fields.items()}
+
+    @staticmethod
+    def _allocate(kind: str, capacity: int) -> np.ndarray:
+        if kind == "float64":
+            return np.full(capacity, np.nan)
+        return np.empty(capacity, dtype=_NUMPY_TYPES[kind])
+
+    def _reserve(self, n: int):
+        capacity = len(next(iter(self.columns.values())))
+        if self.size + n <= capacity:
+            return
+        new_capacity = max(capacity * 2, self.size + n)
+        for name, kind in self.fields.items():
+            grown = self._allocate(kind, new_capacity)
+            grown[:self.size] = self.columns[name][:self.size]
+            self.columns[name] = grown
+
+    def append_batch(self, raw_batch: bytes):
+        """
+        find_raw_batches가 돌려준 BSON 배치 하나를 디코딩해 버퍼에 이어 붙입니다.
+        디코딩한 문서는 이 배치를 처리하는 동안만 메모리에 있습니다.
+
+        Args:
+            raw_batch (bytes): 이어 붙은 BSON 문서들
+        """
+        docs = decode_all(raw_batch)
+        n = len(docs)
+        if n == 0:
+            return
+        self._reserve(n)
+        start, end = self.size, self.size + n
+        for name, kind in self.fields.items():
+            column = self.columns[name]
+            if kind == "float64":
+                column[start:end] = np.fromiter(
+                    (np.nan if (v := doc.get(name)) is None else v for doc in docs), np.float64, count=n
+                )
+            elif kind == "int64":
+                column[start:end] = np.fromiter((doc[name] for doc in docs), np.int64, count=n)
+            else:
+                column[start:end] = [doc.get(name) for doc in docs]
+        self.size = end
+
+    def to_frame(self) -> pd.DataFrame:
+        """채워진 행까지 잘라 DataFrame으로 반환합니다 (복사 없이 슬라이스)."""
+        return pd.DataFrame({name: column[:self.size] for name, column in self.columns.items()}, copy=False)
+
+
+def find_columns(collection, query: dict, fields: Dict[str, str], batch_size: int = 10000,
+                 sort: Optional[list] = None) -> pd.DataFrame:
+    """
+    조회 결과를 필드별 컬럼으로 읽어 DataFrame으로 반환합니다.
+
+    pymongoarrow가 설치되어 있으면 find_arrow_all로 Arrow 테이블을 만들고, 없으면
+    find_raw_batches로 받은 BSON 배치를 배치 단위로 디코딩해 NumPy 컬럼 버퍼에 채웁니다.
+    어느 경로든 문서 전체를 dict 리스트로 모아 두지 않습니다.
+
+    Args:
+        collection: pymongo Collection
+        query (dict): 조회 조건
+        fields (Dict[str, str]): 읽을 필드 이름 -> 타입 ('float64', 'int64', 'string')
+        batch_size (int): 서버에서 한 번에 받을 문서 수
+        sort (list, optional): 정렬 조건 (예: [("time", 1)])
+
+    Returns:
+        pd.DataFrame: fields 순서의 컬럼을 가진 데이터
+    """
+    find_kwargs = {"batch_size": batch_size}
+    if sort is not None:
+        find_kwargs["sort"] = sort
+
+    if find_arrow_all is not None:
+        table = find_arrow_all(collection, query, schema=_arrow_schema(fields), **find_kwargs)
+        return table.to_pandas()[list(fields)]
+
+    projection = {"_id": 0, **{name: 1 for name in fields}}
+    buffers = ColumnBuffers(fields)
+    for raw_batch in collection.find_raw_batches(query, projection, **find_kwargs):
+        buffers.append_batch(raw_batch)
+    return buffers.to_frame()
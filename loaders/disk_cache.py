@@ -0,0 +1,196 @@
+"""
+로컬 디스크 Parquet 캐시 모듈
+S3 객체를 (bucket, key, ETag) 단위로 로컬 디스크에 보관하고 LRU 방식으로 용량을 관리합니다.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+
+class ParquetDiskCache:
+    """
+    S3 Parquet 객체 디스크 캐시 클래스
+
+    - 파일은 임시 파일에 쓴 뒤 os.replace로 바꿔치기하므로 여러 스레드/프로세스가 같은
+      디렉토리를 공유해도 반쯤 쓰인 파일을 읽지 않습니다.
+    - 캐시된 객체가 최신인지는 If-None-Match 조건부 GET 한 번으로 확인합니다 (304면 재사용).
+    - 최근 `max_age` 초 안에 확인했거나 카탈로그의 ETag와 같으면 네트워크 요청 없이 사용합니다.
+    - 전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다 (방금 저장한 파일은 남김).
+      fetch가 반환한 경로는 호출자가 열기 전에 다른 스레드의 정리로 지워질 수 있으므로,
+      읽는 쪽은 FileNotFoundError가 나면 fetch를 다시 호출합니다 (지워진 파일은 다시 내려받음).
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 5 * 1024 ** 3, max_age: float = 60.0):
+        """
+        ParquetDiskCache를 초기화합니다.
+
+        Args:
+            directory (str): 캐시 디렉토리
+            max_bytes (int): 캐시 최대 용량 (바이트)
+            max_age (float): 재확인 없이 캐시를 믿는 시간 (초)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def fetch(self, s3_client, bucket: str, key: str, known_etag: Optional[str] = None) -> str:
+        """
+        S3 객체의 로컬 캐시 파일 경로를 반환합니다. 필요하면 내려받습니다.
+
+        Args:
+            s3_client: boto3 S3 클라이언트
+            bucket (str): 버킷 이름
+            key (str): 객체 키
+            known_etag (str, optional): 카탈로그 등에서 이미 알고 있는 최신 ETag
+
+        Returns:
+            str: 로컬 Parquet 파일 경로
+        """
+        meta = self._read_meta(bucket, key)
+        if meta is not None:
+            path = self._data_path(bucket, key, meta["etag"])
+            fresh = (known_etag is not None and known_etag == meta["etag"]) or \
+                (known_etag is None and time.time() - meta["validated_at"] < self.max_age)
+            if fresh and os.path.exists(path):
+                self._touch(path)
+                self.hits += 1
+                return path
+
+            if os.path.exists(path):
+                try:
+                    response = s3_client.get_object(Bucket=bucket, Key=key, IfNoneMatch=meta["etag"])
+                except ClientError as e:
+                    if not _is_not_modified(e):
+                        raise
+                    self._write_meta(bucket, key, meta["etag"])
+                    self._touch(path)
+                    self.revalidated += 1
+                    return path
+                self.misses += 1
+                return self._store(bucket, key, response)
+
+        self.misses += 1
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+        return self._store(bucket, key, response)
+
+    def total_bytes(self) -> int:
+        """캐시에 저장된 데이터 파일의 총 크기를 반환합니다."""
+        return sum(size for _, _, size in self._data_files())
+
+    def _store(self, bucket: str, key: str, response: dict) -> str:
+        """get_object 응답 본문을 원자적으로 저장하고 이전 버전 파일을 지웁니다."""
+        etag = response.get("ETag", "")
+        path = self._data_path(bucket, key, etag)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(response["Body"], f, 1024 * 1024)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        old_meta = self._read_meta(bucket, key)
+        self._write_meta(bucket, key, etag)
+        if old_meta is not None and old_meta["etag"] != etag:
+            # 이전 버전을 막 받은 다른 스레드는 FileNotFoundError로 다시 fetch해 새 버전을 읽는다
+            _remove_quietly(self._data_path(bucket, key, old_meta["etag"]))
+
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, keep: Optional[str] = None):
+        """
+        총 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 파일을 지웁니다.
+
+        Args:
+            keep (str, optional): 지우지 않을 파일 경로 (반환할 파일, 혼자 max_bytes를 넘어도 남김)
+        """
+        with self._lock:
+            files = sorted(self._data_files())
+            total = sum(size for _, _, size in files)
+            for _, path, size in files:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                _remove_quietly(path)
+                _remove_quietly(path.rsplit("-", 1)[0] + ".json")
+                total -= size
+
+    def _data_files(self):
+        """(마지막 사용 시각, 경로, 크기) 리스트"""
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".parquet"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+        return files
+
+    def _entry_id(self, bucket: str, key: str) -> str:
+        return hashlib.sha1(f"{bucket}/{key}".encode("utf-8")).hexdigest()
+
+    def _data_path(self, bucket: str, key: str, etag: str) -> str:
+        etag_id = hashlib.sha1(etag.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{self._entry_id(bucket, key)}-{etag_id}.parquet")
+
+    def _meta_path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.directory, f"{self._entry_id(bucket, key)}.json")
+
+    def _read_meta(self, bucket: str, key: str) -> Optional[dict]:
+        try:
+            with open(self._meta_path(bucket, key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_meta(self, bucket: str, key: str, etag: str):
+        meta = {"bucket": bucket, "key": key, "etag": etag, "validated_at": time.time()}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._meta_path(bucket, key))
+
+    @staticmethod
+    def _touch(path: str):
+        """LRU 순서를 위해 마지막 사용 시각(mtime)을 갱신합니다."""
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+
+
+def _is_not_modified(error: ClientError) -> bool:
+    """조건부 GET의 304 Not Modified 응답인지 확인합니다."""
+    code = str(error.response.get("Error", {}).get("Code", ""))
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in ("304", "NotModified") or status == 304
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
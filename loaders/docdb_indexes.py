@@ -0,0 +1,161 @@
+"""
+DocumentDB 인덱스 관리 모듈
+날짜별 collection에 (phone_num, sensor_id, time) 복합 인덱스를 만들고, 대시보드가 쓰는 쿼리의 실행 계획을 확인합니다.
+
+실행:
+    python -m loaders.docdb_indexes               # 모든 날짜 collection에 인덱스 생성 + 실행 계획 확인
+    python -m loaders.docdb_indexes --check-only  # 인덱스는 만들지 않고 실행 계획만 확인
+"""
+import argparse
+from typing import Iterable, List, Optional, Tuple
+
+# 원본 조회, 전화번호/센서 목록 조회를 모두 지원하고 time 정렬도 서버에서 처리하는 복합 인덱스
+INDEX_KEYS = [("phone_num", 1), ("sensor_id", 1), ("time", 1)]
+INDEX_NAME = "phone_num_1_sensor_id_1_time_1"
+
+
+def ensure_index(collection) -> str:
+    """
+    collection에 복합 인덱스가 없으면 만듭니다 (이미 있으면 아무것도 하지 않음).
+
+    Args:
+        collection: pymongo Collection
+
+    Returns:
+        str: 인덱스 이름
+    """
+    return collection.create_index(INDEX_KEYS, name=INDEX_NAME)
+
+
+def plan_stages(explain: dict) -> List[str]:
+    """
+    explain 결과의 winningPlan에 나오는 stage 이름을 모두 반환합니다.
+
+    Args:
+        explain (dict): explain 명령 결과
+
+    Returns:
+        List[str]: stage 이름 (예: ['FETCH', 'IXSCAN'])
+    """
+    stages = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if "stage" in node:
+                stages.append(node["stage"])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(explain.get("queryPlanner", explain).get("winningPlan", {}))
+    return stages
+
+
+def explain_standard_queries(db, name: str, phone: Optional[str] = None,
+                             sensor: Optional[str] = None) -> List[Tuple[str, List[str]]]:
+    """
+    대시보드가 날짜 collection에 보내는 쿼리들의 실행 계획을 확인합니다.
+
+    Args:
+        db: pymongo Database
+        name (str): collection 이름 (날짜)
+        phone (str, optional): 조회할 전화번호 (기본값: collection의 첫 문서)
+        sensor (str, optional): 조회할 센서 ID (기본값: collection의 첫 문서)
+
+    Returns:
+        List[Tuple[str, List[str]]]: (쿼리 이름, stage 이름 목록)
+    """
+    collection = db[name]
+    if phone is None or sensor is None:
+        sample = collection.find_one({}, {"_id": 0, "phone_num": 1, "sensor_id": 1}) or {}
+        phone = phone if phone is not None else sample.get("phone_num")
+        sensor = sensor if sensor is not None else sample.get("sensor_id")
+
+    query = {"phone_num": phone, "sensor_id": sensor}
+    plans = [
+        ("find(phone_num, sensor_id).sort(time)",
+         collection.find(query, {"_id": 0}).sort("time", 1).explain()),
+        ("distinct(phone_num)",
+         db.command("explain", {"distinct": name, "key": "phone_num", "query": {}}, verbosity="queryPlanner")),
+        ("distinct(sensor_id, phone_num)",
+         db.command("explain", {"distinct": name, "key": "sensor_id", "query": {"phone_num": phone}},
+                    verbosity="queryPlanner")),
+    ]
+    return [(query_name, plan_stages(plan)) for query_name, plan in plans]
+
+
+def check_collections(db, names: Iterable[str], ensure: bool = False) -> List[str]:
+    """
+    collection마다 (선택적으로) 인덱스를 만들고, COLLSCAN으로 실행되는 쿼리가 있으면 경고합니다.
+
+    Args:
+        db: pymongo Database
+        names (Iterable[str]): 확인할 collection 이름
+        ensure (bool): True면 인덱스가 없을 때 만든다
+
+    Returns:
+        List[str]: COLLSCAN이 발견된 '<collection>: <쿼리>' 목록
+    """
+    problems = []
+    for name in names:
+        if ensure:
+            ensure_index(db[name])
+        for query_name, stages in explain_standard_queries(db, name):
+            if "COLLSCAN" in stages:
+                problems.append(f"{name}: {query_name}")
+                print(f"[경고] {db.name}.{name}: {query_name} 쿼리가 COLLSCAN으로 실행됩니다 "
+                      f"(python -m loaders.docdb_indexes 로 인덱스를 만드세요)")
+    return problems
+
+
+def startup_check(db, recent: int = 3, ensure: bool = False) -> List[str]:
+    """
+    앱 시작 시 최근 날짜 collection 몇 개의 실행 계획을 확인합니다.
+
+    Args:
+        db: pymongo Database
+        recent (int): 확인할 최근 collection 수
+        ensure (bool): True면 인덱스가 없을 때 만든다
+
+    Returns:
+        List[str]: COLLSCAN이 발견된 '<collection>: <쿼리>' 목록
+    """
+    names = sorted(db.list_collection_names())[-recent:]
+    try:
+        return check_collections(db, names, ensure=ensure)
+    except Exception as e:
+        # 권한 부족 등으로 확인하지 못해도 앱 시작은 계속한다
+        print(f"[경고] DocumentDB 인덱스 확인 실패: {type(e).__name__}: {str(e)}")
+        return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DocumentDB 날짜 collection 인덱스 관리")
+    parser.add_argument("--db", choices=["ble", "lte", "all"], default="all", help="대상 데이터베이스 (기본값: all)")
+    parser.add_argument("--check-only", action="store_true", help="인덱스를 만들지 않고 실행 계획만 확인")
+    parser.add_argument("--collections", nargs="*", help="대상 collection (기본값: 전체)")
+    args = parser.parse_args()
+
+    from loaders.docdb_loader import DocDBLoader
+
+    loader = DocDBLoader(index_check="off")
+    try:
+        databases = {"ble": loader.monDB_ble, "lte": loader.monDB_lte}
+        if args.db != "all":
+            databases = {args.db: databases[args.db]}
+
+        problems = []
+        for label, db in databases.items():
+            names = args.collections or sorted(db.list_collection_names())
+            print(f"[인덱스] {label}: collection {len(names)}개 {'확인' if args.check_only else '인덱스 생성 및 확인'}")
+            problems += check_collections(db, names, ensure=not args.check_only)
+
+        print(f"[완료] COLLSCAN 쿼리 {len(problems)}개")
+    finally:
+        loader.close()
+
+
+if __name__ == '__main__':
+    main()
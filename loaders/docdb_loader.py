@@ -2,13 +2,19 @@
 DocumentDB 데이터 로더
 AWS DocumentDB에서 센서 데이터를 로드합니다.
 """
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 import pandas as pd
 from pymongo import MongoClient
-from datetime import datetime
 
 from loaders.base import BaseLoader
-from core.data_processor import process_raw_data, local_tz
+from loaders.docdb_parallel import find_time_sliced
+from loaders.docdb_indexes import startup_check
+from core.aggregation import PLOT_CHANNELS, SUMMARY_STATS
+from core.data_processor import (process_raw_data, normalize_timestamp, local_tz, BLE_RAW_COLUMNS, LTE_RAW_COLUMNS,
+                                 COLUMN_RENAME)
+from core.progress import report_progress
 from config import ConfigDB
 
 
@@ -19,11 +25,48 @@ class DocDBLoader(BaseLoader):
     AWS DocumentDB에 연결하여 BLE 및 LTE 센서 데이터를 로드합니다.
     """
 
-    def __init__(self):
+    # 원본 조회 시 읽는 필드와 타입 (나머지는 float64)
+    BLE_FIELDS = {
+        column: {"time": "int64", "sensor_id": "string"}.get(column, "float64") for column in BLE_RAW_COLUMNS
+    }
+    LTE_FIELDS = {
+        column: {"time": "int64", "sensor_id": "string"}.get(column, "float64") for column in LTE_RAW_COLUMNS
+    }
+
+    # 집계 모드에서 서버가 초 단위로 계산하는 원본 필드
+    SUMMARY_FIELDS_BLE = [
+        {v: k for k, v in COLUMN_RENAME.items()}.get(channel, channel) for channel in PLOT_CHANNELS
+    ]
+    SUMMARY_FIELDS_LTE = SUMMARY_FIELDS_BLE + ["TIME", "DISTANCE"]
+
+    # load_range에서 동시에 로드하는 (날짜, 센서) 조각 수 (조각마다 parallelism개 커서를 사용)
+    range_workers = 2
+
+    def __init__(self, load_mode: Optional[str] = None, index_check: Optional[str] = None,
+                 parallelism: Optional[int] = None):
         """
         DocDBLoader를 초기화합니다.
         DocumentDB 연결을 설정하고 BLE, LTE 데이터베이스 참조를 생성합니다.
+
+        Args:
+            load_mode (str, optional): 그래프 데이터 로드 방식
+                'raw': 원본 문서를 모두 내려받아 집계 (기본값)
+                'aggregate': DocumentDB 집계 파이프라인으로 초당 한 문서만 내려받음
+                (기본값: 환경 변수 DOCDB_LOAD_MODE 또는 'raw')
+            index_check (str, optional): 시작 시 최근 날짜 collection의 인덱스 확인 방식
+                'off': 확인하지 않음, 'warn': COLLSCAN 쿼리를 경고 (기본값), 'ensure': 인덱스가 없으면 생성
+                (기본값: 환경 변수 DOCDB_INDEX_CHECK 또는 'warn')
+            parallelism (int, optional): 원본 조회를 나눠 동시에 읽을 time 구간 수 (1이면 커서 하나)
+                (기본값: 환경 변수 DOCDB_PARALLELISM 또는 4)
         """
+        self.load_mode = load_mode or os.getenv("DOCDB_LOAD_MODE", "raw")
+        if self.load_mode not in ("raw", "aggregate"):
+            raise ValueError(f"지원하지 않는 DocumentDB 로드 방식: {self.load_mode}")
+
+        # 구간별 커서를 읽는 스레드 풀 (모든 요청이 공유, 커서는 MongoClient 연결 풀을 나눠 씀)
+        self.parallelism = parallelism or int(os.getenv("DOCDB_PARALLELISM", 4))
+        self._executor = ThreadPoolExecutor(max_workers=self.parallelism) if self.parallelism > 1 else None
+
         # MongoDB 설정
         self.mongo_config_ble = ConfigDB.MONGO["BLE"]
         self.mongo_config_lte = ConfigDB.MONGO["LTE"]
@@ -47,7 +90,13 @@ class DocDBLoader(BaseLoader):
         )
         self.monDB_lte = self.client_lte[self.mongo_config_lte["DB"]]
 
-    def load_ble_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+        # (phone_num, sensor_id, time) 인덱스 확인
+        index_check = index_check or os.getenv("DOCDB_INDEX_CHECK", "warn")
+        if index_check != "off":
+            for db in (self.monDB_ble, self.monDB_lte):
+                startup_check(db, ensure=(index_check == "ensure"))
+
+    def load_ble_data(self, date: str, phone: str, sensor: str, deduplicate: bool = True) -> pd.DataFrame:
         """
         BLE 센서 데이터를 DocumentDB에서 로드합니다.
 
@@ -55,36 +104,29 @@ class DocDBLoader(BaseLoader):
             date (str): 날짜 (collection 이름)
             phone (str): 전화번호
             sensor (str): 센서 ID
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 밀리초 단위 DATE로 반환 (기본값: True)
 
         Returns:
             pd.DataFrame: BLE 센서 데이터
         """
-        projection = {
-            "_id": 0, "time": 1, "sensor_id": 1,
-            "ACCEL_X": 1, "ACCEL_Y": 1, "ACCEL_Z": 1,
-            "GYRO_X": 1, "GYRO_Y": 1, "GYRO_Z": 1,
-            "PITCH": 1, "ROLL": 1,
-            "LAT": 1, "LON": 1,
-            "VELOCITY": 1, "ALTITUDE": 1, "BEARING": 1
-        }
-
-        result = self.monDB_ble[date].find(
+        # time 구간별 커서로 동시에 읽고, 문서를 dict로 모으지 않고 필드별 컬럼 버퍼로 바로 디코딩
+        report_progress("download")
+        df = find_time_sliced(
+            self.monDB_ble[date],
             {"phone_num": phone, "sensor_id": sensor},
-            projection
-        ).batch_size(10000)
-
-        df = pd.DataFrame(result)
-        raw_data = df[[
-            "time", "sensor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VELOCITY", "ALTITUDE", "BEARING"
-        ]]
+            self.BLE_FIELDS,
+            parallelism=self.parallelism,
+            executor=self._executor,
+            batch_size=10000
+        )
 
         # 데이터 처리
-        raw_data = process_raw_data(raw_data, local_tz)
+        report_progress("parse")
+        raw_data = process_raw_data(df[BLE_RAW_COLUMNS], local_tz, deduplicate=deduplicate)
 
         return raw_data
 
-    def load_lte_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+    def load_lte_data(self, date: str, phone: str, sensor: str, deduplicate: bool = True) -> pd.DataFrame:
         """
         LTE 센서 데이터를 DocumentDB에서 로드합니다.
 
@@ -92,47 +134,101 @@ class DocDBLoader(BaseLoader):
             date (str): 날짜 (collection 이름)
             phone (str): 전화번호
             sensor (str): 센서 ID
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 밀리초 단위 DATE로 반환 (기본값: True)
 
         Returns:
             pd.DataFrame: LTE 센서 데이터
         """
-        projection = {
-            "_id": 0, "time": 1, "sensor_id": 1,
-            "ACCEL_X": 1, "ACCEL_Y": 1, "ACCEL_Z": 1,
-            "GYRO_X": 1, "GYRO_Y": 1, "GYRO_Z": 1,
-            "PITCH": 1, "ROLL": 1,
-            "LAT": 1, "LON": 1,
-            "VELOCITY": 1, "ALTITUDE": 1, "BEARING": 1,
-            "TIME": 1, "DISTANCE": 1
-        }
-
-        result = self.monDB_lte[date].find(
+        # time 구간별 커서로 동시에 읽고, 문서를 dict로 모으지 않고 필드별 컬럼 버퍼로 바로 디코딩
+        report_progress("download")
+        df = find_time_sliced(
+            self.monDB_lte[date],
             {"phone_num": phone, "sensor_id": sensor},
-            projection
-        ).batch_size(10000)
-
-        df = pd.DataFrame(result)
-        raw_data = df[[
-            "time", "sensor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VELOCITY", "ALTITUDE", "BEARING", "TIME", "DISTANCE"
-        ]]
-
-        # 시간 정렬
-        raw_data.sort_values(by=['time'], ascending=True, inplace=True)
-        raw_data['time'] = raw_data['time'].apply(
-            lambda x: datetime.fromtimestamp(x / 1000, tz=local_tz).strftime('%Y-%m-%d %H:%M:%S')
+            self.LTE_FIELDS,
+            parallelism=self.parallelism,
+            executor=self._executor,
+            batch_size=10000
         )
 
-        # 컬럼명 표준화
-        raw_data.columns = [
-            "DATE", "senor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VEL", "ALT", "HEAD", "TIME", "DISTANCE"
+        # 데이터 처리
+        report_progress("parse")
+        raw_data = process_raw_data(df[LTE_RAW_COLUMNS], local_tz, deduplicate=deduplicate)
+
+        return raw_data
+
+    def load_second_summary(self, date: str, phone: str, sensor: str,
+                            is_lte: bool = False) -> Optional[pd.DataFrame]:
+        """
+        DocumentDB 집계 파이프라인으로 초당 집계 데이터를 로드합니다.
+
+        $match로 전화번호/센서 문서를 고른 뒤 time을 초 단위로 내린 값으로 $group하여
+        채널별 평균/최소/최대와 샘플 수를 서버에서 계산하므로, 초당 한 문서만 전송됩니다.
+        집계 모드('aggregate')가 아니면 None을 반환합니다.
+
+        Args:
+            date (str): 날짜 (collection 이름)
+            phone (str): 전화번호
+            sensor (str): 센서 ID
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            Optional[pd.DataFrame]: 초당 집계 데이터 (컬럼: DATE, count, <채널>_mean/_min/_max)
+        """
+        if self.load_mode != "aggregate":
+            return None
+
+        db = self.monDB_lte if is_lte else self.monDB_ble
+        fields = self.SUMMARY_FIELDS_LTE if is_lte else self.SUMMARY_FIELDS_BLE
+
+        # time(ms)을 초 단위로 내림: time - time % 1000 (DocumentDB가 지원하는 연산자만 사용)
+        group = {
+            "_id": {"$subtract": ["$time", {"$mod": ["$time", 1000]}]},
+            "count": {"$sum": 1},
+        }
+        for field in fields:
+            channel = COLUMN_RENAME.get(field, field)
+            for stat, operator in zip(SUMMARY_STATS, ("$avg", "$min", "$max")):
+                group[f"{channel}_{stat}"] = {operator: f"${field}"}
+
+        pipeline = [
+            {"$match": {"phone_num": phone, "sensor_id": sensor}},
+            {"$group": group},
+            {"$sort": {"_id": 1}},
         ]
 
-        raw_data["DATE"] = pd.to_datetime(raw_data["DATE"])
-        raw_data.drop_duplicates(subset='DATE', inplace=True)
+        report_progress("download")
+        df = pd.DataFrame(list(db[date].aggregate(pipeline, batchSize=10000)))
 
-        return raw_data
+        # 데이터 처리
+        report_progress("parse")
+        df.insert(0, "DATE", normalize_timestamp(df.pop("_id"), local_tz))
+        return df
+
+    def range_partitions(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                         is_lte: bool = False) -> List[Tuple[str, str]]:
+        """
+        데이터가 있는 (날짜, 센서) 조각 목록을 반환합니다.
+        collection 목록은 한 번만 읽고, 없는 날짜 collection은 조회하지 않습니다.
+
+        Args:
+            dates (Sequence[str]): 날짜 목록 (collection 이름)
+            phone (str): 전화번호
+            sensors (Sequence[str], optional): 센서 ID 목록 (기본값: 날짜별 전체 센서)
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            List[Tuple[str, str]]: (날짜, 센서) 리스트
+        """
+        db = self.monDB_lte if is_lte else self.monDB_ble
+        existing = set(db.list_collection_names())
+        partitions = []
+        for date in dates:
+            if date not in existing:
+                continue
+            available = db[date].distinct("sensor_id", {"phone_num": phone})
+            chosen = available if sensors is None else [sensor for sensor in sensors if sensor in available]
+            partitions += [(date, sensor) for sensor in sorted(chosen)]
+        return partitions
 
     def show_date(self, is_lte: bool = False) -> List[str]:
         """
@@ -187,5 +283,7 @@ class DocDBLoader(BaseLoader):
         """
         MongoDB 연결을 종료합니다.
         """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
         self.client_ble.close()
         self.client_lte.close()
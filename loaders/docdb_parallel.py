@@ -0,0 +1,87 @@
+"""
+DocumentDB 병렬 조회 모듈
+하루치 조회를 time 구간 N개로 나눠 구간마다 별도 커서로 동시에 읽고, 시간 순서대로 이어 붙입니다.
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from loaders.bson_columns import find_columns
+
+
+def time_bounds(collection, query: dict) -> Optional[Tuple[int, int]]:
+    """
+    조회 조건에 맞는 문서의 최소/최대 time을 반환합니다 ((phone_num, sensor_id, time) 인덱스 사용).
+
+    Args:
+        collection: pymongo Collection
+        query (dict): 조회 조건
+
+    Returns:
+        Optional[Tuple[int, int]]: (최소 time, 최대 time), 문서가 없으면 None
+    """
+    first = collection.find_one(query, {"_id": 0, "time": 1}, sort=[("time", 1)])
+    if first is None:
+        return None
+    last = collection.find_one(query, {"_id": 0, "time": 1}, sort=[("time", -1)])
+    return int(first["time"]), int(last["time"])
+
+
+def split_time_range(start: int, end: int, slices: int) -> List[Tuple[int, int]]:
+    """
+    [start, end] 구간을 겹치지 않는 [lo, hi) 구간 slices개로 나눕니다 (마지막 구간은 end 포함).
+
+    Args:
+        start (int): 시작 time
+        end (int): 끝 time
+        slices (int): 구간 수
+
+    Returns:
+        List[Tuple[int, int]]: (lo, hi) 목록
+    """
+    slices = max(1, min(slices, end - start + 1))
+    edges = np.linspace(start, end + 1, slices + 1).astype(np.int64)
+    return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:]) if hi > lo]
+
+
+def find_time_sliced(collection, query: dict, fields: Dict[str, str], parallelism: int = 4,
+                     executor: Optional[Executor] = None, batch_size: int = 10000) -> pd.DataFrame:
+    """
+    time 구간별 커서를 동시에 열어 읽고, 결과를 시간 순서대로 이어 붙입니다.
+
+    커서는 같은 MongoClient의 연결 풀을 나눠 쓰므로 구간 수만큼 연결이 동시에 사용됩니다.
+    parallelism이 1 이하이면 커서 하나로 읽습니다.
+
+    Args:
+        collection: pymongo Collection
+        query (dict): 조회 조건 (time 조건은 포함하지 않음)
+        fields (Dict[str, str]): 읽을 필드 이름 -> 타입 (find_columns 참고)
+        parallelism (int): 동시에 읽을 구간 수
+        executor (Executor, optional): 사용할 스레드 풀 (기본값: 이번 조회용 새 풀)
+        batch_size (int): 커서 배치 크기
+
+    Returns:
+        pd.DataFrame: time 오름차순 데이터
+    """
+    sort = [("time", 1)]
+    bounds = time_bounds(collection, query) if parallelism > 1 else None
+    if bounds is None:
+        return find_columns(collection, query, fields, batch_size=batch_size, sort=sort)
+
+    ranges = split_time_range(bounds[0], bounds[1], parallelism)
+
+    def read(time_range):
+        lo, hi = time_range
+        return find_columns(collection, {**query, "time": {"$gte": lo, "$lt": hi}}, fields,
+                            batch_size=batch_size, sort=sort)
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            frames = list(pool.map(read, ranges))
+    else:
+        frames = list(executor.map(read, ranges))
+
+    # 구간 순서가 곧 시간 순서
+    return pd.concat(frames, ignore_index=True)
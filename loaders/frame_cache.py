@@ -0,0 +1,260 @@
+"""
+정규화 데이터 캐시 모듈
+로더가 정규화(컬럼명 변경, DATE 변환, 중복 제거)까지 마친 DataFrame을 Arrow IPC(Feather v2) 파일로 보관하고,
+다시 열 때는 파일을 메모리 맵으로 열어 복사 없이 DataFrame을 만듭니다.
+
+같은 파일을 여러 스레드/프로세스가 메모리 맵으로 열면 운영체제 페이지 캐시의 같은 물리 페이지를 공유합니다.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+
+from loaders.base import BaseLoader
+
+
+# Arrow 스키마 메타데이터에 기록하는 원본 버전과 저장 시각
+VERSION_KEY = b"sensor_dash.source_version"
+WRITTEN_AT_KEY = b"sensor_dash.written_at"
+
+
+class FrameCache:
+    """
+    정규화 DataFrame 디스크 캐시 클래스
+
+    - 파일은 임시 파일에 쓴 뒤 os.replace로 바꿔치기하므로 읽는 쪽은 항상 완성된 파일만 봅니다.
+      바꿔치기 전에 메모리 맵으로 연 이전 파일은 닫을 때까지 그대로 유지됩니다.
+    - 원본 버전(S3 ETag 등)을 파일 안에 함께 기록해, 버전이 다르면 다시 로드합니다.
+      버전을 모르는 데이터 소스는 `max_age` 초가 지나면 다시 로드합니다.
+    - 압축하지 않고 저장하므로 숫자/시간 컬럼은 메모리 맵 페이지를 그대로 가리킵니다 (읽기 전용).
+    - 전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3, max_age: float = 300.0):
+        """
+        FrameCache를 초기화합니다.
+
+        Args:
+            directory (str): 캐시 디렉토리
+            max_bytes (int): 캐시 최대 용량 (바이트)
+            max_age (float): 버전을 모르는 데이터를 다시 로드하지 않고 쓰는 시간 (초)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple, version: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        캐시된 DataFrame을 메모리 맵으로 열어 반환합니다.
+
+        Args:
+            key (Tuple): (종류, 날짜, 전화번호, 센서), 종류는 ble/lte 또는 중복 제거 전 원본이면 ble_raw/lte_raw
+            version (str, optional): 원본의 현재 버전 (None이면 저장 시각으로 판단)
+
+        Returns:
+            Optional[pd.DataFrame]: 캐시된 데이터 (없거나 오래됐으면 None)
+        """
+        path = self._path(key)
+        try:
+            reader = ipc.open_file(pa.memory_map(path, "r"))
+        except (FileNotFoundError, pa.ArrowInvalid):
+            self.misses += 1
+            return None
+
+        metadata = reader.schema.metadata or {}
+        if version is not None:
+            fresh = metadata.get(VERSION_KEY) == version.encode("utf-8")
+        else:
+            written_at = float(metadata.get(WRITTEN_AT_KEY, b"0"))
+            fresh = time.time() - written_at < self.max_age
+        if not fresh:
+            self.misses += 1
+            return None
+
+        self._touch(path)
+        self.hits += 1
+        return reader.read_all().to_pandas(split_blocks=True)
+
+    def put(self, key: Tuple, df: pd.DataFrame, version: Optional[str] = None):
+        """
+        DataFrame을 Arrow IPC 파일로 저장합니다.
+
+        Args:
+            key (Tuple): (종류, 날짜, 전화번호, 센서)
+            df (pd.DataFrame): 정규화된 데이터
+            version (str, optional): 원본 버전
+        """
+        table = pa.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[WRITTEN_AT_KEY] = repr(time.time()).encode("utf-8")
+        if version is not None:
+            metadata[VERSION_KEY] = version.encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def total_bytes(self) -> int:
+        """캐시에 저장된 파일의 총 크기를 반환합니다."""
+        return sum(size for _, _, size in self._data_files())
+
+    def _evict(self):
+        """총 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 파일을 지웁니다."""
+        with self._lock:
+            files = sorted(self._data_files())
+            total = sum(size for _, _, size in files)
+            for _, path, size in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def _data_files(self):
+        """(마지막 사용 시각, 경로, 크기) 리스트"""
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".arrow"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+        return files
+
+    def _path(self, key: Tuple) -> str:
+        entry_id = hashlib.sha1("/".join(map(str, key)).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{entry_id}.arrow")
+
+    @staticmethod
+    def _touch(path: str):
+        """LRU 순서를 위해 마지막 사용 시각(mtime)을 갱신합니다."""
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+
+
+class FrameCacheLoader(BaseLoader):
+    """
+    정규화 데이터 캐시 로더 래퍼 클래스
+
+    임의의 BaseLoader를 감싸, 하루치 전체 로드 결과를 FrameCache에 보관하고 다음 로드부터는
+    원본 다운로드와 정규화 없이 메모리 맵 파일에서 바로 DataFrame을 만듭니다.
+    초 단위 중복 제거 전 원본(deduplicate=False)은 중복 제거한 데이터와 별도 항목으로 캐시하고,
+    시간 구간 등 그 밖의 추가 인자가 있는 로드는 캐시하지 않고 그대로 전달합니다.
+    반환하는 DataFrame의 숫자/시간 컬럼은 읽기 전용이므로 제자리 수정하면 안 됩니다.
+    """
+
+    def __init__(self, loader: BaseLoader, cache_dir: Optional[str] = None,
+                 max_bytes: Optional[int] = None, max_age: Optional[float] = None):
+        """
+        FrameCacheLoader를 초기화합니다.
+
+        Args:
+            loader (BaseLoader): 감쌀 데이터 로더
+            cache_dir (str, optional): 캐시 디렉토리
+                (기본값: 환경 변수 FRAME_CACHE_DIR, 빈 문자열이면 캐시 사용 안 함)
+            max_bytes (int, optional): 캐시 최대 용량
+                (기본값: 환경 변수 FRAME_CACHE_MAX_BYTES 또는 2GB)
+            max_age (float, optional): 버전을 모르는 데이터의 재사용 시간 (초)
+                (기본값: 환경 변수 FRAME_CACHE_MAX_AGE 또는 300초)
+        """
+        self.loader = loader
+
+        if cache_dir is None:
+            cache_dir = os.getenv("FRAME_CACHE_DIR", os.path.join(tempfile.gettempdir(), "sensor_dash_frames"))
+        if max_bytes is None:
+            max_bytes = int(os.getenv("FRAME_CACHE_MAX_BYTES", 2 * 1024 ** 3))
+        if max_age is None:
+            max_age = float(os.getenv("FRAME_CACHE_MAX_AGE", 300))
+        self.cache = FrameCache(cache_dir, max_bytes=max_bytes, max_age=max_age) if cache_dir else None
+
+    def _load(self, kind: str, is_lte: bool, date: str, phone: str, sensor: str, kwargs: dict) -> pd.DataFrame:
+        load = self.loader.load_lte_data if is_lte else self.loader.load_ble_data
+        options = dict(kwargs)
+        deduplicate = options.pop("deduplicate", True)
+        if self.cache is None or options:
+            return load(date, phone, sensor, **kwargs)
+
+        # 초 단위 중복 제거 전 원본(deduplicate=False)은 별도 항목으로 캐시한다
+        key = (kind, date, phone, sensor) if deduplicate else (kind + "_raw", date, phone, sensor)
+        version = self.loader.source_version(date, phone, sensor, is_lte)
+        df = self.cache.get(key, version)
+        if df is not None:
+            return df
+
+        df = load(date, phone, sensor) if deduplicate else load(date, phone, sensor, deduplicate=False)
+        try:
+            self.cache.put(key, df, version)
+        except OSError as e:
+            print(f"[경고] 정규화 데이터 캐시 저장 실패 {key}: {str(e)}")
+        return df
+
+    def load_ble_data(self, date: str, phone: str, sensor: str, **kwargs) -> pd.DataFrame:
+        """BLE 센서 데이터를 로드합니다. 캐시에 있으면 메모리 맵 파일에서 바로 읽습니다."""
+        return self._load("ble", False, date, phone, sensor, kwargs)
+
+    def load_lte_data(self, date: str, phone: str, sensor: str, **kwargs) -> pd.DataFrame:
+        """LTE 센서 데이터를 로드합니다. 캐시에 있으면 메모리 맵 파일에서 바로 읽습니다."""
+        return self._load("lte", True, date, phone, sensor, kwargs)
+
+    def load_second_summary(self, date: str, phone: str, sensor: str,
+                            is_lte: bool = False) -> Optional[pd.DataFrame]:
+        return self.loader.load_second_summary(date, phone, sensor, is_lte)
+
+    def range_partitions(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                         is_lte: bool = False) -> List[Tuple[str, str]]:
+        return self.loader.range_partitions(dates, phone, sensors, is_lte)
+
+    @property
+    def range_workers(self) -> int:
+        return self.loader.range_workers
+
+    def source_version(self, date: str, phone: str, sensor: str, is_lte: bool = False) -> Optional[str]:
+        return self.loader.source_version(date, phone, sensor, is_lte)
+
+    def show_date(self, is_lte: bool = False) -> List[str]:
+        return self.loader.show_date(is_lte)
+
+    def show_phonenum(self, date: str, is_lte: bool = False) -> List[str]:
+        return self.loader.show_phonenum(date, is_lte)
+
+    def show_sensor(self, date: str, phone: str, is_lte: bool = False) -> List[str]:
+        return self.loader.show_sensor(date, phone, is_lte)
+
+    def get_data_source_name(self) -> str:
+        return self.loader.get_data_source_name()
+
+    def __getattr__(self, name):
+        # close() 등 감싼 로더의 나머지 속성은 그대로 전달
+        if name == "loader":
+            raise AttributeError(name)
+        return getattr(self.loader, name)
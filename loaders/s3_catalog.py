@@ -0,0 +1,254 @@
+"""
+S3 카탈로그 모듈
+버킷 전체 목록을 페이지 단위로 읽어 날짜 → 전화번호 → 센서 인덱스를 메모리에 유지합니다.
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# 초당 집계 파일(사이드카) 접미사: `{date}/{sensor}_{phone}_{date}.summary.parquet`
+SUMMARY_SUFFIX = ".summary.parquet"
+
+
+class ObjectInfo(NamedTuple):
+    """카탈로그에 기록되는 S3 객체 정보"""
+    key: str
+    etag: str
+    size: int
+    last_modified: datetime
+
+
+def parse_object_key(key: str) -> Optional[tuple]:
+    """
+    `{date}/{sensor}_{phone}_{date}.parquet` 형식의 키를 (date, phone, sensor)로 분해합니다.
+
+    Args:
+        key (str): S3 객체 키
+
+    Returns:
+        tuple: (date, phone, sensor) 또는 형식이 맞지 않으면 None
+    """
+    if not key.strip() or not key.lower().endswith('.parquet') or '/' not in key:
+        return None
+    if key.lower().endswith(SUMMARY_SUFFIX):
+        return None
+    date, file_name = key.split('/', 1)
+    parts = file_name.split('/')[-1].split('_')
+    if len(parts) < 3:
+        return None
+    return date, parts[1], parts[0]
+
+
+def summary_key(key: str) -> str:
+    """원본 Parquet 객체 키에 대응하는 초당 집계 파일 키를 반환합니다."""
+    return key[:-len('.parquet')] + SUMMARY_SUFFIX
+
+
+def parse_summary_key(key: str) -> Optional[tuple]:
+    """
+    `{date}/{sensor}_{phone}_{date}.summary.parquet` 형식의 키를 (date, phone, sensor)로 분해합니다.
+
+    Args:
+        key (str): S3 객체 키
+
+    Returns:
+        tuple: (date, phone, sensor) 또는 초당 집계 파일이 아니면 None
+    """
+    if not key.lower().endswith(SUMMARY_SUFFIX):
+        return None
+    return parse_object_key(key[:-len(SUMMARY_SUFFIX)] + '.parquet')
+
+
+class S3Catalog:
+    """
+    S3 버킷 카탈로그 클래스
+
+    list_objects_v2를 끝까지 페이지네이션해서 (1000개 제한 없이) 인덱스를 만들고,
+    백그라운드 스레드가 주기적으로 증분 갱신합니다. 드롭다운 조회는 메모리에서만 응답합니다.
+    초당 집계 파일(사이드카)은 드롭다운에 나오지 않고 별도 인덱스에 기록됩니다.
+    """
+
+    def __init__(self, s3_client, bucket: str, refresh_interval: float = 300.0,
+                 recent_dates: int = 2, full_sync_every: int = 12):
+        """
+        S3Catalog를 초기화합니다.
+
+        Args:
+            s3_client: boto3 S3 클라이언트
+            bucket (str): 버킷 이름
+            refresh_interval (float): 백그라운드 갱신 주기 (초)
+            recent_dates (int): 증분 갱신 때 다시 읽을 최근 날짜 폴더 수
+            full_sync_every (int): 이 횟수마다 전체 목록을 다시 읽는다 (삭제 반영용)
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.refresh_interval = refresh_interval
+        self.recent_dates = recent_dates
+        self.full_sync_every = full_sync_every
+
+        self._index: Dict[str, Dict[str, Dict[str, ObjectInfo]]] = {}
+        self._summaries: Dict[str, Dict[Tuple[str, str], ObjectInfo]] = {}  # date -> (phone, sensor) -> 사이드카
+        self._last_key: Optional[str] = None
+        self._refresh_count = 0
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def dates(self) -> List[str]:
+        """날짜(폴더) 목록을 반환합니다."""
+        self.ensure_loaded()
+        with self._lock:
+            return sorted(self._index)
+
+    def phones(self, date: str) -> List[str]:
+        """특정 날짜의 전화번호 목록을 반환합니다."""
+        self.ensure_loaded()
+        with self._lock:
+            return sorted(self._index.get(date, {}))
+
+    def sensors(self, date: str, phone: str) -> List[str]:
+        """특정 날짜/전화번호의 센서 ID 목록을 반환합니다."""
+        self.ensure_loaded()
+        with self._lock:
+            return sorted(self._index.get(date, {}).get(phone, {}))
+
+    def get(self, date: str, phone: str, sensor: str) -> Optional[ObjectInfo]:
+        """특정 날짜/전화번호/센서의 객체 정보를 반환합니다. 없으면 None."""
+        self.ensure_loaded()
+        with self._lock:
+            return self._index.get(date, {}).get(phone, {}).get(sensor)
+
+    def summary(self, date: str, phone: str, sensor: str) -> Optional[ObjectInfo]:
+        """특정 날짜/전화번호/센서의 초당 집계 파일 정보를 반환합니다. 없으면 None."""
+        self.ensure_loaded()
+        with self._lock:
+            return self._summaries.get(date, {}).get((phone, sensor))
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def ensure_loaded(self):
+        """아직 한 번도 읽지 않았다면 전체 목록을 동기적으로 읽습니다."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.refresh(full=True)
+
+    def refresh(self, full: bool = False):
+        """
+        카탈로그를 갱신합니다.
+
+        증분 갱신은 마지막으로 본 키 이후의 객체(새 날짜)와, 아직 업로드가 진행 중일 수 있는
+        최근 날짜 폴더만 다시 읽습니다.
+
+        Args:
+            full (bool): True면 버킷 전체를 다시 읽는다
+        """
+        self._refresh_count += 1
+        if full or not self._loaded or self._refresh_count % self.full_sync_every == 0:
+            index: Dict[str, Dict[str, Dict[str, ObjectInfo]]] = {}
+            summaries: Dict[str, Dict[Tuple[str, str], ObjectInfo]] = {}
+            last_key = self._add_objects(index, self._list_objects(), summaries)
+            with self._lock:
+                self._index = index
+                self._summaries = summaries
+                self._last_key = last_key
+                self._loaded = True
+            return
+
+        with self._lock:
+            recent = sorted(self._index)[-self.recent_dates:] if self.recent_dates else []
+            start_after = self._last_key
+
+        # 최근 날짜 폴더는 통째로 다시 읽어 교체한다
+        for date in recent:
+            partial: Dict[str, Dict[str, Dict[str, ObjectInfo]]] = {}
+            partial_summaries: Dict[str, Dict[Tuple[str, str], ObjectInfo]] = {}
+            self._add_objects(partial, self._list_objects(prefix=f"{date}/"), partial_summaries)
+            with self._lock:
+                if date in partial:
+                    self._index[date] = partial[date]
+                else:
+                    self._index.pop(date, None)
+                if date in partial_summaries:
+                    self._summaries[date] = partial_summaries[date]
+                else:
+                    self._summaries.pop(date, None)
+
+        # 마지막 키 이후에 추가된 객체
+        new_index: Dict[str, Dict[str, Dict[str, ObjectInfo]]] = {}
+        new_summaries: Dict[str, Dict[Tuple[str, str], ObjectInfo]] = {}
+        last_key = self._add_objects(new_index, self._list_objects(start_after=start_after), new_summaries)
+        with self._lock:
+            for date, phones in new_index.items():
+                for phone, sensors in phones.items():
+                    self._index.setdefault(date, {}).setdefault(phone, {}).update(sensors)
+            for date, entries in new_summaries.items():
+                self._summaries.setdefault(date, {}).update(entries)
+            if last_key is not None:
+                self._last_key = max(last_key, self._last_key or '')
+
+    def start(self):
+        """백그라운드 갱신 스레드를 시작합니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"s3-catalog-{self.bucket}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """백그라운드 갱신 스레드를 멈춥니다."""
+        self._stop.set()
+
+    def _run(self):
+        while True:
+            try:
+                if self._loaded:
+                    self.refresh()
+                else:
+                    self.ensure_loaded()
+            except Exception as e:
+                print(f"[경고] S3 카탈로그 갱신 실패 ({self.bucket}): {type(e).__name__}: {str(e)}")
+            if self._stop.wait(self.refresh_interval):
+                break
+
+    def _list_objects(self, prefix: str = '', start_after: Optional[str] = None) -> Iterator[dict]:
+        """list_objects_v2를 끝까지 페이지네이션하며 객체를 하나씩 돌려줍니다."""
+        kwargs = {"Bucket": self.bucket, "Prefix": prefix}
+        if start_after:
+            kwargs["StartAfter"] = start_after
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(**kwargs):
+            for obj in page.get('Contents', []):
+                yield obj
+
+    @staticmethod
+    def _add_objects(index: dict, objects: Iterator[dict], summaries: Optional[dict] = None) -> Optional[str]:
+        """객체들을 인덱스(초당 집계 파일은 summaries)에 추가하고, 본 키 중 가장 큰 키를 반환합니다."""
+        last_key = None
+        for obj in objects:
+            key = obj['Key']
+            last_key = key if last_key is None else max(last_key, key)
+            info = ObjectInfo(
+                key=key,
+                etag=obj.get('ETag', ''),
+                size=obj.get('Size', 0),
+                last_modified=obj.get('LastModified'),
+            )
+            parsed = parse_object_key(key)
+            if parsed is not None:
+                date, phone, sensor = parsed
+                index.setdefault(date, {}).setdefault(phone, {})[sensor] = info
+                continue
+            parsed = parse_summary_key(key)
+            if parsed is not None and summaries is not None:
+                date, phone, sensor = parsed
+                summaries.setdefault(date, {})[(phone, sensor)] = info
+        return last_key
@@ -2,14 +2,18 @@
 S3 데이터 로더
 AWS S3 버킷에서 센서 데이터를 로드합니다.
 """
-from typing import List
-from io import BytesIO
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 import pandas as pd
+import pyarrow.parquet as pq
 import boto3
-from datetime import datetime
 
 from loaders.base import BaseLoader
-from core.data_processor import local_tz
+from loaders.disk_cache import ParquetDiskCache
+from loaders.s3_catalog import S3Catalog
+from loaders.s3_parquet import S3RangeFile, read_parquet_projected
+from core.data_processor import process_raw_data, normalize_timestamp, local_tz, BLE_RAW_COLUMNS, LTE_RAW_COLUMNS
+from core.progress import report_progress
 from config import ConfigDB
 
 
@@ -20,10 +24,22 @@ class S3Loader(BaseLoader):
     AWS S3 버킷에서 Parquet 파일을 읽어 BLE 및 LTE 센서 데이터를 로드합니다.
     """
 
-    def __init__(self):
+    # load_range에서 동시에 내려받는 객체 수 (boto3 기본 연결 풀 10개 안에서)
+    range_workers = 8
+
+    def __init__(self, catalog_refresh_interval: float = 300.0, cache_dir: Optional[str] = None,
+                 cache_max_bytes: Optional[int] = None):
         """
         S3Loader를 초기화합니다.
         S3 클라이언트를 생성하고 버킷 정보를 설정합니다.
+
+        Args:
+            catalog_refresh_interval (float): 버킷 카탈로그 백그라운드 갱신 주기 (초)
+            cache_dir (str, optional): 로컬 Parquet 캐시 디렉토리
+                (기본값: 환경 변수 S3_CACHE_DIR, 지정하지 않거나 빈 문자열이면 캐시 사용 안 함).
+                캐시를 켜면 객체 전체를 내려받아 보관하므로, 필요한 row group/컬럼만 ranged GET으로 읽지 않습니다.
+            cache_max_bytes (int, optional): 로컬 캐시 최대 용량
+                (기본값: 환경 변수 S3_CACHE_MAX_BYTES 또는 5GB)
         """
         # S3 설정
         s3_config_ble = ConfigDB.S3BUCKET["ble_backup"]
@@ -41,7 +57,23 @@ class S3Loader(BaseLoader):
         self.ble_bucket = s3_config_ble["name"]
         self.lte_bucket = s3_config_lte["name"]
 
-    def load_ble_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+        # 날짜/전화번호/센서 드롭다운용 카탈로그 (is_lte -> S3Catalog)
+        self.catalogs = {
+            False: S3Catalog(self.s3_client, self.ble_bucket, refresh_interval=catalog_refresh_interval),
+            True: S3Catalog(self.s3_client, self.lte_bucket, refresh_interval=catalog_refresh_interval),
+        }
+        for catalog in self.catalogs.values():
+            catalog.start()
+
+        # 로컬 디스크 캐시
+        if cache_dir is None:
+            cache_dir = os.getenv("S3_CACHE_DIR", "")
+        if cache_max_bytes is None:
+            cache_max_bytes = int(os.getenv("S3_CACHE_MAX_BYTES", 5 * 1024 ** 3))
+        self.disk_cache = ParquetDiskCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None
+
+    def load_ble_data(self, date: str, phone: str, sensor: str,
+                      time_range: Optional[Tuple[int, int]] = None, deduplicate: bool = True) -> pd.DataFrame:
         """
         BLE 센서 데이터를 S3에서 로드합니다.
 
@@ -49,88 +81,152 @@ class S3Loader(BaseLoader):
             date (str): 날짜 (폴더명)
             phone (str): 전화번호
             sensor (str): 센서 ID
+            time_range (Tuple[int, int], optional): (시작, 끝) 밀리초 타임스탬프.
+                지정하면 이 구간과 겹치는 row group만 읽습니다.
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 밀리초 단위 DATE로 반환 (기본값: True)
 
         Returns:
             pd.DataFrame: BLE 센서 데이터
         """
-        object_key = f"{date}/{sensor}_{phone}_{date}.parquet"
-        response = self.s3_client.get_object(Bucket=self.ble_bucket, Key=object_key)
-        parquet_content = response['Body'].read()
+        report_progress("download")
+        df = self._read_source(False, date, phone, sensor,
+                               lambda source: read_parquet_projected(source, BLE_RAW_COLUMNS, time_range=time_range))
 
-        # 가상 메모리의 내용을 BytesIO 객체로 변환
-        parquet_buffer = BytesIO(parquet_content)
+        # 데이터 처리
+        report_progress("parse")
+        raw_data = process_raw_data(df[BLE_RAW_COLUMNS], local_tz, deduplicate=deduplicate)
 
-        # parquet 파일을 pandas DataFrame으로 읽기
-        df = pd.read_parquet(parquet_buffer)
-        parquet_buffer.close()
+        return raw_data
 
-        raw_data = df[[
-            "time", "sensor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VELOCITY", "ALTITUDE", "BEARING"
-        ]]
+    def load_lte_data(self, date: str, phone: str, sensor: str,
+                      time_range: Optional[Tuple[int, int]] = None, deduplicate: bool = True) -> pd.DataFrame:
+        """
+        LTE 센서 데이터를 S3에서 로드합니다.
 
-        # 시간 정렬
-        raw_data.sort_values(by=['time'], ascending=True, inplace=True)
-        raw_data['time'] = raw_data['time'].apply(
-            lambda x: datetime.fromtimestamp(x / 1000, tz=local_tz).strftime('%Y-%m-%d %H:%M:%S')
-        )
+        Args:
+            date (str): 날짜 (폴더명)
+            phone (str): 전화번호
+            sensor (str): 센서 ID
+            time_range (Tuple[int, int], optional): (시작, 끝) 밀리초 타임스탬프.
+                지정하면 이 구간과 겹치는 row group만 읽습니다.
+            deduplicate (bool): False면 초 단위 중복 제거 전 모든 샘플을 밀리초 단위 DATE로 반환 (기본값: True)
 
-        # 컬럼명 표준화
-        raw_data.columns = [
-            "DATE", "senor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VEL", "ALT", "HEAD"
-        ]
+        Returns:
+            pd.DataFrame: LTE 센서 데이터
+        """
+        report_progress("download")
+        df = self._read_source(True, date, phone, sensor,
+                               lambda source: read_parquet_projected(source, LTE_RAW_COLUMNS, time_range=time_range))
 
-        raw_data = raw_data.reset_index(drop=True)
-        raw_data["DATE"] = pd.to_datetime(raw_data["DATE"])
-        raw_data.drop_duplicates(subset='DATE', inplace=True)
+        # 데이터 처리
+        report_progress("parse")
+        raw_data = process_raw_data(df[LTE_RAW_COLUMNS], local_tz, deduplicate=deduplicate)
 
         return raw_data
 
-    def load_lte_data(self, date: str, phone: str, sensor: str) -> pd.DataFrame:
+    def load_second_summary(self, date: str, phone: str, sensor: str,
+                            is_lte: bool = False) -> Optional[pd.DataFrame]:
         """
-        LTE 센서 데이터를 S3에서 로드합니다.
+        원본 Parquet 옆에 미리 만들어 둔 초당 집계 파일(`*.summary.parquet`)을 로드합니다.
+
+        집계 파일은 `python -m tools.build_summaries`로 만듭니다. 카탈로그에 집계 파일이 없거나
+        원본이 집계 파일보다 나중에 바뀌었으면 None을 반환하고, 호출자는 원본 데이터를 집계합니다.
 
         Args:
             date (str): 날짜 (폴더명)
             phone (str): 전화번호
             sensor (str): 센서 ID
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
 
         Returns:
-            pd.DataFrame: LTE 센서 데이터
+            Optional[pd.DataFrame]: 초당 집계 데이터 (컬럼: DATE, count, <채널>_mean/_min/_max, LAT_first, LON_first)
+        """
+        catalog = self.catalogs[is_lte]
+        info = catalog.summary(date, phone, sensor)
+        if info is None:
+            return None
+        raw = catalog.get(date, phone, sensor)
+        if raw is not None and raw.last_modified and info.last_modified and raw.last_modified > info.last_modified:
+            return None
+
+        report_progress("download")
+        df = self._read_object(is_lte, info.key, info.etag, lambda source: pq.ParquetFile(source).read().to_pandas())
+
+        # 데이터 처리: 초 시작 시각(밀리초)을 DATE로 변환
+        report_progress("parse")
+        df.insert(0, "DATE", normalize_timestamp(df.pop("time"), local_tz))
+        return df
+
+    def _read_source(self, is_lte: bool, date: str, phone: str, sensor: str, read: Callable[[Any], Any]):
+        """원본 Parquet 읽기 소스를 `read`로 읽은 결과를 반환합니다."""
+        info = self.catalogs[is_lte].get(date, phone, sensor) if self.disk_cache is not None else None
+        return self._read_object(is_lte, f"{date}/{sensor}_{phone}_{date}.parquet",
+                                 info.etag if info is not None else None, read)
+
+    def _read_object(self, is_lte: bool, object_key: str, known_etag: Optional[str], read: Callable[[Any], Any]):
         """
-        object_key = f"{date}/{sensor}_{phone}_{date}.parquet"
-        response = self.s3_client.get_object(Bucket=self.lte_bucket, Key=object_key)
-        parquet_content = response['Body'].read()
+        Parquet 읽기 소스를 `read`로 읽은 결과를 반환합니다.
 
-        # 가상 메모리의 내용을 BytesIO 객체로 변환
-        parquet_buffer = BytesIO(parquet_content)
+        디스크 캐시 파일을 열기 전에 다른 스레드의 용량 정리나 새 버전 저장으로 파일이 지워졌으면
+        (FileNotFoundError) 캐시를 다시 채워 한 번 더 읽습니다.
+        """
+        try:
+            return read(self._open_object(is_lte, object_key, known_etag))
+        except FileNotFoundError:
+            if self.disk_cache is None:
+                raise
+            return read(self._open_object(is_lte, object_key, known_etag))
+
+    def _open_object(self, is_lte: bool, object_key: str, known_etag: Optional[str] = None):
+        """
+        Parquet 읽기 소스를 반환합니다.
 
-        # parquet 파일을 pandas DataFrame으로 읽기
-        df = pd.read_parquet(parquet_buffer)
-        parquet_buffer.close()
+        디스크 캐시가 켜져 있으면 (필요 시 내려받은) 로컬 파일 경로를,
+        아니면 footer를 먼저 읽고 필요한 구간만 ranged GET으로 가져오는 S3RangeFile을 반환합니다.
+        """
+        bucket = self.lte_bucket if is_lte else self.ble_bucket
 
-        raw_data = df[[
-            "time", "sensor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VELOCITY", "ALTITUDE", "BEARING", "TIME", "DISTANCE"
-        ]]
+        if self.disk_cache is None:
+            return S3RangeFile(self.s3_client, bucket, object_key)
 
-        # 시간 정렬
-        raw_data.sort_values(by=['time'], ascending=True, inplace=True)
-        raw_data['time'] = raw_data['time'].apply(
-            lambda x: datetime.fromtimestamp(x / 1000, tz=local_tz).strftime('%Y-%m-%d %H:%M:%S')
-        )
+        return self.disk_cache.fetch(self.s3_client, bucket, object_key, known_etag=known_etag)
 
-        # 컬럼명 표준화
-        raw_data.columns = [
-            "DATE", "senor_id", "ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X",
-            "GYRO_Y", "GYRO_Z", "PITCH", "ROLL", "LAT", "LON", "VEL", "ALT", "HEAD", "TIME", "DISTANCE"
-        ]
+    def range_partitions(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                         is_lte: bool = False) -> List[Tuple[str, str]]:
+        """
+        카탈로그에 객체가 있는 (날짜, 센서) 조각 목록을 반환합니다 (S3 요청 없음).
 
-        raw_data["DATE"] = pd.to_datetime(raw_data["DATE"])
-        raw_data.drop_duplicates(subset='DATE', inplace=True)
+        Args:
+            dates (Sequence[str]): 날짜 목록 (폴더명)
+            phone (str): 전화번호
+            sensors (Sequence[str], optional): 센서 ID 목록 (기본값: 날짜별 전체 센서)
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
 
-        return raw_data
+        Returns:
+            List[Tuple[str, str]]: (날짜, 센서) 리스트
+        """
+        catalog = self.catalogs[is_lte]
+        partitions = []
+        for date in dates:
+            chosen = catalog.sensors(date, phone) if sensors is None else sensors
+            partitions += [(date, sensor) for sensor in chosen if catalog.get(date, phone, sensor) is not None]
+        return partitions
+
+    def source_version(self, date: str, phone: str, sensor: str, is_lte: bool = False) -> Optional[str]:
+        """
+        카탈로그에 기록된 객체 ETag를 반환합니다.
+
+        Args:
+            date (str): 날짜 (폴더명)
+            phone (str): 전화번호
+            sensor (str): 센서 ID
+            is_lte (bool): True면 LTE, False면 BLE (기본값: False)
+
+        Returns:
+            Optional[str]: ETag (카탈로그에 없으면 None)
+        """
+        info = self.catalogs[is_lte].get(date, phone, sensor)
+        return info.etag if info is not None else None
 
     def show_date(self, is_lte: bool = False) -> List[str]:
         """
@@ -142,13 +238,7 @@ class S3Loader(BaseLoader):
         Returns:
             List[str]: 날짜 문자열 리스트
         """
-        bucket = self.lte_bucket if is_lte else self.ble_bucket
-        response = self.s3_client.list_objects_v2(Bucket=bucket, Delimiter='/')
-        if 'CommonPrefixes' in response:
-            date_list = [prefix['Prefix'].rstrip('/') for prefix in response['CommonPrefixes']]
-        else:
-            date_list = []
-        return date_list
+        return self.catalogs[is_lte].dates()
 
     def show_phonenum(self, date: str, is_lte: bool = False) -> List[str]:
         """
@@ -161,21 +251,7 @@ class S3Loader(BaseLoader):
         Returns:
             List[str]: 전화번호 리스트
         """
-        bucket = self.lte_bucket if is_lte else self.ble_bucket
-        response = self.s3_client.list_objects_v2(Bucket=bucket, Prefix=date)
-        file_keys = [
-            obj['Key'] for obj in response.get('Contents', [])
-            if obj['Key'].strip() and obj['Key'].lower().endswith('.parquet')
-        ]
-
-        phone_set = set()
-        for key in file_keys:
-            parts = key.split('/')[-1].split('_')
-            if parts:
-                phone_num = parts[1]
-                phone_set.add(phone_num)
-
-        return list(phone_set)
+        return self.catalogs[is_lte].phones(date)
 
     def show_sensor(self, date: str, phone: str, is_lte: bool = False) -> List[str]:
         """
@@ -189,15 +265,11 @@ class S3Loader(BaseLoader):
         Returns:
             List[str]: 센서 ID 리스트
         """
-        bucket = self.lte_bucket if is_lte else self.ble_bucket
-        response = self.s3_client.list_objects_v2(Bucket=bucket, Prefix=date)
-        file_keys = [
-            obj['Key'] for obj in response.get('Contents', [])
-            if obj['Key'].strip() and obj['Key'].lower().endswith('.parquet')
-        ]
+        return self.catalogs[is_lte].sensors(date, phone)
 
-        specific_string = phone
-        filtered_keys = list(filter(lambda key: specific_string in key, file_keys))
-        sensor_ids = [key.split('/')[-1].split('_')[0] for key in filtered_keys]
-
-        return sensor_ids
+    def close(self):
+        """
+        카탈로그 갱신 스레드를 멈춥니다.
+        """
+        for catalog in self.catalogs.values():
+            catalog.stop()
@@ -0,0 +1,254 @@
+"""
+S3 Parquet 부분 읽기 모듈
+Parquet footer를 먼저 읽고, 필요한 컬럼과 시간 구간에 걸친 row group만 ranged GET으로 가져옵니다.
+"""
+import io
+from typing import List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+# footer 선읽기 크기 (대부분의 footer는 이 안에 들어온다)
+FOOTER_PREFETCH_BYTES = 64 * 1024
+
+# 이 간격보다 가까운 column chunk 범위는 하나의 GET으로 합친다
+RANGE_COALESCE_GAP = 1024 * 1024
+
+
+class S3RangeFile(io.RawIOBase):
+    """
+    S3 객체를 읽기 전용 파일처럼 다루는 클래스
+
+    read() 요청을 `Range` 헤더가 붙은 get_object 호출로 바꿉니다.
+    prefetch()로 미리 받아 둔 구간은 네트워크 요청 없이 메모리에서 제공합니다.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, size: Optional[int] = None,
+                 footer_bytes: int = FOOTER_PREFETCH_BYTES):
+        """
+        S3RangeFile을 초기화하고 객체 끝부분(footer)을 미리 읽습니다.
+
+        Args:
+            s3_client: boto3 S3 클라이언트
+            bucket (str): 버킷 이름
+            key (str): 객체 키
+            size (int, optional): 객체 크기 (없으면 footer를 읽으면서 알아낸다)
+            footer_bytes (int): footer 선읽기 크기
+        """
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self._pos = 0
+        self._buffers: List[Tuple[int, bytes]] = []
+
+        # 통계
+        self.request_count = 0
+        self.bytes_fetched = 0
+
+        # footer 선읽기 (suffix range는 객체 크기를 몰라도 된다)
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes=-{footer_bytes}"
+        )
+        tail = response['Body'].read()
+        self.request_count += 1
+        self.bytes_fetched += len(tail)
+
+        if size is None:
+            content_range = response.get('ContentRange')
+            size = int(content_range.split('/')[-1]) if content_range else len(tail)
+        self.size = size
+        self._buffers.append((self.size - len(tail), tail))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"잘못된 whence 값: {whence}")
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._pos
+        end = self.size if size is None or size < 0 else min(self._pos + size, self.size)
+        if start >= end:
+            return b""
+
+        data = self._read_buffered(start, end)
+        if data is None:
+            data = self._fetch(start, end)
+        self._pos = end
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def prefetch(self, ranges: Sequence[Tuple[int, int]], gap: int = RANGE_COALESCE_GAP):
+        """
+        주어진 [start, end) 구간들을 가까운 것끼리 합쳐 미리 받아 둡니다.
+
+        Args:
+            ranges (Sequence[Tuple[int, int]]): 바이트 구간 목록
+            gap (int): 이 간격 이하로 떨어진 구간은 하나의 요청으로 합친다
+        """
+        for start, end in coalesce_ranges(ranges, gap):
+            if self._read_buffered(start, end) is None:
+                self._buffers.append((start, self._fetch(start, end)))
+
+    def _read_buffered(self, start: int, end: int) -> Optional[bytes]:
+        for buf_start, buf in self._buffers:
+            if buf_start <= start and end <= buf_start + len(buf):
+                return buf[start - buf_start:end - buf_start]
+        return None
+
+    def _fetch(self, start: int, end: int) -> bytes:
+        response = self.s3_client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={start}-{end - 1}"
+        )
+        data = response['Body'].read()
+        self.request_count += 1
+        self.bytes_fetched += len(data)
+        return data
+
+
+def coalesce_ranges(ranges: Sequence[Tuple[int, int]], gap: int = RANGE_COALESCE_GAP) -> List[Tuple[int, int]]:
+    """
+    [start, end) 바이트 구간들을 정렬하고, `gap` 이하로 떨어진 구간을 합칩니다.
+
+    Args:
+        ranges (Sequence[Tuple[int, int]]): 바이트 구간 목록
+        gap (int): 합칠 최대 간격
+
+    Returns:
+        List[Tuple[int, int]]: 합쳐진 구간 목록
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start - merged[-1][1] <= gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def select_row_groups(metadata: pq.FileMetaData, time_column: str = "time",
+                      time_range: Optional[Tuple[int, int]] = None) -> List[int]:
+    """
+    시간 구간과 겹치는 row group 번호를 반환합니다.
+
+    min/max 통계가 없는 row group은 건너뛸 수 없으므로 항상 포함합니다.
+
+    Args:
+        metadata (pq.FileMetaData): Parquet footer 메타데이터
+        time_column (str): 시간 컬럼 이름
+        time_range (Tuple[int, int], optional): (시작, 끝) 밀리초 타임스탬프 (양끝 포함)
+
+    Returns:
+        List[int]: row group 번호 리스트
+    """
+    if time_range is None:
+        return list(range(metadata.num_row_groups))
+
+    time_idx = _column_index(metadata).get(time_column)
+    start_ms, end_ms = time_range
+    selected = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(time_idx).statistics if time_idx is not None else None
+        if stats is None or not stats.has_min_max:
+            selected.append(i)
+        elif stats.max >= start_ms and stats.min <= end_ms:
+            selected.append(i)
+    return selected
+
+
+def column_chunk_ranges(metadata: pq.FileMetaData, row_groups: Sequence[int],
+                        columns: Sequence[str]) -> List[Tuple[int, int]]:
+    """
+    선택한 row group / 컬럼의 column chunk 바이트 구간 [start, end)를 반환합니다.
+
+    Args:
+        metadata (pq.FileMetaData): Parquet footer 메타데이터
+        row_groups (Sequence[int]): row group 번호
+        columns (Sequence[str]): 컬럼 이름
+
+    Returns:
+        List[Tuple[int, int]]: 바이트 구간 리스트
+    """
+    index = _column_index(metadata)
+    ranges = []
+    for i in row_groups:
+        row_group = metadata.row_group(i)
+        for name in columns:
+            if name not in index:
+                continue
+            chunk = row_group.column(index[name])
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+                start = min(start, chunk.dictionary_page_offset)
+            ranges.append((start, start + chunk.total_compressed_size))
+    return ranges
+
+
+def read_parquet_projected(source, columns: Sequence[str], time_range: Optional[Tuple[int, int]] = None,
+                           time_column: str = "time") -> pd.DataFrame:
+    """
+    Parquet 파일에서 필요한 컬럼과 row group만 읽어 DataFrame으로 반환합니다.
+
+    `source`가 S3RangeFile이면 footer 메타데이터로 필요한 column chunk 구간을 계산해
+    합쳐진 ranged GET으로 미리 받아 둔 뒤 디코딩합니다.
+
+    Args:
+        source: S3RangeFile, 로컬 파일 경로 또는 파일 객체
+        columns (Sequence[str]): 읽을 컬럼
+        time_range (Tuple[int, int], optional): (시작, 끝) 밀리초 타임스탬프 (양끝 포함)
+        time_column (str): 시간 컬럼 이름
+
+    Returns:
+        pd.DataFrame: 선택한 컬럼만 담은 DataFrame
+    """
+    parquet_file = pq.ParquetFile(source)
+    metadata = parquet_file.metadata
+    columns = list(columns)
+
+    row_groups = select_row_groups(metadata, time_column, time_range)
+    if hasattr(source, 'prefetch'):
+        source.prefetch(column_chunk_ranges(metadata, row_groups, columns))
+
+    if row_groups:
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+    else:
+        table = parquet_file.schema_arrow.empty_table().select(columns)
+    df = table.to_pandas()
+
+    # row group 단위로 고른 결과에서 구간 밖의 행을 잘라낸다
+    if time_range is not None:
+        start_ms, end_ms = time_range
+        df = df[(df[time_column] >= start_ms) & (df[time_column] <= end_ms)]
+
+    return df
+
+
+def _column_index(metadata: pq.FileMetaData) -> dict:
+    """컬럼 이름 -> column chunk 번호"""
+    if metadata.num_row_groups == 0:
+        return {}
+    row_group = metadata.row_group(0)
+    return {row_group.column(j).path_in_schema: j for j in range(row_group.num_columns)}
@@ -0,0 +1,156 @@
+"""
+Single-flight 로더 래퍼
+같은 (종류, 날짜, 전화번호, 센서) 데이터를 동시에 요청하면 로드를 한 번만 실행하고 결과를 공유합니다.
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from core.progress import JobCancelled
+from loaders.base import BaseLoader
+
+
+class _Call:
+    """진행 중인 로드 하나"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlightLoader(BaseLoader):
+    """
+    Single-flight 로더 래퍼 클래스
+
+    임의의 BaseLoader를 감싸, 진행 중인 로드와 같은 요청이 들어오면 새로 S3 GET이나
+    Mongo 조회를 시작하지 않고 진행 중인 로드가 끝나기를 기다려 같은 결과를 돌려줍니다.
+    결과 DataFrame은 기다린 호출자들이 함께 쓰므로 제자리 수정하면 안 됩니다.
+    로드가 끝나면 결과를 보관하지 않습니다 (보관은 DatasetCache가 담당).
+    합치기는 같은 프로세스 안의 스레드 사이에서만 일어나며, 합친 횟수는 stats()로 확인합니다.
+    """
+
+    def __init__(self, loader: BaseLoader):
+        """
+        SingleFlightLoader를 초기화합니다.
+
+        Args:
+            loader (BaseLoader): 감쌀 데이터 로더
+        """
+        self.loader = loader
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.calls = 0       # 전체 로드 요청 수
+        self.loads = 0       # 실제로 실행한 로드 수
+        self.coalesced = 0   # 진행 중인 로드에 합류한 요청 수
+
+    def _do(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        key에 해당하는 로드가 진행 중이면 기다렸다가 그 결과를, 아니면 직접 로드한 결과를 반환합니다.
+
+        Args:
+            key (Hashable): 요청 키
+            load (Callable): 실제 로드 함수
+
+        Returns:
+            Any: 로드 결과 (로드가 실패하면 같은 예외를 다시 발생)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.loads += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if isinstance(call.error, JobCancelled):
+                # 로드를 실행하던 작업만 취소된 것이므로 이 요청은 다시 로드한다
+                return self._do(key, load)
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = load()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    @staticmethod
+    def _key(kind: str, date: str, phone: str, sensor: str, kwargs: dict) -> Hashable:
+        return (kind, date, phone, sensor, tuple(sorted(kwargs.items())))
+
+    def load_ble_data(self, date: str, phone: str, sensor: str, **kwargs) -> pd.DataFrame:
+        """BLE 센서 데이터를 로드합니다. 같은 요청이 진행 중이면 그 결과를 공유합니다."""
+        return self._do(self._key("ble", date, phone, sensor, kwargs),
+                        lambda: self.loader.load_ble_data(date, phone, sensor, **kwargs))
+
+    def load_lte_data(self, date: str, phone: str, sensor: str, **kwargs) -> pd.DataFrame:
+        """LTE 센서 데이터를 로드합니다. 같은 요청이 진행 중이면 그 결과를 공유합니다."""
+        return self._do(self._key("lte", date, phone, sensor, kwargs),
+                        lambda: self.loader.load_lte_data(date, phone, sensor, **kwargs))
+
+    def load_second_summary(self, date: str, phone: str, sensor: str,
+                            is_lte: bool = False) -> Optional[pd.DataFrame]:
+        """초당 집계 데이터를 로드합니다. 같은 요청이 진행 중이면 그 결과를 공유합니다."""
+        kind = "lte_summary" if is_lte else "ble_summary"
+        return self._do(self._key(kind, date, phone, sensor, {}),
+                        lambda: self.loader.load_second_summary(date, phone, sensor, is_lte))
+
+    def range_partitions(self, dates: Sequence[str], phone: str, sensors: Optional[Sequence[str]] = None,
+                         is_lte: bool = False) -> List[Tuple[str, str]]:
+        return self.loader.range_partitions(dates, phone, sensors, is_lte)
+
+    @property
+    def range_workers(self) -> int:
+        return self.loader.range_workers
+
+    def source_version(self, date: str, phone: str, sensor: str, is_lte: bool = False) -> Optional[str]:
+        return self.loader.source_version(date, phone, sensor, is_lte)
+
+    def show_date(self, is_lte: bool = False) -> List[str]:
+        return self.loader.show_date(is_lte)
+
+    def show_phonenum(self, date: str, is_lte: bool = False) -> List[str]:
+        return self.loader.show_phonenum(date, is_lte)
+
+    def show_sensor(self, date: str, phone: str, is_lte: bool = False) -> List[str]:
+        return self.loader.show_sensor(date, phone, is_lte)
+
+    def get_data_source_name(self) -> str:
+        return self.loader.get_data_source_name()
+
+    def stats(self) -> dict:
+        """
+        요청 합치기 통계를 반환합니다.
+
+        Returns:
+            dict: calls, loads, coalesced, in_flight
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "loads": self.loads,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def __getattr__(self, name):
+        # close() 등 감싼 로더의 나머지 속성은 그대로 전달
+        if name == "loader":
+            raise AttributeError(name)
+        return getattr(self.loader, name)
@@ -0,0 +1,90 @@
+"""
+cleaning_data 속성 테스트
+단일 패스 구현이 기존 반복 drop/재계산 구현과 같은 결과를 내는지 무작위 입력과 경계 사례로 확인합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_processor import cleaning_data
+
+NINE_HOURS_NS = 32400000000000
+STEPS_NS = np.array([0, 1_000_000_000, 2_000_000_000, NINE_HOURS_NS, NINE_HOURS_NS + 1_000_000_000], dtype=np.int64)
+
+
+def legacy_cleaning_data(data: pd.DataFrame) -> pd.DataFrame:
+    """단일 패스로 바꾸기 전의 cleaning_data 구현 (비교 기준)"""
+    def jump_positions(frame):
+        diff = np.diff(frame["DATE"].values.astype("datetime64[ns]")).astype(np.int64)
+        return list(np.where((diff == 32400000000000) | (diff == 32401000000000))[0])
+
+    over_9_idx_list = jump_positions(data)
+    while len(over_9_idx_list) != 0:
+        data = data.drop(over_9_idx_list)
+        data.reset_index(inplace=True, drop=True)
+        over_9_idx_list = jump_positions(data)
+
+    data.reset_index(inplace=True, drop=True)
+    return data
+
+
+def frame_from_steps(steps_ns) -> pd.DataFrame:
+    """DATE 차분(나노초) 목록으로 DATE, VALUE 컬럼 DataFrame을 만듭니다 (행 수 = 차분 수 + 1)."""
+    steps = np.asarray(steps_ns, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(steps))) if steps.size else np.array([0], dtype=np.int64)
+    dates = pd.to_datetime(1_700_000_000_000_000_000 + offsets).tz_localize("UTC").tz_convert("Asia/Seoul")
+    return pd.DataFrame({"DATE": dates, "VALUE": np.arange(len(dates), dtype=np.float64)})
+
+
+def random_frame(rng: np.random.Generator) -> pd.DataFrame:
+    """1초 간격 데이터에 앞/뒤 방향 9시간 점프를 무작위로 섞은 DataFrame을 만듭니다."""
+    rows = int(rng.integers(1, 80))
+    steps = np.full(rows - 1, 1_000_000_000, dtype=np.int64)
+    glitches = int(rng.integers(0, rows))
+    positions = rng.integers(0, max(rows - 1, 1), size=glitches) if rows > 1 else np.array([], dtype=np.int64)
+    steps[positions] = rng.choice(STEPS_NS, size=positions.size)
+    steps[positions[rng.random(positions.size) < 0.5]] *= -1
+    return frame_from_steps(steps)
+
+
+def assert_same_as_legacy(frame: pd.DataFrame):
+    expected = legacy_cleaning_data(frame.copy())
+    actual = cleaning_data(frame)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_legacy_on_random_frames(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(100):
+        assert_same_as_legacy(random_frame(rng))
+
+
+def test_empty_frame():
+    frame = frame_from_steps([]).iloc[:0].reset_index(drop=True)
+    assert_same_as_legacy(frame)
+    assert cleaning_data(frame).empty
+
+
+def test_single_row():
+    frame = frame_from_steps([])
+    assert_same_as_legacy(frame)
+    assert len(cleaning_data(frame)) == 1
+
+
+def test_every_row_but_last_dropped():
+    # 모든 차분이 9시간이면 마지막 행만 남는다
+    frame = frame_from_steps([NINE_HOURS_NS, NINE_HOURS_NS + 1_000_000_000, NINE_HOURS_NS])
+    assert_same_as_legacy(frame)
+    assert cleaning_data(frame)["VALUE"].tolist() == [3.0]
+
+
+def test_cascading_jumps():
+    # 앞 행을 지우면 새로 이웃한 쌍이 다시 9시간 차이가 되는 경우
+    frame = frame_from_steps([NINE_HOURS_NS, 0, NINE_HOURS_NS, -NINE_HOURS_NS, NINE_HOURS_NS])
+    assert_same_as_legacy(frame)
+
+
+def test_no_jumps_keeps_frame():
+    frame = frame_from_steps(np.full(10, 1_000_000_000))
+    pd.testing.assert_frame_equal(cleaning_data(frame), frame)
@@ -0,0 +1,43 @@
+"""
+원본 정규화 테스트
+process_raw_data(deduplicate=False)가 밀리초 단위 DATE의 모든 샘플을 돌려주고,
+drop_second_duplicates를 거치면 process_raw_data(deduplicate=True)와 같은 데이터가 되는지 확인합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_processor import BLE_RAW_COLUMNS, drop_second_duplicates, process_raw_data
+
+
+def raw_frame(rng: np.random.Generator, rows: int) -> pd.DataFrame:
+    """초마다 여러 샘플이 있고 시간 순서가 섞인 원본 DataFrame을 생성합니다."""
+    times = 1_700_000_000_000 + rng.integers(0, rows * 100, size=rows)
+    data = {"time": rng.permutation(times), "sensor_id": "S0001"}
+    for column in BLE_RAW_COLUMNS[2:]:
+        data[column] = rng.normal(size=rows)
+    return pd.DataFrame(data)[BLE_RAW_COLUMNS]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_raw_keeps_every_sample_in_milliseconds(seed):
+    df = raw_frame(np.random.default_rng(seed), 2000)
+    raw = process_raw_data(df, deduplicate=False)
+
+    assert len(raw) == len(df)
+    assert raw["DATE"].is_monotonic_increasing
+    millis = raw["DATE"].values.astype("datetime64[ms]").astype(np.int64)
+    np.testing.assert_array_equal(millis, np.sort(df["time"].to_numpy()))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_drop_second_duplicates_matches_deduplicated_load(seed):
+    df = raw_frame(np.random.default_rng(seed), 2000)
+    derived = drop_second_duplicates(process_raw_data(df, deduplicate=False))
+    pd.testing.assert_frame_equal(derived, process_raw_data(df))
+
+
+def test_drop_second_duplicates_empty():
+    df = raw_frame(np.random.default_rng(0), 0)
+    derived = drop_second_duplicates(process_raw_data(df, deduplicate=False))
+    assert derived.empty
@@ -0,0 +1,92 @@
+"""
+S3 디스크 캐시 테스트
+용량 정리가 반환할 파일을 지우지 않고, 읽기 전에 지워진 캐시 파일은 다시 내려받아 읽는지 확인합니다.
+"""
+import hashlib
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from botocore.exceptions import ClientError
+
+from loaders.disk_cache import ParquetDiskCache
+from loaders.s3_loader import S3Loader
+
+
+class FakeS3:
+    """get_object(조건부 GET 포함)만 흉내 내는 S3 클라이언트"""
+
+    def __init__(self):
+        self.objects = {}
+        self.gets = 0
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        data = self.objects[(Bucket, Key)]
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+        if IfNoneMatch == etag:
+            raise ClientError({"Error": {"Code": "304"}, "ResponseMetadata": {"HTTPStatusCode": 304}}, "GetObject")
+        self.gets += 1
+        return {"Body": io.BytesIO(data), "ETag": etag}
+
+
+def parquet_bytes(values) -> bytes:
+    buffer = io.BytesIO()
+    pq.write_table(pa.table({"value": values}), buffer)
+    return buffer.getvalue()
+
+
+def test_object_larger_than_cache_is_kept(tmp_path):
+    s3 = FakeS3()
+    s3.objects[("bucket", "big.parquet")] = b"x" * 1000
+    cache = ParquetDiskCache(str(tmp_path), max_bytes=100)
+
+    path = cache.fetch(s3, "bucket", "big.parquet")
+    assert os.path.exists(path)
+
+
+def test_eviction_keeps_the_stored_file(tmp_path):
+    s3 = FakeS3()
+    cache = ParquetDiskCache(str(tmp_path), max_bytes=1500)
+    paths = []
+    for i in range(3):
+        s3.objects[("bucket", f"{i}.parquet")] = bytes([i]) * 1000
+        paths.append(cache.fetch(s3, "bucket", f"{i}.parquet"))
+        os.utime(paths[-1], (i, i))
+
+    assert os.path.exists(paths[-1])
+    assert not os.path.exists(paths[0])
+
+
+def test_reader_refetches_deleted_file(tmp_path):
+    s3 = FakeS3()
+    s3.objects[("bucket", "data.parquet")] = parquet_bytes([1, 2, 3])
+
+    loader = S3Loader.__new__(S3Loader)
+    loader.s3_client = s3
+    loader.ble_bucket = "bucket"
+    loader.disk_cache = ParquetDiskCache(str(tmp_path))
+
+    removed = []
+
+    def read(source):
+        # 첫 읽기 직전에 다른 스레드의 정리로 파일이 지워진 경우
+        if not removed:
+            os.remove(source)
+            removed.append(source)
+        return pq.ParquetFile(source).read().to_pandas()
+
+    df = loader._read_object(False, "data.parquet", None, read)
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"value": [1, 2, 3]}))
+    assert s3.gets == 2
+
+
+def test_reader_without_cache_does_not_retry(tmp_path):
+    loader = S3Loader.__new__(S3Loader)
+    loader.disk_cache = None
+    loader._open_object = lambda is_lte, key, etag=None: str(tmp_path / "missing.parquet")
+
+    with pytest.raises(FileNotFoundError):
+        loader._read_object(False, "missing.parquet", None, lambda source: pq.ParquetFile(source))
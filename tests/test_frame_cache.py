@@ -0,0 +1,69 @@
+"""
+정규화 데이터 캐시 로더 테스트
+FrameCacheLoader가 중복 제거한 데이터와 초 단위 중복 제거 전 원본을 각각 캐시하는지 확인합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.data_processor import BLE_RAW_COLUMNS, process_raw_data
+from loaders.base import BaseLoader
+from loaders.frame_cache import FrameCacheLoader
+
+
+class CountingLoader(BaseLoader):
+    """원본 로드 횟수를 세는 로더 (초마다 샘플 5개)"""
+
+    def __init__(self):
+        self.loads = []
+
+    def load_ble_data(self, date, phone, sensor, deduplicate=True, **kwargs):
+        self.loads.append((deduplicate, tuple(sorted(kwargs))))
+        rows = 50
+        data = {"time": 1_700_000_000_000 + np.arange(rows, dtype=np.int64) * 200, "sensor_id": sensor}
+        for column in BLE_RAW_COLUMNS[2:]:
+            data[column] = np.arange(rows, dtype=np.float64)
+        return process_raw_data(pd.DataFrame(data)[BLE_RAW_COLUMNS], deduplicate=deduplicate)
+
+    def load_lte_data(self, date, phone, sensor, deduplicate=True, **kwargs):
+        raise NotImplementedError
+
+    def show_date(self, is_lte=False):
+        return ["20231115"]
+
+    def show_phonenum(self, date, is_lte=False):
+        return ["01000000000"]
+
+    def show_sensor(self, date, phone, is_lte=False):
+        return ["S0001"]
+
+
+@pytest.fixture
+def loaders(tmp_path):
+    inner = CountingLoader()
+    return inner, FrameCacheLoader(inner, cache_dir=str(tmp_path))
+
+
+def test_raw_variant_is_cached(loaders):
+    inner, loader = loaders
+    first = loader.load_ble_data("20231115", "01000000000", "S0001", deduplicate=False)
+    second = loader.load_ble_data("20231115", "01000000000", "S0001", deduplicate=False)
+    assert inner.loads == [(False, ())]
+    assert len(first) == len(second) == 50
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_raw_and_deduplicated_variants_are_separate(loaders):
+    inner, loader = loaders
+    raw = loader.load_ble_data("20231115", "01000000000", "S0001", deduplicate=False)
+    deduplicated = loader.load_ble_data("20231115", "01000000000", "S0001")
+    loader.load_ble_data("20231115", "01000000000", "S0001")
+    assert inner.loads == [(False, ()), (True, ())]
+    assert len(raw) == 50 and len(deduplicated) == 10
+
+
+def test_other_options_bypass_cache(loaders):
+    inner, loader = loaders
+    for _ in range(2):
+        loader.load_ble_data("20231115", "01000000000", "S0001", deduplicate=False, time_range=(0, 1))
+    assert inner.loads == [(False, ("time_range",))] * 2
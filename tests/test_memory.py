@@ -0,0 +1,51 @@
+"""
+메모리 예산 관리 테스트
+MemoryGovernor가 예산 안에서는 메모리 해제(gc.collect, malloc_trim)와 출력 없이 요청을 끝내고,
+예산을 넘었을 때만 캐시를 비우고 메모리를 해제하는지 확인합니다.
+"""
+import pytest
+
+import core.memory as memory
+from core.dataset_cache import DatasetCache
+from core.memory import MemoryGovernor
+
+
+@pytest.fixture
+def releases(monkeypatch):
+    calls = []
+    monkeypatch.setattr(memory, "release_memory", lambda: calls.append(True))
+    return calls
+
+
+def make_governor(monkeypatch, rss: int) -> MemoryGovernor:
+    monkeypatch.setattr(memory, "current_rss", lambda: rss)
+    governor = MemoryGovernor(budget_bytes=1000)
+    cache = governor.register(DatasetCache(max_bytes=10 ** 6))
+    cache.put("a", b"x" * 100)
+    return governor
+
+
+def test_tracked_request_under_budget_is_silent(monkeypatch, releases, capsys):
+    governor = make_governor(monkeypatch, rss=500)
+    tracked = governor.track("request")(lambda: "done")
+
+    assert tracked() == "done"
+    assert releases == []
+    assert capsys.readouterr().out == ""
+    assert governor.last_request.name == "request"
+
+
+def test_over_budget_evicts_and_releases(monkeypatch, releases):
+    governor = make_governor(monkeypatch, rss=1050)
+
+    assert governor.enforce() > 0
+    assert governor.bytes_held() == 0
+    assert releases == [True]
+
+
+def test_over_budget_without_cache_still_releases(monkeypatch, releases):
+    monkeypatch.setattr(memory, "current_rss", lambda: 2000)
+    governor = MemoryGovernor(budget_bytes=1000)
+
+    assert governor.enforce() == 0
+    assert releases == [True]
@@ -0,0 +1,85 @@
+"""
+그래프 초당 집계 경로 테스트
+집계 파일 경로(tools.build_summaries -> 집계 파일 읽기 -> summary_stats)와 집계 파일이 없을 때의 원본 경로
+(process_raw_data(deduplicate=False) -> raw_summary -> summary_stats)가 같은 결과를 내는지 확인합니다.
+"""
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from core.callbacks import raw_summary, summary_stats
+from core.data_processor import BLE_RAW_COLUMNS, LTE_RAW_COLUMNS, local_tz, normalize_timestamp, process_raw_data
+from tools.build_summaries import build_summary
+
+
+def make_raw_table(rng: np.random.Generator, seconds: int, is_lte: bool) -> pa.Table:
+    """
+    초마다 여러 샘플이 있고 시간 순서가 섞인 원본 테이블을 생성합니다.
+
+    Args:
+        rng (np.random.Generator): 난수 생성기
+        seconds (int): 초 수
+        is_lte (bool): True면 LTE_RAW_COLUMNS, False면 BLE_RAW_COLUMNS 스키마
+
+    Returns:
+        pa.Table: 원본 테이블
+    """
+    columns = LTE_RAW_COLUMNS if is_lte else BLE_RAW_COLUMNS
+    per_second = rng.integers(1, 8, size=seconds)
+    start = 1_700_000_000_000 + np.repeat(np.arange(seconds, dtype=np.int64) * 1000, per_second)
+    times = rng.permutation(start + rng.integers(0, 1000, size=start.size))
+    rows = times.size
+    data = {"time": times, "sensor_id": np.full(rows, "S0001")}
+    for column in columns[2:]:
+        values = rng.normal(size=rows)
+        values[rng.random(rows) < 0.05] = np.nan
+        data[column] = values
+    return pa.table({column: data[column] for column in columns})
+
+
+def stats_from_sidecar(table: pa.Table, is_lte: bool):
+    """집계 파일을 만들어 대시보드와 같은 방식으로 읽은 뒤 초당 집계 결과를 반환합니다."""
+    buffer = io.BytesIO()
+    pq.write_table(build_summary(table, is_lte), buffer)
+    summary = pq.read_table(io.BytesIO(buffer.getvalue())).to_pandas()
+    summary.insert(0, "DATE", normalize_timestamp(summary.pop("time"), local_tz))
+    return summary_stats(summary)
+
+
+def stats_from_raw(table: pa.Table, is_lte: bool):
+    """집계 파일이 없을 때의 원본 경로로 초당 집계 결과를 반환합니다."""
+    raw = process_raw_data(table.to_pandas(), deduplicate=False)
+    return summary_stats(raw_summary(raw, is_lte))
+
+
+def assert_same_stats(actual, expected):
+    """두 초당 집계 결과가 같은지 확인합니다."""
+    assert actual.dates.equals(expected.dates)
+    np.testing.assert_array_equal(actual.count, expected.count)
+    for name in ("mean", "min", "max"):
+        assert getattr(actual, name).keys() == getattr(expected, name).keys()
+        for channel, values in getattr(actual, name).items():
+            np.testing.assert_allclose(values, getattr(expected, name)[channel], equal_nan=True)
+    np.testing.assert_array_equal(actual.hist_values, expected.hist_values)
+    np.testing.assert_array_equal(actual.hist_counts, expected.hist_counts)
+
+
+@pytest.mark.parametrize("is_lte", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_raw_path_matches_sidecar(seed, is_lte):
+    table = make_raw_table(np.random.default_rng(seed), seconds=300, is_lte=is_lte)
+    raw_stats = stats_from_raw(table, is_lte)
+    assert_same_stats(raw_stats, stats_from_sidecar(table, is_lte))
+
+    # 원본 경로도 초 단위 중복 제거 전 샘플을 모두 집계한다
+    assert raw_stats.count.sum() == table.num_rows
+    assert raw_stats.count.max() > 1
+
+
+def test_raw_path_keeps_lte_channels():
+    table = make_raw_table(np.random.default_rng(0), seconds=60, is_lte=True)
+    stats = stats_from_raw(table, is_lte=True)
+    assert {"TIME", "DISTANCE"} <= stats.max.keys()
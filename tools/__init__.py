@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Tools package - 데이터 이관/정리용 배치 명령"""
@@ -0,0 +1,106 @@
+"""
+초당 집계 파일 생성 배치
+원본 `{date}/{sensor}_{phone}_{date}.parquet` 옆에 초당 한 행의 집계 파일
+`{date}/{sensor}_{phone}_{date}.summary.parquet`을 만듭니다.
+
+집계 파일에는 초 시작 시각(time, 밀리초), 샘플 수(count), 그래프 채널(LTE는 TIME, DISTANCE 포함)별
+평균/최소/최대와 각 초의 첫 GPS 위치(LAT_first, LON_first)가 들어갑니다.
+S3Loader는 집계 파일이 있으면 그래프 개요를 원본 대신 집계 파일로 그립니다 (하루 최대 86,400행).
+
+집계 파일이 없거나 원본보다 오래된 경우에만 만들므로, 원본을 다시 올리거나 압축 정리한 뒤 다시 실행하면 됩니다.
+
+실행:
+    python -m tools.build_summaries --dates 20231115 20231116           # config의 S3 버킷
+    python -m tools.build_summaries --out ./export --kind ble --dates 20231115  # 로컬 디렉토리
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow as pa
+
+from core.aggregation import LTE_SUMMARY_CHANNELS, PLOT_CHANNELS, epoch_seconds, second_summary
+from core.data_processor import process_raw_data, local_tz
+from loaders.s3_catalog import parse_object_key, summary_key
+from tools.parquet_layout import COMPACT_ROW_GROUP_ROWS
+from tools.storage import make_store
+
+def build_summary(table: pa.Table, is_lte: bool) -> pa.Table:
+    """
+    원본 테이블로 초당 집계 테이블을 만듭니다.
+
+    Args:
+        table (pa.Table): 원본 Parquet 테이블 (BLE_RAW_COLUMNS / LTE_RAW_COLUMNS)
+        is_lte (bool): True면 LTE, False면 BLE
+
+    Returns:
+        pa.Table: 초당 집계 테이블 (time, count, <채널>_mean/_min/_max, LAT_first, LON_first)
+    """
+    # 로더와 같은 정규화(밀리초 기준 안정 정렬, 초 단위 절삭)를 거치되, 초 단위 중복 제거 전 원본 샘플을 모두 집계한다
+    # (대시보드가 집계 파일이 없을 때 원본으로 만드는 초당 집계와 같은 결과)
+    df = process_raw_data(table.to_pandas(), local_tz, deduplicate=False)
+
+    summary = second_summary(df, LTE_SUMMARY_CHANNELS if is_lte else PLOT_CHANNELS)
+    summary.insert(0, "time", epoch_seconds(summary.pop("DATE")) * 1000)
+    return pa.Table.from_pandas(summary, preserve_index=False)
+
+
+def build_object(store, key: str, is_lte: bool, row_group_rows: int = COMPACT_ROW_GROUP_ROWS,
+                 force: bool = False) -> bool:
+    """
+    원본 Parquet 객체 하나의 집계 파일을 만듭니다.
+
+    Args:
+        store: 저장소 (LocalStore 또는 S3Store)
+        key (str): 원본 객체 키
+        is_lte (bool): True면 LTE, False면 BLE
+        row_group_rows (int): row group당 행 수
+        force (bool): True면 최신 집계 파일이 있어도 다시 만든다
+
+    Returns:
+        bool: 만들었으면 True, 건너뛰었으면 False
+    """
+    target = summary_key(key)
+    if not force:
+        built = store.modified(target)
+        if built is not None and built >= store.modified(key):
+            return False
+    store.write(target, build_summary(store.read_table(key), is_lte), row_group_rows)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 Parquet 옆에 초당 집계 파일 만들기")
+    parser.add_argument("--kind", choices=["ble", "lte", "all"], default="all", help="대상 데이터 (기본값: all)")
+    parser.add_argument("--dates", nargs="+", required=True, help="집계할 날짜 prefix")
+    parser.add_argument("--out", help="로컬 루트 디렉토리 (지정하지 않으면 config의 S3 버킷)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 집계할 파일 수 (기본값: 4)")
+    parser.add_argument("--row-group-rows", type=int, default=COMPACT_ROW_GROUP_ROWS, help="row group당 행 수")
+    parser.add_argument("--force", action="store_true", help="최신 집계 파일도 다시 만들기")
+    args = parser.parse_args()
+
+    kinds = {"ble": [False], "lte": [True], "all": [False, True]}[args.kind]
+    started = time.perf_counter()
+    for is_lte in kinds:
+        store = make_store(args.out, is_lte)
+        for date in args.dates:
+            keys = [key for key in store.list(date) if parse_object_key(key) is not None]
+
+            def run(key):
+                try:
+                    return build_object(store, key, is_lte, args.row_group_rows, args.force)
+                except Exception as e:
+                    print(f"[실패] {key}: {type(e).__name__}: {str(e)}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                results = list(pool.map(run, keys))
+
+            print(f"[완료] {'lte' if is_lte else 'ble'} {date}: 원본 {len(keys)}개 중 "
+                  f"{results.count(True)}개 집계, {results.count(False)}개 건너뜀, {results.count(None)}개 실패")
+
+    print(f"[종료] {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Parquet 압축 정리 배치
+날짜 prefix 아래의 센서별 Parquet 파일을 time 정렬, row group 조정, min/max 통계, sensor_id 사전 인코딩,
+컬럼별 압축을 적용한 구조(tools.parquet_layout)로 같은 키에 다시 씁니다.
+
+키 구조(`{date}/{sensor}_{phone}_{date}.parquet`)와 컬럼은 그대로이므로 S3Loader는 수정 없이 읽고,
+정렬을 건너뛰고 시간 구간 밖의 row group을 읽지 않습니다. 이미 정리된 파일은 건너뜁니다.
+
+실행:
+    python -m tools.compact_parquet --dates 20231115 20231116           # config의 S3 버킷
+    python -m tools.compact_parquet --out ./export --kind ble --dates 20231115  # 로컬 디렉토리
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loaders.s3_catalog import parse_object_key
+from tools.parquet_layout import COMPACT_ROW_GROUP_ROWS, is_compacted
+from tools.storage import make_store
+
+
+def compact_object(store, key: str, row_group_rows: int = COMPACT_ROW_GROUP_ROWS, force: bool = False) -> bool:
+    """
+    Parquet 객체 하나를 정리된 구조로 다시 씁니다.
+
+    Args:
+        store: 저장소 (LocalStore 또는 S3Store)
+        key (str): 객체 키
+        row_group_rows (int): row group당 행 수
+        force (bool): True면 이미 정리된 파일도 다시 쓴다
+
+    Returns:
+        bool: 다시 썼으면 True, 건너뛰었으면 False
+    """
+    if not force and is_compacted(store.metadata(key)):
+        return False
+    store.write(key, store.read_table(key), row_group_rows)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 Parquet 파일을 time 정렬/row group 조정 구조로 다시 쓰기")
+    parser.add_argument("--kind", choices=["ble", "lte", "all"], default="all", help="대상 데이터 (기본값: all)")
+    parser.add_argument("--dates", nargs="+", required=True, help="정리할 날짜 prefix")
+    parser.add_argument("--out", help="로컬 루트 디렉토리 (지정하지 않으면 config의 S3 버킷)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 정리할 파일 수 (기본값: 4)")
+    parser.add_argument("--row-group-rows", type=int, default=COMPACT_ROW_GROUP_ROWS, help="row group당 행 수")
+    parser.add_argument("--force", action="store_true", help="이미 정리된 파일도 다시 쓰기")
+    args = parser.parse_args()
+
+    kinds = {"ble": [False], "lte": [True], "all": [False, True]}[args.kind]
+    started = time.perf_counter()
+    for is_lte in kinds:
+        store = make_store(args.out, is_lte)
+        for date in args.dates:
+            keys = [key for key in store.list(date) if parse_object_key(key) is not None]
+
+            def run(key):
+                try:
+                    return compact_object(store, key, args.row_group_rows, args.force)
+                except Exception as e:
+                    print(f"[실패] {key}: {type(e).__name__}: {str(e)}")
+                    return None
+
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                results = list(pool.map(run, keys))
+
+            print(f"[완료] {'lte' if is_lte else 'ble'} {date}: 파일 {len(keys)}개 중 "
+                  f"{results.count(True)}개 정리, {results.count(False)}개 건너뜀, {results.count(None)}개 실패")
+
+    print(f"[종료] {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+DocumentDB -> Parquet 이관 배치
+DocumentDB 날짜 collection을 S3Loader가 읽는 `{date}/{sensor}_{phone}_{date}.parquet` 구조의 Parquet 파일로 내보냅니다.
+
+- 원본 조회는 DocDBLoader와 같은 경로(컬럼 디코딩, time 구간 병렬 커서, 서버 time 정렬)를 사용하고,
+  S3Loader가 읽는 원본 스키마(BLE_RAW_COLUMNS / LTE_RAW_COLUMNS) 그대로 압축 구조(tools.parquet_layout)로 저장합니다.
+  정규화(process_raw_data)는 S3Loader가 읽을 때 하므로 두 대시보드가 같은 결과를 보여줍니다.
+- 여러 collection을 동시에 내보내고, 이미 있는 파일은 건너뛰므로 중단 후 다시 실행하면 이어서 진행합니다.
+
+실행:
+    python -m tools.export_docdb --out ./export              # 로컬 디렉토리로
+    python -m tools.export_docdb --kind ble --dates 20231115  # S3 버킷으로 (config의 ble_backup/lte_backup)
+"""
+import argparse
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+import pyarrow as pa
+
+from core.data_processor import BLE_RAW_COLUMNS, LTE_RAW_COLUMNS
+from loaders.docdb_parallel import find_time_sliced
+from tools.parquet_layout import COMPACT_ROW_GROUP_ROWS
+from tools.storage import make_store
+
+
+def object_key(date: str, phone: str, sensor: str) -> str:
+    """S3Loader가 읽는 객체 키를 반환합니다."""
+    return f"{date}/{sensor}_{phone}_{date}.parquet"
+
+
+def export_collection(loader, is_lte: bool, date: str, store, row_group_rows: int = COMPACT_ROW_GROUP_ROWS,
+                      overwrite: bool = False, executor: Optional[Executor] = None) -> dict:
+    """
+    날짜 collection 하나를 전화번호/센서별 Parquet 파일로 내보냅니다.
+
+    Args:
+        loader (DocDBLoader): DocumentDB 로더
+        is_lte (bool): True면 LTE, False면 BLE
+        date (str): 날짜 (collection 이름)
+        store: 출력 저장소 (LocalStore 또는 S3Store)
+        row_group_rows (int): row group당 행 수
+        overwrite (bool): True면 이미 있는 파일도 다시 쓴다
+        executor (Executor, optional): time 구간 조회에 사용할 스레드 풀 (기본값: 조회마다 새 풀)
+
+    Returns:
+        dict: written, skipped, rows
+    """
+    db = loader.monDB_lte if is_lte else loader.monDB_ble
+    fields = loader.LTE_FIELDS if is_lte else loader.BLE_FIELDS
+    columns = LTE_RAW_COLUMNS if is_lte else BLE_RAW_COLUMNS
+    collection = db[date]
+
+    result = {"written": 0, "skipped": 0, "rows": 0}
+    for phone in sorted(collection.distinct("phone_num")):
+        for sensor in sorted(collection.distinct("sensor_id", {"phone_num": phone})):
+            key = object_key(date, phone, sensor)
+            if not overwrite and store.exists(key):
+                result["skipped"] += 1
+                continue
+
+            df = find_time_sliced(collection, {"phone_num": phone, "sensor_id": sensor}, fields,
+                                  parallelism=loader.parallelism, executor=executor)
+            table = pa.Table.from_pandas(df[columns], preserve_index=False)
+            store.write(key, table, row_group_rows)
+            result["written"] += 1
+            result["rows"] += table.num_rows
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DocumentDB 날짜 collection을 S3Loader용 Parquet로 내보내기")
+    parser.add_argument("--kind", choices=["ble", "lte", "all"], default="all", help="대상 데이터 (기본값: all)")
+    parser.add_argument("--dates", nargs="*", help="내보낼 날짜 collection (기본값: 전체)")
+    parser.add_argument("--out", help="로컬 출력 디렉토리 (지정하지 않으면 config의 S3 버킷으로 업로드)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 내보낼 collection 수 (기본값: 4)")
+    parser.add_argument("--row-group-rows", type=int, default=COMPACT_ROW_GROUP_ROWS, help="row group당 행 수")
+    parser.add_argument("--overwrite", action="store_true", help="이미 있는 파일도 다시 쓰기")
+    args = parser.parse_args()
+
+    from loaders.docdb_loader import DocDBLoader
+
+    loader = DocDBLoader(index_check="off")
+    kinds = {"ble": [False], "lte": [True], "all": [False, True]}[args.kind]
+    # time 구간 조회용 스레드 풀 (모든 collection이 공유, 로더의 parallelism 크기)
+    slice_executor = ThreadPoolExecutor(max_workers=loader.parallelism) if loader.parallelism > 1 else None
+
+    try:
+        jobs = []
+        for is_lte in kinds:
+            dates: Optional[List[str]] = args.dates or loader.show_date(is_lte)
+            store = make_store(args.out, is_lte)
+            jobs += [(is_lte, date, store) for date in sorted(dates)]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            futures = {
+                pool.submit(export_collection, loader, is_lte, date, store, args.row_group_rows, args.overwrite,
+                            slice_executor):
+                    ("lte" if is_lte else "ble", date)
+                for is_lte, date, store in jobs
+            }
+            failed = 0
+            for future in as_completed(futures):
+                kind, date = futures[future]
+                try:
+                    result = future.result()
+                    print(f"[완료] {kind} {date}: 파일 {result['written']}개 작성, "
+                          f"{result['skipped']}개 건너뜀, {result['rows']:,}행")
+                except Exception as e:
+                    failed += 1
+                    print(f"[실패] {kind} {date}: {type(e).__name__}: {str(e)}")
+
+        print(f"[종료] collection {len(jobs)}개 중 실패 {failed}개, {time.perf_counter() - started:.1f}s "
+              f"(실패한 collection은 다시 실행하면 이어서 진행)")
+    finally:
+        if slice_executor is not None:
+            slice_executor.shutdown(wait=False)
+        loader.close()
+
+
+if __name__ == '__main__':
+    main()
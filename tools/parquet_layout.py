@@ -0,0 +1,77 @@
+"""
+Parquet 저장 구조 모듈
+센서 원본 데이터를 time 순으로 정렬하고 row group 크기, 통계, 인코딩, 컬럼별 압축을 맞춰 씁니다.
+
+이 구조로 쓴 파일은 S3Loader가 정렬 없이 읽고(process_raw_data 빠른 경로),
+time min/max 통계로 시간 구간 밖의 row group을 건너뛸 수 있습니다.
+"""
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# 저장 구조 버전 (Parquet key-value 메타데이터에 기록)
+LAYOUT_KEY = b"sensor_dash.layout"
+LAYOUT_VERSION = b"compact-v1"
+
+# row group당 행 수 (50Hz 기준 약 5분, 시간 구간 조회 때 건너뛸 수 있는 단위)
+COMPACT_ROW_GROUP_ROWS = 16_384
+
+# 컬럼별 압축: time은 delta 인코딩 후 zstd, 센서 값은 zstd, 위경도 등 나머지도 zstd (기본값)
+DEFAULT_COMPRESSION = "zstd"
+COLUMN_COMPRESSION = {
+    "sensor_id": "snappy",   # 사전 인코딩으로 이미 거의 0바이트
+}
+COLUMN_ENCODING = {
+    "time": "DELTA_BINARY_PACKED",  # 일정 간격으로 증가하는 정수
+}
+DICTIONARY_COLUMNS = ["sensor_id"]
+
+
+def is_compacted(metadata: pq.FileMetaData) -> bool:
+    """Parquet 메타데이터가 이 구조로 쓴 파일인지 확인합니다."""
+    key_value = metadata.metadata or {}
+    return key_value.get(LAYOUT_KEY) == LAYOUT_VERSION
+
+
+def compact_table(table: pa.Table, time_column: str = "time") -> pa.Table:
+    """
+    time 순으로 정렬하고 저장 구조 버전을 스키마 메타데이터에 기록한 테이블을 반환합니다.
+
+    Args:
+        table (pa.Table): 원본 테이블
+        time_column (str): 시간 컬럼 이름
+
+    Returns:
+        pa.Table: 정렬된 테이블
+    """
+    table = table.sort_by([(time_column, "ascending")])
+    metadata = dict(table.schema.metadata or {})
+    metadata[LAYOUT_KEY] = LAYOUT_VERSION
+    return table.replace_schema_metadata(metadata)
+
+
+def write_compacted(table: pa.Table, where, row_group_rows: int = COMPACT_ROW_GROUP_ROWS,
+                    time_column: str = "time"):
+    """
+    테이블을 time 정렬, row group 크기 조정, min/max 통계, sensor_id 사전 인코딩,
+    컬럼별 압축을 적용해 Parquet로 씁니다. 컬럼 이름/타입은 바꾸지 않으므로 기존 로더가 그대로 읽습니다.
+
+    Args:
+        table (pa.Table): 원본 테이블
+        where: 출력 경로 또는 파일 객체
+        row_group_rows (int): row group당 행 수
+        time_column (str): 시간 컬럼 이름
+    """
+    table = compact_table(table, time_column)
+    names = table.column_names
+    compression = {name: COLUMN_COMPRESSION.get(name, DEFAULT_COMPRESSION) for name in names}
+    encoding = {name: enc for name, enc in COLUMN_ENCODING.items() if name in names}
+    pq.write_table(
+        table,
+        where,
+        row_group_size=row_group_rows,
+        compression=compression,
+        use_dictionary=[name for name in DICTIONARY_COLUMNS if name in names],
+        column_encoding=encoding,
+        write_statistics=True,
+    )
@@ -0,0 +1,127 @@
+"""
+배치 명령용 저장소 모듈
+로컬 디렉토리와 S3 버킷을 같은 방법(list / exists / modified / read / write)으로 다룹니다.
+파일은 임시 파일에 다 쓴 뒤에만 보이게 하므로 중단되어도 반쯤 쓰인 파일이 남지 않습니다.
+"""
+import io
+import os
+import tempfile
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from tools.parquet_layout import write_compacted, COMPACT_ROW_GROUP_ROWS
+
+
+class LocalStore:
+    """로컬 디렉토리 저장소 (임시 파일에 쓴 뒤 os.replace로 바꿔치기)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def list(self, prefix: str) -> List[str]:
+        directory = os.path.join(self.root, prefix)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(f"{prefix.rstrip('/')}/{name}" for name in os.listdir(directory))
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.root, key))
+
+    def modified(self, key: str) -> Optional[float]:
+        """마지막 수정 시각(epoch 초), 없으면 None"""
+        try:
+            return os.path.getmtime(os.path.join(self.root, key))
+        except FileNotFoundError:
+            return None
+
+    def read_table(self, key: str) -> pa.Table:
+        return pq.read_table(os.path.join(self.root, key))
+
+    def metadata(self, key: str) -> pq.FileMetaData:
+        return pq.ParquetFile(os.path.join(self.root, key)).metadata
+
+    def write(self, key: str, table: pa.Table, row_group_rows: int = COMPACT_ROW_GROUP_ROWS):
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        os.close(fd)
+        try:
+            write_compacted(table, tmp_path, row_group_rows)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+
+class S3Store:
+    """S3 버킷 저장소 (로컬 임시 파일에 쓴 뒤 업로드, 업로드가 끝나야 객체가 보임)"""
+
+    def __init__(self, s3_client, bucket: str):
+        self.s3_client = s3_client
+        self.bucket = bucket
+
+    def list(self, prefix: str) -> List[str]:
+        keys = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix.rstrip('/') + '/'):
+            keys += [obj['Key'] for obj in page.get('Contents', [])]
+        return sorted(keys)
+
+    def exists(self, key: str) -> bool:
+        return self.modified(key) is not None
+
+    def modified(self, key: str) -> Optional[float]:
+        """마지막 수정 시각(epoch 초), 없으면 None"""
+        from botocore.exceptions import ClientError
+        try:
+            return self.s3_client.head_object(Bucket=self.bucket, Key=key)['LastModified'].timestamp()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def read_table(self, key: str) -> pa.Table:
+        body = self.s3_client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+        return pq.read_table(io.BytesIO(body))
+
+    def metadata(self, key: str) -> pq.FileMetaData:
+        from loaders.s3_parquet import S3RangeFile
+        # footer만 읽는다
+        return pq.ParquetFile(S3RangeFile(self.s3_client, self.bucket, key)).metadata
+
+    def write(self, key: str, table: pa.Table, row_group_rows: int = COMPACT_ROW_GROUP_ROWS):
+        fd, tmp_path = tempfile.mkstemp(suffix=".parquet")
+        os.close(fd)
+        try:
+            write_compacted(table, tmp_path, row_group_rows)
+            self.s3_client.upload_file(tmp_path, self.bucket, key)
+        finally:
+            os.remove(tmp_path)
+
+
+def make_store(out, is_lte: bool):
+    """
+    로컬 디렉토리(out) 또는 config의 S3 백업 버킷 저장소를 생성합니다.
+
+    Args:
+        out (str, optional): 로컬 루트 디렉토리 (None이면 S3 버킷, 로컬이면 <out>/ble, <out>/lte 사용)
+        is_lte (bool): True면 LTE, False면 BLE
+
+    Returns:
+        LocalStore 또는 S3Store
+    """
+    if out:
+        return LocalStore(os.path.join(out, "lte" if is_lte else "ble"))
+
+    import boto3
+    from config import ConfigDB
+    s3_config = ConfigDB.S3BUCKET["lte_backup" if is_lte else "ble_backup"]
+    s3_client = boto3.client(
+        's3',
+        aws_access_key_id=s3_config["id"],
+        aws_secret_access_key=s3_config["key"],
+        region_name=s3_config["region"]
+    )
+    return S3Store(s3_client, s3_config["name"])